@@ -6,3 +6,7 @@ class AdsConfig(AppConfig):
 
     default_auto_field = "django.db.models.BigAutoField"
     name = "ads"
+
+    def ready(self) -> None:
+        """Запуск приложения."""
+        import ads.signals  # noqa: F401, PLC0415
@@ -4,6 +4,7 @@ from django_elasticsearch_dsl import Document, fields
 from django_elasticsearch_dsl.registries import registry
 
 from ads.models import Ad
+from core.analyzers import search_text_field
 from core.choices import AdState
 
 User = get_user_model()
@@ -13,13 +14,17 @@ User = get_user_model()
 class AdDocument(Document):
     """Документ ElasticSearch для объявлений."""
 
+    title = search_text_field()
+    description = search_text_field()
     provider = fields.ObjectField(
         properties={
             "email": fields.TextField(),
             "id": fields.IntegerField(),
         }
     )
-    condition = fields.TextField()
+    condition = fields.KeywordField()
+    category = fields.IntegerField(attr="category_ids", multi=True)
+    rating = fields.FloatField(attr="rating")
 
     def prepare_condition(self, instance: "AdDocument") -> str:
         """Преобразовать состояние товара в строку.
@@ -47,10 +52,10 @@ class AdDocument(Document):
         model = Ad
         fields = [  # noqa: RUF012
             "id",
-            "title",
-            "description",
             "price",
             "address",
+            "status",
+            "created_at",
         ]
 
         related_models = [User]  # noqa: RUF012
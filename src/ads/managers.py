@@ -1,7 +1,9 @@
 from django.db import models
 
+from core.managers import AdvertisementManager
 
-class AdManager(models.Manager):
+
+class AdManager(AdvertisementManager):
     """Пользовательский менеджер для модели Объявлений."""
 
     def get_queryset(self) -> models.QuerySet:
@@ -0,0 +1,22 @@
+# Generated by Django 5.0.4 on 2026-10-18 14:09
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ads", "0020_adimage_title_photo"),
+        ("categories", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="ad",
+            index=models.Index(
+                fields=["status", "-created_at", "-id"], name="ad_status_created_at_idx"
+            ),
+        ),
+    ]
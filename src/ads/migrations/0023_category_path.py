@@ -0,0 +1,50 @@
+# Generated by Django 5.0.4 on 2026-10-18 14:30
+
+import core.enums
+from django.conf import settings
+from django.db import migrations, models
+
+
+def fill_category_paths(apps, schema_editor):
+    Ad = apps.get_model("ads", "Ad")
+    paths = {}
+    for obj_id, path in Ad.category.through.objects.values_list(
+        "ad_id", "category__path"
+    ):
+        if len(path) > len(paths.get(obj_id, "")):
+            paths[obj_id] = path
+    objects = list(Ad.objects.filter(pk__in=paths).only("pk"))
+    for obj in objects:
+        obj.category_path = paths[obj.pk]
+    Ad.objects.bulk_update(objects, ["category_path"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ads", "0022_rating_aggregates"),
+        ("categories", "0002_category_path"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="ad",
+            name="category_path",
+            field=models.CharField(
+                default="",
+                editable=False,
+                max_length=core.enums.Limits["MAX_LENGTH_CATEGORY_PATH"],
+                verbose_name="Путь категории",
+            ),
+        ),
+        migrations.RunPython(fill_category_paths, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="ad",
+            index=models.Index(
+                fields=["category_path"],
+                name="ad_category_path_idx",
+                opclasses=["varchar_pattern_ops"],
+            ),
+        ),
+    ]
@@ -43,6 +43,17 @@ class Ad(AbstractAdvertisement):
         verbose_name = "Объявление"
         verbose_name_plural = "Объявления"
         ordering = ["-created_at"]  # noqa: RUF012
+        indexes = [  # noqa: RUF012
+            models.Index(
+                fields=["status", "-created_at", "-id"],
+                name="ad_status_created_at_idx",
+            ),
+            models.Index(
+                fields=["category_path"],
+                name="ad_category_path_idx",
+                opclasses=["varchar_pattern_ops"],
+            ),
+        ]
         default_related_name = "ads"
 
 
@@ -0,0 +1,44 @@
+from django.db.models import Model
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from ads.models import Ad, AdImage
+from core.cache import ADS, invalidate
+
+
+@receiver(post_save, sender=Ad)
+@receiver(post_delete, sender=Ad)
+@receiver(post_save, sender=AdImage)
+@receiver(post_delete, sender=AdImage)
+@receiver(m2m_changed, sender=Ad.category.through)
+def invalidate_ads_cache(
+    sender: Model, instance: Model, **kwargs: dict  # noqa: ARG001
+) -> None:
+    """Сбросить закэшированные ответы, зависящие от объявлений."""
+    invalidate(ADS)
+
+
+@receiver(m2m_changed, sender=Ad.category.through)
+def update_ad_category_path(
+    sender: Model,  # noqa: ARG001
+    instance: Model,
+    action: str,
+    reverse: bool,  # noqa: FBT001
+    pk_set: set[int] | None,
+    **kwargs: dict,  # noqa: ARG001
+) -> None:
+    """Обновить путь категории после изменения категорий.
+
+    При очистке связей со стороны категории pk_set не передается, поэтому
+    ID затронутых объектов запоминаются до очистки.
+    """
+    if reverse and action == "pre_clear":
+        instance._cleared_ad_ids = list(instance.ads.values_list("pk", flat=True))
+        return
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if reverse and action == "post_clear":
+        pk_set = set(instance.__dict__.pop("_cleared_ad_ids", ()))
+    objects = Ad.objects.filter(pk__in=pk_set or ()) if reverse else [instance]
+    for obj in objects:
+        obj.update_category_path()
@@ -1,2 +1,3 @@
 from api.v1.filters.ads_filters import *  # noqa: F403
 from api.v1.filters.services_filters import *  # noqa: F403
+from api.v1.filters.search_filters import *  # noqa: F403
@@ -1,4 +1,4 @@
-from django.db.models import Avg, QuerySet
+from django.db.models import F, QuerySet
 from django_filters import (
     BooleanFilter,
     CharFilter,
@@ -95,8 +95,8 @@ class AdFilter(FilterSet):
             QuerySet: измененный запрос
 
         """
-        return (
-            Ad.cstm_mng.annotate(rating=Avg("comments__rating"))
-            .filter(rating__gte=value, status=AdvertisementStatus.PUBLISHED)
-            .order_by("-created_at")
-        )
+        return Ad.cstm_mng.filter(
+            rating_count__gt=0,
+            rating_sum__gte=F("rating_count") * value,
+            status=AdvertisementStatus.PUBLISHED,
+        ).order_by("-created_at")
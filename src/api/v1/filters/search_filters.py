@@ -0,0 +1,124 @@
+from elasticsearch_dsl import A, Q, Search
+from elasticsearch_dsl.response import AggResponse
+
+from core.choices import AdvertisementStatus
+
+PRICE_HISTOGRAM_INTERVAL = 1000
+"""Ширина интервала гистограммы цен."""
+MAX_CATEGORY_FACETS = 100
+"""Количество категорий в фасете категорий."""
+
+
+class SearchFilter:
+    """Фильтры и фасеты поиска по объявлениям и услугам.
+
+    Фильтры добавляются в контекст фильтрации (bool.filter): они не влияют
+    на релевантность и кэшируются ElasticSearch. В поиск всегда попадают
+    только опубликованные объявления и услуги.
+    """
+
+    def __init__(self, data: dict) -> None:
+        """Создать фильтр по проверенным параметрам запроса.
+
+        Args:
+            data (dict): данные SearchFilterSerializer
+
+        """
+        self.data = data
+
+    def get_filters(self) -> list[Q]:
+        """Получить условия фильтрации.
+
+        Returns:
+            list[Q]: условия фильтрации
+
+        """
+        data = self.data
+        filters = [Q("term", status=AdvertisementStatus.PUBLISHED)]
+        if "category_id" in data:
+            # В документе хранятся категория объекта и все ее предки.
+            filters.append(Q("term", category=data["category_id"]))
+        price = {}
+        if "price_min" in data:
+            price["gte"] = data["price_min"]
+        if "price_max" in data:
+            price["lte"] = data["price_max"]
+        if price:
+            filters.append(Q("range", price=price))
+        if "rating" in data:
+            filters.append(Q("range", rating={"gte": data["rating"]}))
+        for field in ("condition", "place_of_provision"):
+            if field in data:
+                filters.append(Q("term", **{field: data[field]}))
+        return filters
+
+    def filter_search(self, search: Search) -> Search:
+        """Добавить в поисковый запрос условия фильтрации.
+
+        Args:
+            search (Search): поисковый запрос
+
+        Returns:
+            Search: поисковый запрос с фильтрами
+
+        """
+        for condition in self.get_filters():
+            search = search.filter(condition)
+        return search
+
+    @staticmethod
+    def add_facets(search: Search) -> Search:
+        """Добавить в поисковый запрос агрегации для фасетов.
+
+        Args:
+            search (Search): поисковый запрос
+
+        Returns:
+            Search: поисковый запрос с агрегациями
+
+        """
+        search.aggs.bucket(
+            "category", A("terms", field="category", size=MAX_CATEGORY_FACETS)
+        )
+        search.aggs.bucket(
+            "price",
+            A(
+                "histogram",
+                field="price",
+                interval=PRICE_HISTOGRAM_INTERVAL,
+                min_doc_count=1,
+            ),
+        )
+        search.aggs.bucket("condition", A("terms", field="condition"))
+        search.aggs.bucket("place_of_provision", A("terms", field="place_of_provision"))
+        return search
+
+    @staticmethod
+    def get_facets(aggregations: AggResponse) -> dict[str, list[dict]]:
+        """Получить фасеты из результатов агрегаций.
+
+        Args:
+            aggregations (AggResponse): результаты агрегаций
+
+        Returns:
+            dict[str, list[dict]]: значения и количество документов по фасетам
+
+        """
+        return {
+            "category": [
+                {"id": bucket.key, "count": bucket.doc_count}
+                for bucket in aggregations.category.buckets
+            ],
+            "price": [
+                {"from": bucket.key, "count": bucket.doc_count}
+                for bucket in aggregations.price.buckets
+            ],
+            "condition": [
+                {"value": bucket.key, "count": bucket.doc_count}
+                for bucket in aggregations.condition.buckets
+            ],
+            "place_of_provision": [
+                {"value": bucket.key, "count": bucket.doc_count}
+                for bucket in aggregations.place_of_provision.buckets
+            ],
+        }
@@ -1,4 +1,4 @@
-from django.db.models import Avg, QuerySet
+from django.db.models import F, QuerySet
 from django_filters import (
     BooleanFilter,
     CharFilter,
@@ -122,8 +122,8 @@ class ServiceFilter(FilterSet):
             QuerySet: измененный запрос
 
         """
-        return (
-            Service.cstm_mng.annotate(rating=Avg("comments__rating"))
-            .filter(rating__gte=value, status=AdvertisementStatus.PUBLISHED)
-            .order_by("-created_at")
-        )
+        return Service.cstm_mng.filter(
+            rating_count__gt=0,
+            rating_sum__gte=F("rating_count") * value,
+            status=AdvertisementStatus.PUBLISHED,
+        ).order_by("-created_at")
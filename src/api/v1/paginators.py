@@ -1,12 +1,322 @@
+import json
+from base64 import b64decode, b64encode
+from collections import OrderedDict
+
+from django.db.models import Q, QuerySet
+from elasticsearch_dsl import Search
+from elasticsearch_dsl.response import Hit
+from rest_framework.exceptions import NotFound
 from rest_framework.pagination import PageNumberPagination
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+from rest_framework.views import APIView
 
 
 class CustomPaginator(PageNumberPagination):
     """Кастомный пагинатор.
 
     Размер страницы задается параметром запроса "limit".
+
+    Если представление задает атрибут "cursor_ordering", а в запросе передан
+    параметр "cursor" (для первой страницы - пустой), пагинация выполняется
+    по ключу (keyset): вместо номера страницы возвращаются непрозрачные курсоры
+    "next" и "previous", а общее количество записей не подсчитывается.
     """
 
     page_size_query_param = "limit"
     page_size = 50
     max_page_size = 50
+    cursor_query_param = "cursor"
+    invalid_cursor_message = "Invalid cursor"
+    ordering: tuple[str, ...] = ()
+    """Поля сортировки пагинации по курсору, пустой кортеж - пагинация
+    по номеру страницы."""
+
+    def paginate_queryset(
+        self, queryset: QuerySet, request: Request, view: APIView | None = None
+    ) -> list | None:
+        """Получить данные одной страницы.
+
+        Args:
+            queryset (QuerySet): запрос к БД
+            request (Request): http запрос
+            view (APIView | None): представление
+
+        Returns:
+            list | None: данные страницы
+
+        """
+        self.ordering = self.get_cursor_ordering(request, view)
+        if not self.ordering:
+            return super().paginate_queryset(queryset, request, view)
+        return self.paginate_queryset_by_cursor(queryset, request)
+
+    def get_paginated_response(self, data: list) -> Response:
+        """Получить http ответ с пагинацией.
+
+        Args:
+            data (list): данные страницы
+
+        Returns:
+            Response: http ответ
+
+        """
+        if not self.ordering:
+            return super().get_paginated_response(data)
+        return Response(
+            OrderedDict(
+                [
+                    ("next", self.get_cursor_link(self.next_position, False)),
+                    ("previous", self.get_cursor_link(self.previous_position, True)),
+                    ("results", data),
+                ]
+            )
+        )
+
+    def get_cursor_ordering(
+        self, request: Request, view: APIView | None
+    ) -> tuple[str, ...]:
+        """Получить поля сортировки для пагинации по курсору.
+
+        Args:
+            request (Request): http запрос
+            view (APIView | None): представление
+
+        Returns:
+            tuple[str, ...]: поля сортировки, если пагинация по курсору
+                поддерживается представлением и запрошена клиентом, иначе
+                пустой кортеж
+
+        """
+        if self.cursor_query_param not in request.query_params:
+            return ()
+        return tuple(getattr(view, "cursor_ordering", ()))
+
+    def get_cursor_condition(self, request: Request, view: APIView) -> Q:
+        """Получить условие фильтрации по курсору из запроса.
+
+        Используется представлениями, которые строят объединенные (UNION)
+        запросы: к ним условие нужно применить до объединения.
+
+        Args:
+            request (Request): http запрос
+            view (APIView): представление
+
+        Returns:
+            Q: условие фильтрации, пустое если курсор не передан
+
+        """
+        self.ordering = self.get_cursor_ordering(request, view)
+        if not self.ordering:
+            return Q()
+        position, reverse = self.decode_cursor(request)
+        if position is None:
+            return Q()
+        return self.build_condition(self.ordering, position, reverse)
+
+    def paginate_queryset_by_cursor(self, queryset: QuerySet, request: Request) -> list:
+        """Получить данные одной страницы по курсору.
+
+        Args:
+            queryset (QuerySet): запрос к БД
+            request (Request): http запрос
+
+        Returns:
+            list: данные страницы
+
+        """
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        position, reverse = self.decode_cursor(request)
+        ordering = self.ordering
+        if reverse:
+            ordering = tuple(self.invert(field) for field in ordering)
+        if position is not None and not queryset.query.combinator:
+            queryset = queryset.filter(
+                self.build_condition(self.ordering, position, reverse)
+            )
+        results = list(queryset.order_by(*ordering)[: self.page_size + 1])
+        has_more = len(results) > self.page_size
+        results = results[: self.page_size]
+        if reverse:
+            results.reverse()
+        has_next = has_more if not reverse else position is not None
+        has_previous = has_more if reverse else position is not None
+        self.next_position = (
+            self.get_position(results[-1]) if has_next and results else None
+        )
+        self.previous_position = (
+            self.get_position(results[0]) if has_previous and results else None
+        )
+        return results
+
+    def build_condition(
+        self, ordering: tuple[str, ...], position: list, reverse: bool  # noqa: FBT001
+    ) -> Q:
+        """Построить условие выборки записей после курсора.
+
+        Args:
+            ordering (tuple[str, ...]): поля сортировки
+            position (list): значения полей сортировки в позиции курсора
+            reverse (bool): выборка в обратном направлении
+
+        Returns:
+            Q: условие фильтрации
+
+        """
+        condition = Q()
+        equal = Q()
+        for field, value in zip(ordering, position, strict=True):
+            name = field.lstrip("-")
+            lookup = "lt" if field.startswith("-") != reverse else "gt"
+            condition |= equal & Q(**{f"{name}__{lookup}": value})
+            equal &= Q(**{name: value})
+        return condition
+
+    def get_position(self, item: object) -> list:
+        """Получить значения полей сортировки записи.
+
+        Args:
+            item (object): экземпляр модели или словарь
+
+        Returns:
+            list: значения полей сортировки
+
+        """
+        names = [field.lstrip("-") for field in self.ordering]
+        if isinstance(item, dict):
+            return [item[name] for name in names]
+        return [getattr(item, name) for name in names]
+
+    def decode_cursor(self, request: Request) -> tuple[list | None, bool]:
+        """Расшифровать курсор из запроса.
+
+        Args:
+            request (Request): http запрос
+
+        Returns:
+            tuple[list | None, bool]: позиция курсора и направление выборки
+
+        Raises:
+            NotFound: курсор не валиден
+
+        """
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+        try:
+            data = json.loads(b64decode(encoded.encode("ascii"), altchars=b"-_"))
+            position, reverse = data["p"], bool(data["r"])
+        except (TypeError, ValueError, KeyError):
+            raise NotFound(self.invalid_cursor_message) from None
+        if not isinstance(position, list) or len(position) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        return position, reverse
+
+    def encode_cursor(self, position: list, reverse: bool) -> str:  # noqa: FBT001
+        """Зашифровать курсор.
+
+        Args:
+            position (list): значения полей сортировки
+            reverse (bool): выборка в обратном направлении
+
+        Returns:
+            str: курсор
+
+        """
+        data = json.dumps({"p": position, "r": int(reverse)}, default=str)
+        return b64encode(data.encode(), altchars=b"-_").decode("ascii")
+
+    def get_cursor_link(
+        self, position: list | None, reverse: bool  # noqa: FBT001
+    ) -> str | None:
+        """Получить ссылку на соседнюю страницу.
+
+        Args:
+            position (list | None): позиция курсора
+            reverse (bool): ссылка на предыдущую страницу
+
+        Returns:
+            str | None: ссылка, если страница существует
+
+        """
+        if position is None:
+            return None
+        url = remove_query_param(
+            self.request.build_absolute_uri(), self.page_query_param
+        )
+        return replace_query_param(
+            url, self.cursor_query_param, self.encode_cursor(position, reverse)
+        )
+
+    @staticmethod
+    def invert(field: str) -> str:
+        """Изменить направление сортировки поля.
+
+        Args:
+            field (str): поле сортировки
+
+        Returns:
+            str: поле с обратным направлением сортировки
+
+        """
+        return field[1:] if field.startswith("-") else f"-{field}"
+
+
+class SearchPaginator(CustomPaginator):
+    """Пагинатор результатов поиска ElasticSearch.
+
+    Результаты сортируются по релевантности, а при равной релевантности -
+    по индексу и ID документа. Следующая страница запрашивается по курсору
+    "next" через search_after, поэтому глубина страниц не ограничена
+    параметром index.max_result_window. В ответе возвращается общее
+    количество найденных документов.
+    """
+
+    ordering = ("_score", "_index", "-id")
+
+    def paginate_search(self, search: Search, request: Request) -> list[Hit]:
+        """Выполнить поиск одной страницы.
+
+        Args:
+            search (Search): поисковый запрос
+            request (Request): http запрос
+
+        Returns:
+            list[Hit]: документы страницы
+
+        """
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        position, _ = self.decode_cursor(request)
+        search = search.sort(*self.ordering).extra(size=self.page_size + 1)
+        if position is not None:
+            search = search.extra(search_after=position)
+        self.response = response = search.execute()
+        self.count = response.hits.total.value
+        hits = list(response)
+        has_more = len(hits) > self.page_size
+        hits = hits[: self.page_size]
+        self.next_position = list(hits[-1].meta.sort) if has_more else None
+        return hits
+
+    def get_paginated_response(self, data: list) -> Response:
+        """Получить http ответ с пагинацией.
+
+        Args:
+            data (list): данные страницы
+
+        Returns:
+            Response: http ответ
+
+        """
+        return Response(
+            OrderedDict(
+                [
+                    ("count", self.count),
+                    ("next", self.get_cursor_link(self.next_position, False)),
+                    ("results", data),
+                ]
+            )
+        )
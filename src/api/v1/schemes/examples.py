@@ -555,6 +555,15 @@ CHAT_EXAMPLE: OpenApiExample = OpenApiExample(
         "subject": AD_RETRIEVE_EXAMPLE.value,
         "seller": USER_INFO_EXAMPLE.value,
         "buyer": USER_INFO_EXAMPLE.value,
+        "last_message": {
+            "id": 15,
+            "sender_username": "user",
+            "message": "Здравствуйте! Объявление еще актуально?",
+            "created_at": timezone.now(),
+            "updated_at": timezone.now(),
+        },
+        "unread_count": 2,
+        "presence": {"online": False, "last_seen": timezone.now()},
     },
 )
 
@@ -567,3 +576,8 @@ NOTIFICATION_IS_UNREAD_EXAMPLE: OpenApiExample = OpenApiExample(
     name="Уведомление помечено как ytпрочитанное",
     value={"subject": APIResponses.NOTIFICATION_IS_UNREAD},
 )
+
+UNREAD_NOTIFICATIONS_COUNT_EXAMPLE: OpenApiExample = OpenApiExample(
+    name="Количество непрочитанных уведомлений",
+    value={"count": 3},
+)
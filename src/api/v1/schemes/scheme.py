@@ -368,7 +368,13 @@ NOTIFICATION_MARKED_AS_UNREAD_200_OK: OpenApiResponse = OpenApiResponse(
     examples=[examples.NOTIFICATION_IS_UNREAD_EXAMPLE],
 )
 
+UNREAD_NOTIFICATIONS_COUNT_200_OK: OpenApiResponse = OpenApiResponse(
+    response=serializers.UnreadNotificationsCountSerializer,
+    description="Количество непрочитанных уведомлений",
+    examples=[examples.UNREAD_NOTIFICATIONS_COUNT_EXAMPLE],
+)
+
 SEARCH_OK_200: OpenApiResponse = OpenApiResponse(
     response=serializers.AdSearchSerializer,
-    description="Поиск объявлений",
+    description="Поиск объявлений и услуг",
 )
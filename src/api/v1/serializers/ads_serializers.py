@@ -1,5 +1,3 @@
-from django.contrib.contenttypes.models import ContentType
-from django.db.models import Avg
 from django.shortcuts import get_object_or_404
 from rest_framework import serializers
 
@@ -17,6 +15,7 @@ from api.v1.validators import (
 )
 from categories.models import Category
 from core.choices import CommentStatus
+from core.content_types import get_content_type
 from users.models import Favorites
 
 
@@ -123,6 +122,9 @@ class AdGetSerializer(serializers.ModelSerializer):
     def get_is_favorited(self, obj: Ad) -> bool:
         """Получить объявление в избранном
 
+        Если в контексте передано множество "favorites", полученное
+        Favorites.get_favorited_keys, запрос к БД не выполняется.
+
         Args:
             obj (Ad): объявление
 
@@ -134,9 +136,13 @@ class AdGetSerializer(serializers.ModelSerializer):
         if request and hasattr(request, "user"):
             user = request.user
             if user.is_authenticated:
+                favorites = self.context.get("favorites", None)
+                if favorites is not None:
+                    content_type = get_content_type(obj)
+                    return (content_type.id, obj.id) in favorites
                 return Favorites.objects.filter(
                     user=user,
-                    content_type=ContentType.objects.get(app_label="ads", model="ad"),
+                    content_type=get_content_type(obj),
                     object_id=obj.id,
                 ).exists()
         return False
@@ -151,7 +157,7 @@ class AdGetSerializer(serializers.ModelSerializer):
             int: количество комментариев к объявлению
 
         """
-        return obj.comments.filter(status=CommentStatus.PUBLISHED.value).count()  # type: ignore
+        return obj.published_comments_count
 
     def get_avg_rating(self, obj: Ad) -> float | None:
         """Получить средний рейтинг.
@@ -163,11 +169,7 @@ class AdGetSerializer(serializers.ModelSerializer):
             float: средний рейтинг объявления
 
         """
-        rating = obj.comments.aggregate(Avg("rating"))
-        rating = rating["rating__avg"]
-        if rating is None:
-            return None
-        return round(rating, 1)
+        return obj.rating
 
     def get_type(self, obj: Ad) -> str:
         """Получить тип объекта.
@@ -200,7 +202,10 @@ class AdListSerializer(AdGetSerializer):
             dict | None: титульная фотография
 
         """
-        title_photo = obj.images.filter(title_photo=True).first()
+        if hasattr(obj, "title_photos"):
+            title_photo = next(iter(obj.title_photos), None)
+        else:
+            title_photo = obj.images.filter(title_photo=True).first()
         if title_photo:
             return AdImageRetrieveSerializer(title_photo).data
         return None
@@ -272,16 +277,15 @@ class AdCreateUpdateSerializer(serializers.ModelSerializer):
     def __ad_category(self, ad: Ad, category: Category) -> None:
         """Добавить категории к объявлению.
 
-        Добавляет родительсткие категории к списку категорий объявления
+        Добавляет родительсткие категории к списку категорий объявления.
+        Идентификаторы предков берутся из пути категории без обращения к БД.
 
         Args:
             ad (Ad): объявление
             category (Category): категория, указанная при создании объявления
 
         """
-        ad.category.add(category)
-        if category.parent:
-            self.__ad_category(ad, category.parent)
+        ad.category.add(*category.ancestor_ids)
 
     def to_representation(self, instance):
         serializer = AdListSerializer(instance)
@@ -351,14 +355,25 @@ class AdSearchSerializer(serializers.ModelSerializer):
     def get_type(self, obj):
         return self.Meta.model.__name__.lower()
 
-    def get_is_favorited(self, obj):
+    def get_is_favorited(self, obj) -> bool:
+        """Получить объявление в избранном.
+
+        Документ поиска не является экземпляром модели, поэтому тип объекта
+        берется из модели сериализатора. Если в контексте передано множество
+        "favorites", полученное Favorites.get_favorited_ids, запрос к БД
+        не выполняется.
+        """
         request = self.context.get("request", None)
         if request and hasattr(request, "user"):
             user = request.user
             if user.is_authenticated:
+                content_type = get_content_type(self.Meta.model)
+                favorites = self.context.get("favorites", None)
+                if favorites is not None:
+                    return (content_type.id, obj.id) in favorites
                 return Favorites.objects.filter(
                     user=user,
-                    content_type=ContentType.objects.get(app_label="ads", model="ad"),
+                    content_type=content_type,
                     object_id=obj.id,
                 ).exists()
         return False
@@ -4,7 +4,12 @@ from categories.models import Category
 
 
 class CategorySerializer(serializers.ModelSerializer):
-    """Сериализатор для получения списка категорий."""
+    """Сериализатор для получения списка категорий.
+
+    Подкатегории берутся из контекста "subcategories" (подкатегории по ID
+    родительской категории). Если они не переданы, поддерево категории
+    загружается одним запросом.
+    """
 
     subcategories = serializers.SerializerMethodField()
 
@@ -24,12 +29,16 @@ class CategorySerializer(serializers.ModelSerializer):
             None | list[Category]: Список подкатегорий, если имеются
 
         """
-        if obj.subcategories.exists():
-            subcat = []
-            for subcategory in obj.subcategories.all():
-                subcat.append(CategorySerializer(subcategory).data)
-            return subcat
-        return None
+        children = self.context.get("subcategories")
+        if children is None:
+            children = Category.group_by_parent(obj.get_descendants())
+        if not children.get(obj.id):
+            return None
+        return CategorySerializer(
+            children[obj.id],
+            many=True,
+            context={**self.context, "subcategories": children},
+        ).data
 
 
 class CommonCategoryNoSubCatSerializer(serializers.ModelSerializer):
@@ -1,8 +1,24 @@
-from rest_framework.serializers import ModelSerializer
+from drf_spectacular.utils import extend_schema_field
+from rest_framework.serializers import (
+    BooleanField,
+    DateTimeField,
+    IntegerField,
+    ModelSerializer,
+    Serializer,
+    SerializerMethodField,
+)
 
 from api.v1.serializers.fields import FavoriteObjectRelatedField
 from api.v1.serializers.users_serializers import UserReadSerializer
 from chat.models import Chat
+from chat.serializers import MessageSerializer
+
+
+class PresenceSerializer(Serializer):
+    """Сериализатор для присутствия собеседника."""
+
+    online = BooleanField()
+    last_seen = DateTimeField(allow_null=True)
 
 
 class ChatSerializer(ModelSerializer):
@@ -11,6 +27,9 @@ class ChatSerializer(ModelSerializer):
     subject = FavoriteObjectRelatedField(read_only=True)
     buyer = UserReadSerializer(read_only=True)
     seller = UserReadSerializer(read_only=True)
+    last_message = MessageSerializer(read_only=True)
+    unread_count = IntegerField(read_only=True)
+    presence = SerializerMethodField()
 
     class Meta:
         """Настройки для сериализатора для сообщений."""
@@ -21,4 +40,18 @@ class ChatSerializer(ModelSerializer):
             "buyer",
             "seller",
             "subject",
+            "last_message",
+            "unread_count",
+            "presence",
         )
+
+    @extend_schema_field(PresenceSerializer)
+    def get_presence(self, obj) -> dict | None:
+        """Присутствие собеседника из контекста списка чатов."""
+        presence = self.context.get("presence", {})
+        request = self.context.get("request", None)
+        if request is None:
+            return None
+        if obj.buyer_id == request.user.id:
+            return presence.get(obj.seller_id)
+        return presence.get(obj.buyer_id)
@@ -1,9 +1,12 @@
+from decimal import Decimal
+
 from rest_framework import serializers
 
 from api.v1.serializers.fields import (
     FavoriteObjectRelatedField,
     SearchObjectRelatedField,
 )
+from core.choices import AdState, ServicePlace
 from users.models import Favorites
 
 
@@ -21,3 +24,20 @@ class SearchSerialiser(serializers.Serializer):
     """Сериализатор для поиска."""
 
     subject = SearchObjectRelatedField(read_only=True)
+
+
+class SearchFilterSerializer(serializers.Serializer):
+    """Сериализатор для параметров фильтрации поиска."""
+
+    category_id = serializers.IntegerField(required=False, min_value=1)
+    price_min = serializers.DecimalField(
+        required=False, max_digits=10, decimal_places=2, min_value=Decimal(0)
+    )
+    price_max = serializers.DecimalField(
+        required=False, max_digits=10, decimal_places=2, min_value=Decimal(0)
+    )
+    rating = serializers.FloatField(required=False, min_value=0)
+    condition = serializers.ChoiceField(required=False, choices=AdState.choices)
+    place_of_provision = serializers.ChoiceField(
+        required=False, choices=ServicePlace.choices
+    )
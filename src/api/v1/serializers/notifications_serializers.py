@@ -1,4 +1,4 @@
-from rest_framework.serializers import ModelSerializer
+from rest_framework.serializers import IntegerField, ModelSerializer, Serializer
 
 from notifications.models import Notification
 
@@ -9,9 +9,22 @@ class NotificationSerializer(ModelSerializer):
     class Meta:
         model = Notification
         fields = [
+            "id",
             "text",
             "link",
             "created_at",
             "updated_at",
             "read_at",
         ]
+
+
+class NotificationsMarkAsReadSerializer(Serializer):
+    """Сериализатор для пометки уведомлений прочитанными."""
+
+    up_to = IntegerField(required=False, min_value=1)
+
+
+class UnreadNotificationsCountSerializer(Serializer):
+    """Сериализатор для количества непрочитанных уведомлений."""
+
+    count = IntegerField(read_only=True)
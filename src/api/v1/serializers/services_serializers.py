@@ -1,8 +1,6 @@
 from typing import Any
 
-from django.contrib.contenttypes.models import ContentType
 from django.db import transaction
-from django.db.models import Avg
 from django.shortcuts import get_object_or_404
 from rest_framework import serializers
 
@@ -19,6 +17,7 @@ from api.v1.validators import (
 )
 from categories.models import Category
 from core.choices import CommentStatus
+from core.content_types import get_content_type
 from services.models import Service, ServiceImage, SubService
 from users.models import Favorites
 
@@ -112,25 +111,23 @@ class ServiceGetSerializer(serializers.ModelSerializer):
         )
 
     def get_comments_quantity(self, obj) -> int:
-        return obj.comments.filter(status=CommentStatus.PUBLISHED).count()
+        return obj.published_comments_count
 
-    def get_avg_rating(self, obj) -> int | None:
-        rating = obj.comments.aggregate(Avg("rating"))
-        rating = rating["rating__avg"]
-        if rating is None:
-            return None
-        return round(rating, 1)
+    def get_avg_rating(self, obj) -> float | None:
+        return obj.rating
 
     def get_is_favorited(self, obj) -> bool:
         request = self.context.get("request", None)
         if request and hasattr(request, "user"):
             user = request.user
             if user.is_authenticated:
+                favorites = self.context.get("favorites", None)
+                if favorites is not None:
+                    content_type = get_content_type(obj)
+                    return (content_type.id, obj.id) in favorites
                 return Favorites.objects.filter(
                     user=user,
-                    content_type=ContentType.objects.get(
-                        app_label="services", model="service"
-                    ),
+                    content_type=get_content_type(obj),
                     object_id=obj.id,
                 ).exists()
         return False
@@ -148,7 +145,10 @@ class ServiceListSerializer(ServiceGetSerializer):
         fields = ServiceGetSerializer.Meta.fields + ("title_photo",)  # type: ignore  # noqa
 
     def get_title_photo(self, obj) -> Any | None:
-        title_photo = obj.images.filter(title_photo=True).first()
+        if hasattr(obj, "title_photos"):
+            title_photo = next(iter(obj.title_photos), None)
+        else:
+            title_photo = obj.images.filter(title_photo=True).first()
         if title_photo:
             return ServiceImageRetrieveSerializer(title_photo).data
         return None
@@ -208,9 +208,7 @@ class ServiceCreateUpdateSerializer(serializers.ModelSerializer):
         return instance
 
     def __ad_category(self, service: Service, category: Category) -> None:
-        service.category.add(category)
-        if category.parent:
-            self.__ad_category(service, category.parent)
+        service.category.add(*category.ancestor_ids)
 
     def __add_price_list_entries(
         self, instance: Service, price_list_entries_data: list[dict]
@@ -301,15 +299,23 @@ class ServiceSearchSerializer(serializers.ModelSerializer):
         return self.Meta.model.__name__.lower()
 
     def get_is_favorited(self, obj) -> bool:
+        """Получить услугу в избранном.
+
+        Тип объекта берется из модели сериализатора: obj - документ поиска,
+        а не экземпляр Service. При наличии в контексте множества "favorites"
+        запрос к БД не выполняется.
+        """
         request = self.context.get("request", None)
         if request and hasattr(request, "user"):
             user = request.user
             if user.is_authenticated:
+                content_type = get_content_type(self.Meta.model)
+                favorites = self.context.get("favorites", None)
+                if favorites is not None:
+                    return (content_type.id, obj.id) in favorites
                 return Favorites.objects.filter(
                     user=user,
-                    content_type=ContentType.objects.get(
-                        app_label="services", model="service"
-                    ),
+                    content_type=content_type,
                     object_id=obj.id,
                 ).exists()
         return False
@@ -19,6 +19,7 @@ from api.v1.views.base_views import (
     BaseModeratorViewSet,
     BaseServiceAdViewSet,
 )
+from core.cache import ADS, CATEGORIES, USERS, cache_response
 from core.choices import AdvertisementStatus
 
 
@@ -75,6 +76,10 @@ from core.choices import AdvertisementStatus
 class AdViewSet(BaseServiceAdViewSet):
     """Вьюсет для объявлений."""
 
+    @cache_response(ADS, CATEGORIES, USERS)
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
+
     def get_serializer_class(self):
         if self.action == "retrieve":
             return api_serializers.AdRetrieveSerializer
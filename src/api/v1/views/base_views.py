@@ -1,9 +1,6 @@
-from django.contrib.contenttypes.models import ContentType
 from django.contrib.sites.shortcuts import get_current_site
 from django.db.transaction import atomic
 from django.urls import reverse
-from django.utils.decorators import method_decorator
-from django.views.decorators.cache import cache_page
 from django_filters.rest_framework import DjangoFilterBackend
 from drf_spectacular.utils import extend_schema
 from rest_framework import (
@@ -14,6 +11,7 @@ from rest_framework import (
     viewsets,
 )
 from rest_framework.decorators import action
+from rest_framework.request import Request
 
 from ads.models import Ad
 from api.v1 import schemes
@@ -23,7 +21,9 @@ from api.v1.permissions import ModeratorOnly, OwnerOrReadOnly, ReadOnly
 from bad_word_filter.tasks import moderate_comment_task
 from comments.models import Comment
 from config.settings.base import ALLOWED_IMAGE_FILE_EXTENTIONS
+from core.cache import CATEGORIES, cache_response
 from core.choices import AdvertisementStatus, APIResponses, Notifications
+from core.content_types import get_content_type
 from notifications.models import Notification
 from services.models import Service
 from users.models import Favorites
@@ -256,15 +256,10 @@ class BaseServiceAdViewSet(
                 data=APIResponses.OBJECT_IS_NOT_PUBLISHED,
             )
 
-        if isinstance(object, Service):
-            app_label = "services"
-            model = "service"
-        else:
-            app_label = "ads"
-            model = "ad"
+        content_type = get_content_type(object)
 
         if Favorites.objects.filter(
-            content_type=ContentType.objects.get(app_label=app_label, model=model),
+            content_type=content_type,
             object_id=object.id,
             user=request.user,
         ).exists():
@@ -278,7 +273,7 @@ class BaseServiceAdViewSet(
                 data=APIResponses.OBJECT_PROVIDER_CANT_ADD_TO_FAVORITE,
             )
         Favorites.objects.create(
-            content_type=ContentType.objects.get(app_label=app_label, model=model),
+            content_type=content_type,
             object_id=object.id,
             user=request.user,
         )
@@ -326,15 +321,10 @@ class BaseServiceAdViewSet(
                 data=APIResponses.OBJECT_IS_NOT_PUBLISHED,
             )
 
-        if isinstance(object, Service):
-            app_label = "services"
-            model = "service"
-        else:
-            app_label = "ads"
-            model = "ad"
+        content_type = get_content_type(object)
 
         if Comment.objects.filter(
-            content_type=ContentType.objects.get(app_label=app_label, model=model),
+            content_type=content_type,
             object_id=object.id,
             author=request.user,
         ).exists():
@@ -349,7 +339,7 @@ class BaseServiceAdViewSet(
             )
 
         comment: Comment = serializer.save(
-            content_type=ContentType.objects.get(app_label=app_label, model=model),
+            content_type=content_type,
             object_id=object.id,
             author=request.user,
         )
@@ -380,15 +370,10 @@ class BaseServiceAdViewSet(
         """Удалить из избранного."""
         object = self.get_object()
 
-        if isinstance(object, Service):
-            app_label = "services"
-            model = "service"
-        else:
-            app_label = "ads"
-            model = "ad"
+        content_type = get_content_type(object)
 
         if not Favorites.objects.filter(
-            content_type=ContentType.objects.get(app_label=app_label, model=model),
+            content_type=content_type,
             object_id=object.id,
             user=request.user,
         ).exists():
@@ -397,7 +382,7 @@ class BaseServiceAdViewSet(
                 data=APIResponses.OBJECT_NOT_IN_FAVORITES,
             )
         Favorites.objects.get(
-            content_type=ContentType.objects.get(app_label=app_label, model=model),
+            content_type=content_type,
             object_id=object.id,
             user=request.user,
         ).delete()
@@ -407,6 +392,50 @@ class BaseServiceAdViewSet(
         )
 
 
+class FavoritesContextMixin:
+    """Загрузка избранного для страницы списка одним запросом.
+
+    Ключи избранного для всех объектов страницы передаются в контекст
+    сериализатора, поэтому поле "is_favorited" не выполняет запросов к БД.
+    """
+
+    request: Request
+
+    def get_favorites(self, objects: list) -> set[tuple[int, int]]:
+        """Получить ключи избранного для объектов страницы.
+
+        По умолчанию объектами страницы считаются услуги и объявления.
+        Представления, выводящие связанные с ними объекты, переопределяют
+        метод.
+
+        Args:
+            objects (list): объекты страницы
+
+        Returns:
+            set[tuple[int, int]]: пары (ID типа объекта, ID объекта)
+
+        """
+        return Favorites.get_favorited_keys(self.request.user, objects)
+
+    def get_page_context(self, objects: list) -> dict:
+        """Получить данные контекста, общие для объектов страницы.
+
+        Args:
+            objects (list): объекты страницы
+
+        Returns:
+            dict: данные контекста сериализатора
+
+        """
+        return {"favorites": self.get_favorites(objects)}
+
+    def get_serializer(self, *args, **kwargs):
+        if kwargs.get("many", False):
+            kwargs.setdefault("context", self.get_serializer_context())
+            kwargs["context"].update(self.get_page_context(args[0]))
+        return super().get_serializer(*args, **kwargs)
+
+
 class CategoryTypeViewSet(
     mixins.ListModelMixin, mixins.RetrieveModelMixin, viewsets.GenericViewSet
 ):
@@ -414,11 +443,11 @@ class CategoryTypeViewSet(
 
     serializer_class = None
 
-    @method_decorator(cache_page(60 * 2))
+    @cache_response(CATEGORIES, vary_on_user=False)
     def list(self, request, *args, **kwargs):
         return super().list(request, *args, **kwargs)
 
-    @method_decorator(cache_page(60 * 2))
+    @cache_response(CATEGORIES, vary_on_user=False)
     def retrieve(self, request, *args, **kwargs):
         return super().retrieve(request, *args, **kwargs)
 
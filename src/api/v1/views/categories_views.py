@@ -1,5 +1,3 @@
-from django.utils.decorators import method_decorator
-from django.views.decorators.cache import cache_page
 from drf_spectacular.utils import (
     OpenApiParameter,
     extend_schema,
@@ -10,6 +8,7 @@ from rest_framework import mixins, status, viewsets
 from api.v1 import schemes
 from api.v1 import serializers as api_serializers
 from categories.models import Category
+from core.cache import CATEGORIES, cache_response
 
 
 @extend_schema(
@@ -28,11 +27,11 @@ class CommonCategoriesViewSet(
 ):
     """Вьюсет для категорий сервиса."""
 
-    @method_decorator(cache_page(60 * 2))
+    @cache_response(CATEGORIES, vary_on_user=False)
     def list(self, request, *args, **kwargs):
         return super().list(request, *args, **kwargs)
 
-    @method_decorator(cache_page(60 * 2))
+    @cache_response(CATEGORIES, vary_on_user=False)
     def retrieve(self, request, *args, **kwargs):
         return super().retrieve(request, *args, **kwargs)
 
@@ -47,6 +46,12 @@ class CommonCategoriesViewSet(
                 queryset = queryset.filter(parent=None)
         return queryset
 
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        if self.action == "list" and "title" not in self.request.query_params:
+            context["subcategories"] = Category.group_by_parent(Category.objects.all())
+        return context
+
     def get_serializer_class(self):
         params = self.request.query_params
         if self.action == "list" and "title" in params:
@@ -1,14 +1,20 @@
-from django.db.models import Q
+from django.contrib.contenttypes.prefetch import GenericPrefetch
+from django.db.models import Case, F, Q, When
 from drf_spectacular.utils import (
     extend_schema,
     extend_schema_view,
 )
 from rest_framework import mixins, permissions, status, viewsets
 
+from ads.models import Ad
 from api.v1 import schemes
 from api.v1 import serializers as api_serializers
 from api.v1.paginators import CustomPaginator
+from api.v1.views.base_views import FavoritesContextMixin
 from chat.models import Chat
+from chat.presence import get_presence
+from services.models import Service
+from users.models import Favorites
 
 
 @extend_schema(
@@ -17,16 +23,61 @@ from chat.models import Chat
     responses={status.HTTP_200_OK: schemes.CHATS_LIST_200_OK},
 )
 @extend_schema_view(list=extend_schema(summary="Список чатов."))
-class ChatViewSet(mixins.ListModelMixin, viewsets.GenericViewSet):
-    """Список чатов пользователя."""
+class ChatViewSet(
+    FavoritesContextMixin, mixins.ListModelMixin, viewsets.GenericViewSet
+):
+    """Список чатов пользователя.
+
+    Чаты упорядочены по времени последнего сообщения. Курсор страницы
+    указывает на позицию в этом порядке, поэтому чат, в который пришло
+    сообщение после загрузки первой страницы, переместится в начало списка
+    и не попадет на следующие страницы: его нужно получить, запросив первую
+    страницу заново. Повторно чаты на страницах не выводятся.
+    """
 
     pagination_class = CustomPaginator
+    cursor_ordering = ("-last_message_at", "-id")
     serializer_class = api_serializers.ChatSerializer
     permission_classes = [
         permissions.IsAuthenticated,
     ]
 
     def get_queryset(self):
-        return Chat.objects.filter(
-            Q(buyer=self.request.user) | Q(seller=self.request.user)
+        user = self.request.user
+        return (
+            Chat.objects.filter(Q(buyer=user) | Q(seller=user))
+            .select_related("buyer", "seller", "last_message__sender")
+            .prefetch_related(
+                GenericPrefetch(
+                    "subject",
+                    [
+                        Ad.cstm_mng.with_list_data(),
+                        Service.cstm_mng.with_list_data(),
+                    ],
+                )
+            )
+            .annotate(
+                unread_count=Case(
+                    When(buyer=user, then=F("buyer_unread")),
+                    default=F("seller_unread"),
+                )
+            )
+            .order_by(*self.cursor_ordering)
+        )
+
+    def get_favorites(self, objects):
+        return Favorites.get_favorited_keys(
+            self.request.user,
+            [chat.subject for chat in objects if chat.subject is not None],
+        )
+
+    def get_page_context(self, objects):
+        user = self.request.user
+        context = super().get_page_context(objects)
+        context["presence"] = get_presence(
+            [
+                chat.seller_id if chat.buyer_id == user.id else chat.buyer_id
+                for chat in objects
+            ]
         )
+        return context
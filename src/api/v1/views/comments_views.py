@@ -1,4 +1,3 @@
-from django.contrib.contenttypes.models import ContentType
 from django.shortcuts import get_object_or_404
 from drf_spectacular.utils import (
     OpenApiParameter,
@@ -15,6 +14,7 @@ from api.v1.permissions import CommentAuthorOnly, ModeratorOnly
 from comments.exceptions import WrongObjectTypeError
 from comments.models import Comment
 from core.choices import APIResponses, CommentStatus
+from core.content_types import get_content_type
 
 
 @extend_schema(
@@ -42,6 +42,7 @@ class CommentViewSet(mixins.ListModelMixin, viewsets.GenericViewSet):
     """Список комментариев."""
 
     pagination_class = CustomPaginator
+    cursor_ordering = ("-created_at", "-id")
     serializer_class = api_serializers.CommentReadSerializer
 
     def get_queryset(self):
@@ -50,9 +51,7 @@ class CommentViewSet(mixins.ListModelMixin, viewsets.GenericViewSet):
         if type not in ["ad", "service"]:
             raise WrongObjectTypeError()
         if obj_id and type:
-            cont_type_model = get_object_or_404(
-                ContentType, app_label=f"{type}s", model=f"{type}"
-            )
+            cont_type_model = get_content_type(type)
             obj = get_object_or_404(cont_type_model.model_class(), pk=obj_id)
             return Comment.cstm_mng.filter(
                 content_type=cont_type_model,
@@ -119,9 +118,7 @@ class CommentDestroyViewSet(
                 raise WrongObjectTypeError()
             return Comment.cstm_mng.filter(
                 author=self.request.user,
-                content_type=ContentType.objects.get(
-                    app_label=f"{type}s", model=f"{type}"
-                ),
+                content_type=get_content_type(type),
             ).order_by("-created_at")
         return Comment.objects.all()
 
@@ -1,5 +1,3 @@
-from itertools import chain
-
 from django.shortcuts import get_object_or_404
 from drf_spectacular.utils import (
     OpenApiParameter,
@@ -13,8 +11,11 @@ from api.v1 import schemes, serializers
 from api.v1.paginators import CustomPaginator
 from api.v1.validators import validate_id
 from categories.models import Category
+from core.cache import ADS, CATEGORIES, SERVICES, USERS, cache_response
 from core.choices import AdvertisementStatus
+from core.feed import get_feed_objects, get_feed_queryset
 from services.models import Service
+from users.models import Favorites
 
 
 @extend_schema(
@@ -45,52 +46,46 @@ from services.models import Service
         ),
         OpenApiParameter("page", int, description="Номер страницы"),
         OpenApiParameter("limit", int, description="Количество объявлений на странице"),
+        OpenApiParameter(
+            "cursor",
+            str,
+            description=(
+                "Курсор страницы. Пустое значение включает пагинацию по курсору"
+            ),
+        ),
     ],
 )
 class AdvertisementView(APIView):
     """Класс для получения объявлений всех типов."""
 
     pagination_class = CustomPaginator
+    cursor_ordering = ("-created_at", "-id", "type")
 
+    @cache_response(ADS, SERVICES, CATEGORIES, USERS)
     def get(self, request):
         """Получение списка объявлений."""
         params = request.query_params
+        filters = {"status": AdvertisementStatus.PUBLISHED}
         if "category_id" in params:
             category_id = params.get("category_id")
             validate_id(category_id)
             category = get_object_or_404(Category, pk=category_id)
-            ads_query = Ad.cstm_mng.filter(
-                status=AdvertisementStatus.PUBLISHED,
-                category=category,
-            )
-            service_query = Service.cstm_mng.filter(
-                status=AdvertisementStatus.PUBLISHED,
-                category=category,
-            )
-        else:
-            ads_query = Ad.cstm_mng.filter(
-                status=AdvertisementStatus.PUBLISHED,
-            )
-            service_query = Service.cstm_mng.filter(
-                status=AdvertisementStatus.PUBLISHED,
-            )
-        queryset = list(chain(service_query, ads_query))
-        paginated_queryset = self.paginate_queryset(queryset, request)
-        sorted_result = sorted(
-            paginated_queryset,
-            key=lambda item: item.created_at,
-            reverse=True,
+            filters["category_path__startswith"] = category.path
+        queryset = get_feed_queryset(
+            filters, self.paginator.get_cursor_condition(request, self)
         )
+        paginated_queryset = self.paginate_queryset(queryset, request)
         advertisements = list()
-        for entry in sorted_result:
+        entries = get_feed_objects(paginated_queryset)
+        context = {
+            "request": request,
+            "favorites": Favorites.get_favorited_keys(request.user, entries),
+        }
+        for entry in entries:
             if isinstance(entry, Ad):
-                serializer = serializers.AdListSerializer(
-                    entry, context={"request": request}
-                )
+                serializer = serializers.AdListSerializer(entry, context=context)
             if isinstance(entry, Service):
-                serializer = serializers.ServiceListSerializer(
-                    entry, context={"request": request}
-                )
+                serializer = serializers.ServiceListSerializer(entry, context=context)
             advertisements.append(serializer.data)
         return self.get_paginated_response(advertisements)
 
@@ -136,29 +131,32 @@ class AdvertisementView(APIView):
     parameters=[
         OpenApiParameter("page", int, description="Номер страницы"),
         OpenApiParameter("limit", int, description="Количество объявлений на странице"),
+        OpenApiParameter(
+            "cursor",
+            str,
+            description=(
+                "Курсор страницы. Пустое значение включает пагинацию по курсору"
+            ),
+        ),
     ],
 )
 class UserAdvertisementView(APIView):
     """Класс для получения объявлений пользователя."""
 
     pagination_class = CustomPaginator
+    cursor_ordering = ("-created_at", "-id", "type")
     permission_classes = [IsAuthenticated]
 
+    @cache_response(ADS, SERVICES, CATEGORIES, USERS)
     def get(self, request):
         """Получение списка объявлений пользователя."""
-        ads_query = Ad.objects.none()
-        service_query = Ad.objects.none()
         results: list = []
-        ads_query = Ad.cstm_mng.filter(provider=request.user)
-        service_query = Service.cstm_mng.filter(provider=request.user)
-        queryset = list(chain(service_query, ads_query))
-        result = self.paginate_queryset(queryset, request)
-        sorted_result = sorted(
-            result,
-            key=lambda item: item.created_at,
-            reverse=True,
+        queryset = get_feed_queryset(
+            {"provider": request.user},
+            self.paginator.get_cursor_condition(request, self),
         )
-        for entry in sorted_result:
+        result = self.paginate_queryset(queryset, request)
+        for entry in get_feed_objects(result):
             if isinstance(entry, Ad):
                 serializer = serializers.AdListSerializer(entry)
             if isinstance(entry, Service):
@@ -1,9 +1,13 @@
+from django.contrib.contenttypes.prefetch import GenericPrefetch
 from drf_spectacular.utils import extend_schema, extend_schema_view
 from rest_framework import mixins, permissions, status, viewsets
 
+from ads.models import Ad
 from api.v1 import schemes
 from api.v1 import serializers as api_serializers
 from api.v1.paginators import CustomPaginator
+from api.v1.views.base_views import FavoritesContextMixin
+from services.models import Service
 from users.models import Favorites
 
 
@@ -19,7 +23,9 @@ from users.models import Favorites
         },
     ),
 )
-class FavoritesViewSet(mixins.ListModelMixin, viewsets.GenericViewSet):
+class FavoritesViewSet(
+    FavoritesContextMixin, mixins.ListModelMixin, viewsets.GenericViewSet
+):
     """Избранное."""
 
     serializer_class = api_serializers.FavoritesSerialiser
@@ -31,5 +37,16 @@ class FavoritesViewSet(mixins.ListModelMixin, viewsets.GenericViewSet):
     def get_queryset(self):
         user = self.request.user
         if user.is_authenticated:
-            return Favorites.objects.filter(user=user)
+            return Favorites.objects.filter(user=user).prefetch_related(
+                GenericPrefetch(
+                    "subject",
+                    [
+                        Ad.cstm_mng.with_list_data(),
+                        Service.cstm_mng.with_list_data(),
+                    ],
+                )
+            )
         return Favorites.objects.none()
+
+    def get_favorites(self, objects):
+        return {(favorite.content_type_id, favorite.object_id) for favorite in objects}
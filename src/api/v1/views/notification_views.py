@@ -10,6 +10,7 @@ from api.v1 import serializers as api_serializers
 from api.v1.paginators import CustomPaginator
 from api.v1.permissions import NotificationRecieverOnly
 from core.choices import APIResponses
+from notifications.dispatcher import dispatch_unread_count
 from notifications.models import Notification
 
 
@@ -30,6 +31,7 @@ class NotificationViewSet(mixins.ListModelMixin, viewsets.GenericViewSet):
     serializer_class = api_serializers.NotificationSerializer
     permission_classes = [permissions.IsAuthenticated]
     pagination_class = CustomPaginator
+    cursor_ordering = ("-created_at", "-id")
 
     def get_queryset(self):
         return Notification.objects.filter(receiver=self.request.user)
@@ -55,6 +57,7 @@ class NotificationViewSet(mixins.ListModelMixin, viewsets.GenericViewSet):
         """Пометить прочитанным."""
         obj: Notification = self.get_object()
         obj.mark_as_read()
+        dispatch_unread_count([request.user.id])
         return response.Response(
             status=status.HTTP_200_OK,
             data=APIResponses.NOTIFICATION_IS_READ,
@@ -81,7 +84,55 @@ class NotificationViewSet(mixins.ListModelMixin, viewsets.GenericViewSet):
         """Пометить непрочитанным."""
         obj: Notification = self.get_object()
         obj.mark_as_unread()
+        dispatch_unread_count([request.user.id])
         return response.Response(
             status=status.HTTP_200_OK,
             data=APIResponses.NOTIFICATION_IS_UNREAD,
         )
+
+    @extend_schema(
+        summary="Количество непрочитанных уведомлений.",
+        responses={
+            status.HTTP_200_OK: schemes.UNREAD_NOTIFICATIONS_COUNT_200_OK,
+            status.HTTP_401_UNAUTHORIZED: schemes.UNAUTHORIZED_401,
+        },
+    )
+    @action(
+        detail=False,
+        methods=("get",),
+        url_path="unread-count",
+        url_name="unread_count",
+    )
+    def unread_count(self, request, *args, **kwargs):
+        """Количество непрочитанных уведомлений."""
+        count = self.get_queryset().filter(read_at__isnull=True).count()
+        return response.Response(status=status.HTTP_200_OK, data={"count": count})
+
+    @extend_schema(
+        summary="Пометить прочитанными все уведомления или до указанного.",
+        request=api_serializers.NotificationsMarkAsReadSerializer,
+        methods=["POST"],
+        responses={
+            status.HTTP_200_OK: schemes.UNREAD_NOTIFICATIONS_COUNT_200_OK,
+            status.HTTP_401_UNAUTHORIZED: schemes.UNAUTHORIZED_401,
+        },
+    )
+    @action(
+        detail=False,
+        methods=("post",),
+        url_path="mark-all-as-read",
+        url_name="mark_all_as_read",
+    )
+    def mark_all_as_read(self, request, *args, **kwargs):
+        """Пометить прочитанными все уведомления или до указанного."""
+        serializer = api_serializers.NotificationsMarkAsReadSerializer(
+            data=request.data
+        )
+        serializer.is_valid(raise_exception=True)
+        up_to = serializer.validated_data.get("up_to")
+        if Notification.mark_all_as_read(request.user.id, up_to):
+            dispatch_unread_count([request.user.id])
+        count = 0
+        if up_to is not None:
+            count = self.get_queryset().filter(read_at__isnull=True).count()
+        return response.Response(status=status.HTTP_200_OK, data={"count": count})
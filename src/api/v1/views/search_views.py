@@ -1,14 +1,20 @@
 import copy
 import logging
 
+from django.db.models import Model
 from django.http import HttpResponse
+from django_elasticsearch_dsl import Document
 from drf_spectacular.utils import OpenApiParameter, extend_schema
-from elasticsearch_dsl import Q
-from rest_framework import request, response, status, views
+from elasticsearch_dsl import Q, Search
+from rest_framework import exceptions, request, status, views
+from rest_framework.serializers import Serializer
 
 from ads.documents import AdDocument
 from api.v1 import schemes, serializers
+from api.v1.filters import SearchFilter
+from api.v1.paginators import SearchPaginator
 from services.documents import ServiceDocument
+from users.models import Favorites
 
 logger = logging.getLogger("django")
 
@@ -17,54 +23,149 @@ logger = logging.getLogger("django")
     summary="Поиск по услугам и объявлениям.",
     tags=["Search"],
     request=None,
-    parameters=[OpenApiParameter("search", str)],
+    description=(
+        """
+        Поиск выполняется одним запросом по индексам объявлений и услуг,
+        результаты сортируются по релевантности. Результаты формируются
+        из полей документов, избранное пользователя для страницы
+        загружается одним запросом к БД.
+
+        Возвращаются только опубликованные объявления и услуги. Фильтры
+        не влияют на релевантность. На первой странице (без параметра cursor)
+        в ответе возвращаются фасеты "facets": количество результатов
+        по категориям, интервалам цен, состоянию товара и месту оказания
+        услуги.
+
+        Query параметр limit - кол-во результатов на странице (по умолчанию 50).
+        Следующая страница запрашивается по ссылке "next" из ответа.
+        """
+    ),
+    parameters=[
+        OpenApiParameter("search", str),
+        OpenApiParameter(
+            "category_id", int, description="Категория, включая подкатегории"
+        ),
+        OpenApiParameter("price_min", float, description="Цена от"),
+        OpenApiParameter("price_max", float, description="Цена до"),
+        OpenApiParameter("rating", float, description="Рейтинг от"),
+        OpenApiParameter("condition", str, description="Состояние товара"),
+        OpenApiParameter(
+            "place_of_provision", str, description="Место оказания услуги"
+        ),
+        OpenApiParameter("limit", int, description="Количество результатов"),
+        OpenApiParameter("cursor", str, description="Курсор страницы"),
+    ],
     responses={status.HTTP_200_OK: schemes.SEARCH_OK_200},
 )
 class SearchView(views.APIView):
-    document_classes = [AdDocument, ServiceDocument]
+    document_classes: list[type[Document]] = [  # noqa: RUF012
+        AdDocument,
+        ServiceDocument,
+    ]
     serializer_class = serializers.SearchSerialiser
+    serializer_classes: dict[type[Document], type[Serializer]] = {  # noqa: RUF012
+        AdDocument: serializers.AdSearchSerializer,
+        ServiceDocument: serializers.ServiceSearchSerializer,
+    }
+    pagination_class = SearchPaginator
+    filter_class = SearchFilter
 
     def generate_q_expression(self, search_terms_list: list[str] | None):
+        """Получить поисковое выражение.
+
+        Совпадения по словам с учетом морфологии и опечаток дополняются
+        совпадениями по началам слов (подполя "autocomplete") и по подстрокам
+        (подполя "ngram"). Все варианты обслуживаются обратным индексом.
+
+        Args:
+            search_terms_list (list[str] | None): значения параметра "search"
+
+        Returns:
+            Q: поисковое выражение
+
+        """
         if search_terms_list is None:
             return Q("match_all")
         search_terms = search_terms_list[0].replace("\x00", "")
-        search_terms.replace(",", " ")
-        search_fields = ["title", "description"]
-        query = Q(
-            "multi_match",
-            query=search_terms,
-            fields=search_fields,
-            fuzziness="auto",
-        )
-        wildcard_query = Q(
+        search_terms = search_terms.replace(",", " ")
+        return Q(
             "bool",
             should=[
-                Q("wildcard", **{field: f"*{search_terms.lower()}*"})
-                for field in search_fields
+                Q(
+                    "multi_match",
+                    query=search_terms,
+                    fields=["title^3", "description"],
+                    fuzziness="auto",
+                ),
+                Q(
+                    "multi_match",
+                    query=search_terms,
+                    fields=["title.autocomplete^2", "description.autocomplete"],
+                    operator="and",
+                ),
+                Q(
+                    "multi_match",
+                    query=search_terms,
+                    fields=["title.ngram", "description.ngram"],
+                    operator="and",
+                ),
             ],
+            minimum_should_match=1,
+        )
+
+    def get_search(self, q: Q) -> Search:
+        """Получить поисковый запрос по всем индексам.
+
+        Статистика термов собирается по всем индексам (dfs_query_then_fetch),
+        поэтому релевантность объявлений и услуг сопоставима.
+
+        Args:
+            q (Q): поисковое выражение
+
+        Returns:
+            Search: поисковый запрос
+
+        """
+        return (
+            Search(index=[document.Index.name for document in self.document_classes])
+            .doc_type(*self.document_classes)
+            .params(search_type="dfs_query_then_fetch")
+            .query(q)
         )
-        query = query | wildcard_query
-        return query
 
     def get(self, request: request.Request):
         try:
             params = copy.deepcopy(request.query_params)
             search_terms = params.pop("search", None)
             q = self.generate_q_expression(search_terms_list=search_terms)
-            search_for_ads = AdDocument.search().query(q)
-            ads = search_for_ads.execute()
-            ads_results = serializers.AdSearchSerializer(
-                ads, many=True, context={"request": request}
-            )
-            search_for_services = ServiceDocument.search().query(q)
-            services = search_for_services.execute()
-            services_results = serializers.ServiceSearchSerializer(
-                services, many=True, context={"request": request}
-            )
-            return response.Response(
-                data=ads_results.data + services_results.data,
-                status=status.HTTP_200_OK,
-            )
+            filter_serializer = serializers.SearchFilterSerializer(data=params)
+            filter_serializer.is_valid(raise_exception=True)
+            search_filter = self.filter_class(filter_serializer.validated_data)
+            search = search_filter.filter_search(self.get_search(q))
+            with_facets = not params.get(self.pagination_class.cursor_query_param)
+            if with_facets:
+                search = search_filter.add_facets(search)
+            paginator = self.pagination_class()
+            hits = paginator.paginate_search(search, request)
+            ids: dict[type[Model], list[int]] = {}
+            for hit in hits:
+                ids.setdefault(type(hit).django.model, []).append(hit.id)
+            context = {
+                "request": request,
+                "favorites": Favorites.get_favorited_ids(request.user, ids),
+            }
+            results = [
+                self.serializer_classes[type(hit)](hit, context=context).data
+                for hit in hits
+            ]
+            response = paginator.get_paginated_response(results)
+            if with_facets:
+                response.data["facets"] = search_filter.get_facets(
+                    paginator.response.aggregations
+                )
+            return response
+        except exceptions.APIException:
+            raise
         except Exception as e:
             logger.error(e, exc_info=True)
             return HttpResponse(
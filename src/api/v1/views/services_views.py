@@ -16,6 +16,7 @@ from api.v1.views.base_views import (
     BaseModeratorViewSet,
     BaseServiceAdViewSet,
 )
+from core.cache import CATEGORIES, SERVICES, USERS, cache_response
 from core.choices import AdvertisementStatus
 from services.models import Service, ServiceImage
 
@@ -72,6 +73,10 @@ from services.models import Service, ServiceImage
 class ServiceViewSet(BaseServiceAdViewSet):
     """Операции с услугами."""
 
+    @cache_response(SERVICES, CATEGORIES, USERS)
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
+
     def get_queryset(self):
         queryset = Service.cstm_mng.all()
         return queryset
@@ -6,3 +6,7 @@ class CategoriesConfig(AppConfig):
 
     default_auto_field = "django.db.models.BigAutoField"
     name = "categories"
+
+    def ready(self) -> None:
+        """Запуск приложения."""
+        import categories.signals  # noqa: F401, PLC0415
@@ -0,0 +1,51 @@
+# Generated by Django 5.0.4 on 2026-10-18 14:27
+
+import core.enums
+from django.db import migrations, models
+
+
+def fill_paths(apps, schema_editor):
+    Category = apps.get_model("categories", "Category")
+    categories = {category.pk: category for category in Category.objects.all()}
+    paths = {}
+
+    def get_path(category):
+        if category.pk not in paths:
+            prefix = (
+                get_path(categories[category.parent_id]) if category.parent_id else ""
+            )
+            paths[category.pk] = f"{prefix}{category.pk}/"
+        return paths[category.pk]
+
+    for category in categories.values():
+        category.path = get_path(category)
+    Category.objects.bulk_update(categories.values(), ["path"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("categories", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="category",
+            name="path",
+            field=models.CharField(
+                default="",
+                editable=False,
+                max_length=core.enums.Limits["MAX_LENGTH_CATEGORY_PATH"],
+                verbose_name="Путь в дереве категорий",
+            ),
+        ),
+        migrations.RunPython(fill_paths, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="category",
+            index=models.Index(
+                fields=["path"],
+                name="category_path_idx",
+                opclasses=["varchar_pattern_ops"],
+            ),
+        ),
+    ]
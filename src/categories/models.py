@@ -1,9 +1,14 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models.functions import Concat, Substr
 
 from categories.managers import CategoryManager
+from core.content_types import get_advertisement_models
 from core.db_utils import validate_svg
+from core.search_index import update_search_index
 from core.enums import Limits
 
+PATH_SEPARATOR = "/"
+
 
 class Category(models.Model):
     """Категория объявлений сервиса."""
@@ -28,6 +33,12 @@ class Category(models.Model):
         blank=True,
         null=True,
     )
+    path = models.CharField(
+        "Путь в дереве категорий",
+        max_length=Limits.MAX_LENGTH_CATEGORY_PATH,
+        default="",
+        editable=False,
+    )
 
     objects = models.Manager()
     cstm_mng = CategoryManager()
@@ -38,6 +49,13 @@ class Category(models.Model):
         verbose_name = "Категория объявления"
         verbose_name_plural = "Категории объявлений"
         ordering = ["parent_id", "id"]  # noqa: RUF012
+        indexes = [  # noqa: RUF012
+            models.Index(
+                fields=["path"],
+                name="category_path_idx",
+                opclasses=["varchar_pattern_ops"],
+            ),
+        ]
 
     def __str__(self) -> str:
         """Получить строкового представления категории.
@@ -47,3 +65,110 @@ class Category(models.Model):
 
         """
         return self.title
+
+    def save(self, *args: list, **kwargs: dict) -> None:
+        """Сохранить категорию.
+
+        Путь категории состоит из идентификаторов ее предков и ее собственного
+        идентификатора, поэтому у новой категории он заполняется после вставки.
+        При смене родителя пути всего поддерева и пути категорий услуг
+        и объявлений обновляются одним запросом на таблицу, документы поиска
+        затронутых услуг и объявлений обновляются.
+
+        Args:
+            *args (list): позиционные аргументы
+            **kwargs (dict): именованные аргументы
+
+        """
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            path = self.build_path()
+            if path == self.path:
+                return
+            if self.path:
+                Category.objects.filter(path__startswith=self.path).update(
+                    path=self.replace_path_prefix("path", path)
+                )
+                for model in get_advertisement_models():
+                    objects = model.objects.filter(category_path__startswith=self.path)
+                    pks = list(objects.values_list("pk", flat=True))
+                    objects.update(
+                        category_path=self.replace_path_prefix("category_path", path)
+                    )
+                    update_search_index(model, pks)
+            else:
+                Category.objects.filter(pk=self.pk).update(path=path)
+            self.path = path
+
+    def replace_path_prefix(self, field: str, path: str) -> Concat:
+        """Получить выражение замены текущего пути категории в начале поля.
+
+        Args:
+            field (str): поле, начинающееся с текущего пути категории
+            path (str): новый путь категории
+
+        Returns:
+            Concat: выражение для UPDATE
+
+        """
+        return Concat(
+            models.Value(path),
+            Substr(field, len(self.path) + 1),
+            output_field=models.CharField(),
+        )
+
+    def build_path(self) -> str:
+        """Построить путь категории по пути родительской категории.
+
+        Returns:
+            str: путь категории
+
+        """
+        prefix = self.parent.path if self.parent_id else ""
+        return f"{prefix}{self.pk}{PATH_SEPARATOR}"
+
+    @property
+    def ancestor_ids(self) -> list[int]:
+        """Получить идентификаторы предков категории, включая ее саму.
+
+        Returns:
+            list[int]: идентификаторы от корневой категории к текущей
+
+        """
+        return [int(pk) for pk in self.path.split(PATH_SEPARATOR) if pk]
+
+    def get_ancestors(self) -> models.QuerySet:
+        """Получить цепочку предков категории, включая ее саму.
+
+        Returns:
+            QuerySet: категории от корневой к текущей
+
+        """
+        return Category.objects.filter(pk__in=self.ancestor_ids).order_by("path")
+
+    def get_descendants(self) -> models.QuerySet:
+        """Получить все категории поддерева, не включая текущую.
+
+        Returns:
+            QuerySet: категории поддерева
+
+        """
+        return Category.objects.filter(path__startswith=self.path).exclude(pk=self.pk)
+
+    @staticmethod
+    def group_by_parent(
+        categories: models.QuerySet | list["Category"],
+    ) -> dict[int | None, list["Category"]]:
+        """Сгруппировать категории по родительской категории.
+
+        Args:
+            categories (QuerySet | list[Category]): категории дерева или поддерева
+
+        Returns:
+            dict[int | None, list[Category]]: подкатегории по ID родителя
+
+        """
+        children: dict[int | None, list[Category]] = {}
+        for category in categories:
+            children.setdefault(category.parent_id, []).append(category)
+        return children
@@ -0,0 +1,34 @@
+from django.db.models import Model
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from categories.models import Category
+from core.cache import CATEGORIES, invalidate
+from core.content_types import get_advertisement_models
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_categories_cache(
+    sender: Model, instance: Category, **kwargs: dict  # noqa: ARG001
+) -> None:
+    """Сбросить закэшированные ответы, зависящие от категорий."""
+    invalidate(CATEGORIES)
+
+
+@receiver(pre_delete, sender=Category)
+def remove_category_from_advertisements(
+    sender: Model, instance: Category, **kwargs: dict  # noqa: ARG001
+) -> None:
+    """Исключить удаляемую категорию из услуг и объявлений.
+
+    Каскадное удаление связей не отправляет сигнал m2m_changed, поэтому
+    связи удаляются через менеджер заранее: обработчики m2m_changed
+    пересчитывают пути категорий затронутых услуг и объявлений.
+    """
+    for model in get_advertisement_models():
+        field = model._meta.get_field("category")
+        related = getattr(instance, field.remote_field.get_accessor_name())
+        pks = list(related.values_list("pk", flat=True))
+        if pks:
+            related.remove(*pks)
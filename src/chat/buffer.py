@@ -0,0 +1,130 @@
+import asyncio
+import logging
+from collections import deque
+
+from channels.db import database_sync_to_async
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Max
+from django.utils import timezone
+
+from chat.models import Chat, Message
+
+logger = logging.getLogger(__name__)
+
+
+def reserve_message_ids(count: int, last_id: int = 0) -> list[int]:
+    """Зарезервировать идентификаторы для новых сообщений.
+
+    В PostgreSQL идентификаторы берутся из последовательности первичного
+    ключа и не выдаются повторно другим процессам. В остальных СУБД
+    последовательностей нет, поэтому идентификаторы выдаются после
+    максимального из сохраненных и уже выданных, что безопасно только
+    для одного процесса (локальный запуск и тесты).
+
+    :param count: количество идентификаторов
+    :type count: int
+    :param last_id: последний выданный процессом идентификатор
+    :type last_id: int
+
+    :returns: идентификаторы по возрастанию
+    :rtype: list[int]
+    """
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT nextval(pg_get_serial_sequence(%s, 'id')) "
+                "FROM generate_series(1, %s)",
+                [Message._meta.db_table, count],
+            )
+            return sorted(row[0] for row in cursor.fetchall())
+    max_id = Message.objects.aggregate(max_id=Max("id"))["max_id"] or 0
+    start = max(max_id, last_id) + 1
+    return list(range(start, start + count))
+
+
+@transaction.atomic
+def save_messages(messages: list[Message]) -> None:
+    """Записать сообщения в БД и обновить счетчики их чатов.
+
+    :param messages: сообщения с идентификаторами
+    :type messages: list[Message]
+    """
+    Message.objects.bulk_create(messages)
+    Chat.add_messages(messages)
+
+
+class MessageBuffer:
+    """Буфер отложенной записи сообщений чата.
+
+    Сообщению сразу присваиваются идентификатор и время создания, после чего
+    оно может быть отправлено участникам чата. В БД сообщения записываются
+    одним bulk_create вместе с обновлением счетчиков чатов, когда в буфере
+    набирается CHAT_WRITE_BEHIND_BATCH_SIZE сообщений или проходит
+    CHAT_WRITE_BEHIND_INTERVAL_MS миллисекунд с момента добавления первого
+    из них, а также при отключении участника.
+
+    Гарантии:
+        - порядок сообщений чата определяется парой (created_at, id), как и
+          при синхронной записи: сообщения одного процесса получают
+          возрастающие идентификаторы и время в порядке добавления в буфер;
+        - запись выполняется не более одного раза: сообщения, отправленные
+          участникам, но не записанные из-за ошибки БД или остановки процесса,
+          теряются (не более одной пачки на процесс), ошибка записывается
+          в лог;
+        - до записи сообщения не возвращаются в истории чата.
+    """
+
+    def __init__(self) -> None:
+        """Создать пустой буфер."""
+        self.messages: list[Message] = []
+        self.ids: deque[int] = deque()
+        self.last_id = 0
+        self.timer: asyncio.Task | None = None
+
+    async def add(self, message: Message) -> Message:
+        """Добавить сообщение в буфер.
+
+        :param message: несохраненное сообщение
+        :type message: Message
+
+        :returns: сообщение с идентификатором и временем создания
+        :rtype: Message
+        """
+        batch_size = settings.CHAT_WRITE_BEHIND_BATCH_SIZE
+        if not self.ids:
+            ids = await database_sync_to_async(reserve_message_ids)(
+                batch_size, self.last_id
+            )
+            self.ids.extend(ids)
+            self.last_id = max(self.last_id, ids[-1])
+        message.id = self.ids.popleft()
+        message.created_at = message.updated_at = timezone.now()
+        self.messages.append(message)
+
+        if len(self.messages) >= batch_size:
+            await self.flush()
+        elif self.timer is None:
+            self.timer = asyncio.create_task(self.__flush_later())
+        return message
+
+    async def flush(self) -> None:
+        """Записать накопленные сообщения в БД."""
+        if self.timer is not None and self.timer is not asyncio.current_task():
+            self.timer.cancel()
+        self.timer = None
+        messages, self.messages = self.messages, []
+        if not messages:
+            return
+        try:
+            await database_sync_to_async(save_messages)(messages)
+        except Exception as e:
+            logger.exception(e)
+
+    async def __flush_later(self) -> None:
+        """Записать сообщения по истечении интервала записи."""
+        await asyncio.sleep(settings.CHAT_WRITE_BEHIND_INTERVAL_MS / 1000)
+        await self.flush()
+
+
+message_buffer = MessageBuffer()
@@ -5,15 +5,19 @@ from typing import Any
 from channels.db import database_sync_to_async
 from channels.exceptions import DenyConnection
 from channels.generic.websocket import AsyncWebsocketConsumer
+from django.conf import settings
 from django.contrib.auth.models import AbstractUser
-from django.contrib.contenttypes.models import ContentType
-from django.db.models import Model
+from django.db import transaction
+from django.db.models import Model, OuterRef, Q, Subquery
 from rest_framework.utils.serializer_helpers import ReturnList
 
+from chat import presence
+from chat.buffer import message_buffer
 from chat.models import Chat, Message
 from chat.serializers import MessageSerializer
 from core.choices import AdvertisementStatus
-from core.middleware import get_user_from_db
+from core.content_types import get_content_type
+from core.enums import Limits
 
 logger = logging.getLogger(__name__)
 
@@ -24,66 +28,82 @@ class ChatConsumer(AsyncWebsocketConsumer):
     room_group_name = None
     chat_data = None
     chat = None
+    counterpart_id = None
 
     async def connect(self) -> None:
         """Установка соединения.
 
-        Создание группы чата и отправка в нее сообщений чата.
+        Создание группы чата и отправка последних сообщений чата. Более ранние
+        сообщения запрашиваются событием {"type": "history", "before": <id>},
+        где id - идентификатор самого раннего из полученных сообщений.
+
+        Отправитель берется из scope, объект с продавцом и чат загружаются
+        одним запросом и хранятся в экземпляре на время соединения.
+
+        После подключения участник отмечается в сети, группе чата отправляется
+        событие {"type": "presence", ...}, а участнику - присутствие
+        собеседника.
         """
         try:
-            sender_id = self.scope["user"].id
-            object_id = self.scope["url_route"]["kwargs"]["object_id"]
+            sender = self.scope["user"]
+            object_id = int(self.scope["url_route"]["kwargs"]["object_id"])
             type = self.scope["url_route"]["kwargs"]["type"]
-            buyer_id = self.scope["url_route"]["kwargs"]["buyer_id"]
+            buyer_id = int(self.scope["url_route"]["kwargs"]["buyer_id"])
 
-            cont_type_model = await self.__get_content_type(type)
-            if cont_type_model is None:
-                raise DenyConnection("Content type not found!")
-
-            obj = await self.__get_object(cont_type_model, object_id)
+            obj, chat_id = await self.__get_chat_context(type, object_id, buyer_id)
             if obj is None:
                 raise DenyConnection("Object not found.")
 
             if obj.status != AdvertisementStatus.PUBLISHED:
                 raise DenyConnection("Object not published.")
 
-            buyer = await get_user_from_db(buyer_id)
             seller = obj.provider
-            sender = await get_user_from_db(sender_id)
-
             self.room_group_name = f"chat_{type}_{object_id}_{buyer_id}"
             self.chat_data = {
                 "room_group_name": self.room_group_name,
-                "content_type": cont_type_model,
+                "content_type": get_content_type(obj),
                 "object_id": object_id,
-                "buyer": buyer,
+                "buyer_id": buyer_id,
                 "seller": seller,
             }
+            if chat_id is not None:
+                self.chat = Chat(pk=chat_id, **self.chat_data)
 
-            if sender == seller:
-                chat = await self.__get_chat(self.chat_data)
-                if chat is None:
+            if sender.id == seller.id:
+                if self.chat is None:
                     raise DenyConnection("Do not write to yourself")
                 await self.channel_layer.group_add(
                     self.room_group_name, self.channel_name
                 )
                 await self.accept()
-                self.chat = chat
-                messages = await self.__get_messages({"chat": self.chat})
+                messages, _ = await self.__get_messages()
                 await self.send(json.dumps(messages, ensure_ascii=False))
+                self.counterpart_id = buyer_id
 
-            elif sender == buyer:
+            elif sender.id == buyer_id:
                 await self.channel_layer.group_add(
                     self.room_group_name, self.channel_name
                 )
                 await self.accept()
-                chat = await self.__get_chat(self.chat_data)
-                if chat is not None:
-                    self.chat = chat
-                    messages = await self.__get_messages({"chat": self.chat})
+                if self.chat is not None:
+                    messages, _ = await self.__get_messages()
                     await self.send(json.dumps(messages, ensure_ascii=False))
+                self.counterpart_id = seller.id
             else:
                 raise DenyConnection("Access Denied: Forbidden!")
+
+            await presence.connect(sender.id)
+            await self.__send_presence(sender.id, {"online": True, "last_seen": None})
+            counterpart = await presence.aget_presence([self.counterpart_id])
+            await self.send(
+                json.dumps(
+                    {
+                        "type": "presence",
+                        "user_id": self.counterpart_id,
+                        **counterpart[self.counterpart_id],
+                    }
+                )
+            )
         except DenyConnection:
             raise
         except Exception as e:
@@ -92,7 +112,9 @@ class ChatConsumer(AsyncWebsocketConsumer):
     async def disconnect(self, close_code: Any) -> None:
         """Отключить соединение.
 
-        Удаляет участника из группы чата.
+        Удаляет участника из группы чата и записывает в БД сообщения
+        из буфера отложенной записи. Если у участника не осталось других
+        соединений, группе чата отправляется время его последнего посещения.
 
         :param close_code: код закрытия
         :type close_code: Any
@@ -102,13 +124,25 @@ class ChatConsumer(AsyncWebsocketConsumer):
                 await self.channel_layer.group_discard(
                     self.room_group_name, self.channel_name
                 )
+            if settings.CHAT_WRITE_BEHIND:
+                await message_buffer.flush()
+            if self.counterpart_id is not None:
+                user_id = self.scope["user"].id
+                if await presence.disconnect(user_id):
+                    last_seen = await presence.aget_presence([user_id])
+                    await self.__send_presence(user_id, last_seen[user_id])
         except Exception as e:
             logger.exception(e)
 
     async def receive(self, text_data: str, bytes_data: bytes | None = None) -> None:
         """Получить сообщения.
 
-        Сохраняет сообщение в БД и отправляет его в группу чата.
+        Сохраняет сообщение в БД и отправляет его в группу чата. На запрос
+        истории отправляет страницу сообщений, предшествующих указанному,
+        событие {"type": "read"} отмечает чат прочитанным до последнего
+        сообщения. Событие {"type": "typing"} отправляется группе чата не чаще
+        раза в CHAT_TYPING_INTERVAL секунд, {"type": "heartbeat"} продлевает
+        нахождение участника в сети.
 
         :param text_data: Данные в текстовом формате
         :type text_data: str
@@ -117,6 +151,18 @@ class ChatConsumer(AsyncWebsocketConsumer):
         """
         try:
             data = json.loads(text_data)
+            if data.get("type") == "history":
+                await self.__send_history(data.get("before"))
+                return
+            if data.get("type") == "read":
+                await self.__mark_as_read()
+                return
+            if data.get("type") == "typing":
+                await self.__send_typing()
+                return
+            await presence.touch(self.scope["user"].id)
+            if data.get("type") == "heartbeat":
+                return
             message = data.get("message", None)
 
             if message and isinstance(message, str):
@@ -146,28 +192,140 @@ class ChatConsumer(AsyncWebsocketConsumer):
         except Exception as e:
             logger.exception(e)
 
+    async def chat_read(self, event: Any) -> None:
+        """Отправить участникам группы чата отметку о прочтении.
+
+        :param event: Событие
+        :type event: Any
+        """
+        try:
+            await self.send(json.dumps(event["read"]))
+        except Exception as e:
+            logger.exception(e)
+
+    async def chat_presence(self, event: Any) -> None:
+        """Отправить участникам группы чата присутствие участника.
+
+        :param event: Событие
+        :type event: Any
+        """
+        try:
+            if event["presence"]["user_id"] != self.scope["user"].id:
+                await self.send(json.dumps(event["presence"]))
+        except Exception as e:
+            logger.exception(e)
+
+    async def chat_typing(self, event: Any) -> None:
+        """Отправить собеседнику событие набора текста.
+
+        :param event: Событие
+        :type event: Any
+        """
+        try:
+            if event["typing"]["user_id"] != self.scope["user"].id:
+                await self.send(json.dumps(event["typing"]))
+        except Exception as e:
+            logger.exception(e)
+
+    async def __send_presence(self, user_id: int, data: dict) -> None:
+        """Отправить группе чата присутствие участника.
+
+        :param user_id: ID участника
+        :type user_id: int
+        :param data: признак нахождения в сети и время последнего посещения
+        :type data: dict
+        """
+        await self.channel_layer.group_send(
+            self.room_group_name,
+            {
+                "type": "chat_presence",
+                "presence": {"type": "presence", "user_id": user_id, **data},
+            },
+        )
+
+    async def __send_typing(self) -> None:
+        """Отправить группе чата событие набора текста.
+
+        Повторные события в течение CHAT_TYPING_INTERVAL секунд отбрасываются.
+        """
+        user_id = self.scope["user"].id
+        room_group_name = self.room_group_name
+        if room_group_name is None or not await presence.allow_typing(
+            room_group_name, user_id
+        ):
+            return
+        await self.channel_layer.group_send(
+            room_group_name,
+            {"type": "chat_typing", "typing": {"type": "typing", "user_id": user_id}},
+        )
+
+    async def __mark_as_read(self) -> None:
+        """Отметить чат прочитанным и сообщить об этом группе чата."""
+        if self.chat is None:
+            return
+        user_id = self.scope["user"].id
+        last_read = await database_sync_to_async(self.chat.mark_as_read)(user_id)
+        await self.channel_layer.group_send(
+            self.room_group_name,
+            {
+                "type": "chat_read",
+                "read": {"type": "read", "user_id": user_id, "message": last_read},
+            },
+        )
+
+    async def __send_history(self, before: Any) -> None:  # noqa: ANN401
+        """Отправить страницу сообщений, предшествующих указанному.
+
+        :param before: ID сообщения, до которого нужны сообщения
+        :type before: Any
+        """
+        messages, has_more = [], False
+        if self.chat is not None and type(before) is int:
+            messages, has_more = await self.__get_messages(before)
+        await self.send(
+            json.dumps(
+                {"type": "history", "messages": messages, "has_more": has_more},
+                ensure_ascii=False,
+            )
+        )
+
     @database_sync_to_async
-    def __get_messages(self, filters: dict) -> ReturnList:
-        """Получить список сообщений из БД.
+    def __get_messages(self, before: int | None = None) -> tuple[ReturnList, bool]:
+        """Получить страницу сообщений чата из БД.
 
-        :param filters: параметры фильтрации
-        :type filters: dict
+        Сообщения выбираются по индексу (chat_id, created_at, id) от новых
+        к старым и возвращаются в хронологическом порядке.
 
-        :returns: экземпляр сообщения, если найден, или None
-        :rtype: ReturnList
+        :param before: ID сообщения, более ранние сообщения чем которое нужны
+        :type before: int | None
+
+        :returns: сообщения и признак наличия более ранних сообщений
+        :rtype: tuple[ReturnList, bool]
         """
-        return MessageSerializer(
-            Message.objects.filter(**filters)
-            .select_related("sender")
+        page_size = Limits.CHAT_HISTORY_PAGE_SIZE
+        queryset = Message.objects.filter(chat=self.chat)
+        if before is not None:
+            created_at = Subquery(
+                Message.objects.filter(chat=self.chat, pk=before).values("created_at")
+            )
+            queryset = queryset.filter(
+                Q(created_at__lt=created_at) | Q(created_at=created_at, pk__lt=before)
+            )
+        messages = list(
+            queryset.select_related("sender")
             .only(
                 "id",
                 "sender__username",
                 "message",
                 "created_at",
                 "updated_at",
-            ),
-            many=True,
-        ).data
+            )
+            .order_by("-created_at", "-id")[: page_size + 1]
+        )
+        has_more = len(messages) > page_size
+        messages = messages[:page_size]
+        messages.reverse()
+        return MessageSerializer(messages, many=True).data, has_more
 
     @database_sync_to_async
     def __save_message(self, sender: AbstractUser, message: str) -> Message:
@@ -181,12 +339,18 @@ class ChatConsumer(AsyncWebsocketConsumer):
         :returns: экземпляр сообщения
         :rtype: Message
         """
-        return Message.objects.create(sender=sender, message=message, chat=self.chat)
+        with transaction.atomic():
+            instance = Message.objects.create(
+                sender=sender, message=message, chat=self.chat
+            )
+            Chat.add_messages([instance])
+        return instance
 
     async def __save_chat_message(self, sender: AbstractUser, message: str) -> Message:
         """Сохранить сообщение в БД.
 
-        Если чат не существует, создается новый.
+        Если чат не существует, создается новый. При включенной настройке
+        CHAT_WRITE_BEHIND сообщение добавляется в буфер отложенной записи.
 
         :param sender: отправитель сообщения
         :type sender: AbstractUser
@@ -199,47 +363,49 @@ class ChatConsumer(AsyncWebsocketConsumer):
         if not self.chat:
             self.chat = await self.__create_chat(self.chat_data)
 
+        if settings.CHAT_WRITE_BEHIND:
+            return await message_buffer.add(
+                Message(sender=sender, message=message, chat=self.chat)
+            )
         return await self.__save_message(sender=sender, message=message)
 
     @database_sync_to_async
-    def __get_content_type(self, obj_type: str) -> ContentType | None:
-        """Получить экземпляр ContentType.
+    def __get_chat_context(
+        self, obj_type: str, object_id: int, buyer_id: int
+    ) -> tuple[Model | None, int | None]:
+        """Получить объект чата с продавцом и ID чата одним запросом к БД.
 
         :param obj_type: cтроковое название класса
         :type obj_type: str
-
-        :returns: экземпляр ContentType если найден
-        :rtype: ContentType | None
-        """
-        try:
-            return ContentType.objects.get(
-                app_label=f"{obj_type}s", model=f"{obj_type}"
-            )
-        except ContentType.DoesNotExist:
-            return None
-
-    @database_sync_to_async
-    def __get_object(
-        self, cont_type_model: ContentType, object_id: int
-    ) -> Model | None:
-        """Получить объект из БД.
-
-        :param cont_type_model: Экземпляр класса ContentType
-        :type cont_type_model: ContentType
         :param object_id: ID объекта
         :type object_id: int
+        :param buyer_id: ID покупателя
+        :type buyer_id: int
 
-        :returns: класс ORM
-        :rtype: Model | None
+        :returns: объект и ID чата, если найдены
+        :rtype: tuple[Model | None, int | None]
         """
         try:
-            return (
-                cont_type_model.model_class()
-                .objects.select_related("provider")
-                .get(pk=object_id)
-            )
-        except cont_type_model.model_class().DoesNotExist:
-            return None
+            content_type = get_content_type(obj_type)
+        except LookupError as e:
+            raise DenyConnection("Content type not found!") from e
+        chat_id = Chat.objects.filter(
+            content_type=content_type,
+            object_id=OuterRef("pk"),
+            seller_id=OuterRef("provider_id"),
+            buyer_id=buyer_id,
+            buyer__is_active=True,
+        ).values("id")[:1]
+        obj = (
+            content_type.model_class()
+            .objects.select_related("provider")
+            .annotate(chat_pk=Subquery(chat_id))
+            .filter(pk=object_id)
+            .first()
+        )
+        if obj is None:
+            return None, None
+        return obj, obj.chat_pk
 
     @database_sync_to_async
     def __create_chat(self, data: dict) -> Chat:
@@ -252,18 +418,3 @@ class ChatConsumer(AsyncWebsocketConsumer):
         :rtype: Chat
         """
         return Chat.objects.create(**data)
-
-    @database_sync_to_async
-    def __get_chat(self, data: dict) -> Chat | None:
-        """Получить объект чата из БД.
-
-        :param data: данные чата
-        :type data: dict
-
-        :return: экземпляр объекта чата, есди найден
-        :rtype: Chat | None
-        """
-        try:
-            return Chat.objects.get(**data)
-        except Chat.DoesNotExist:
-            return None
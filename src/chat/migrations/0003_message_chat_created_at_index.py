@@ -0,0 +1,19 @@
+# Generated by Django 5.0.4 on 2026-10-18 14:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("chat", "0002_alter_message_options"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="message",
+            index=models.Index(
+                fields=["chat", "created_at", "id"], name="message_chat_created_at_idx"
+            ),
+        ),
+    ]
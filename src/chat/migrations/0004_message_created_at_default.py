@@ -0,0 +1,24 @@
+# Generated by Django 5.0.4 on 2026-10-18 14:58
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("chat", "0003_message_chat_created_at_index"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="message",
+            name="created_at",
+            field=models.DateTimeField(
+                db_index=True,
+                default=django.utils.timezone.now,
+                null=True,
+                verbose_name="Время создания",
+            ),
+        ),
+    ]
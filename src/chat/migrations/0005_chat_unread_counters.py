@@ -0,0 +1,73 @@
+# Generated by Django 5.0.4 on 2026-10-18 15:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def fill_last_messages(apps, schema_editor):
+    Chat = apps.get_model("chat", "Chat")
+    Message = apps.get_model("chat", "Message")
+    last_message = Subquery(
+        Message.objects.filter(chat=OuterRef("pk"))
+        .order_by("-created_at", "-id")
+        .values("id")[:1]
+    )
+    Chat.objects.update(last_message_id=last_message)
+    Chat.objects.update(
+        buyer_last_read=Coalesce("last_message_id", 0),
+        seller_last_read=Coalesce("last_message_id", 0),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("chat", "0004_message_created_at_default"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="chat",
+            name="buyer_last_read",
+            field=models.PositiveIntegerField(
+                default=0,
+                verbose_name="ID последнего прочитанного покупателем сообщения",
+            ),
+        ),
+        migrations.AddField(
+            model_name="chat",
+            name="buyer_unread",
+            field=models.PositiveIntegerField(
+                default=0, verbose_name="Количество непрочитанных покупателем сообщений"
+            ),
+        ),
+        migrations.AddField(
+            model_name="chat",
+            name="last_message",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="+",
+                to="chat.message",
+                verbose_name="Последнее сообщение",
+            ),
+        ),
+        migrations.AddField(
+            model_name="chat",
+            name="seller_last_read",
+            field=models.PositiveIntegerField(
+                default=0, verbose_name="ID последнего прочитанного продавцом сообщения"
+            ),
+        ),
+        migrations.AddField(
+            model_name="chat",
+            name="seller_unread",
+            field=models.PositiveIntegerField(
+                default=0, verbose_name="Количество непрочитанных продавцом сообщений"
+            ),
+        ),
+        migrations.RunPython(fill_last_messages, migrations.RunPython.noop),
+    ]
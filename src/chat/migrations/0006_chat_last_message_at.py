@@ -0,0 +1,60 @@
+# Generated by Django 5.0.4 on 2026-10-18 15:03
+
+from datetime import UTC, datetime
+
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def fill_last_message_at(apps, schema_editor):
+    Chat = apps.get_model("chat", "Chat")
+    Message = apps.get_model("chat", "Message")
+    Chat.objects.filter(last_message__created_at__isnull=False).update(
+        last_message_at=Subquery(
+            Message.objects.filter(pk=OuterRef("last_message_id")).values("created_at")[
+                :1
+            ]
+        )
+    )
+    # Время создания чатов не хранится: чаты без сообщений помещаются
+    # в конец списка, а не получают время применения миграции.
+    Chat.objects.filter(last_message__isnull=True).update(
+        last_message_at=datetime(1970, 1, 1, tzinfo=UTC)
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("chat", "0005_chat_unread_counters"),
+        ("contenttypes", "0002_remove_content_type_name"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="chat",
+            name="last_message_at",
+            field=models.DateTimeField(
+                default=django.utils.timezone.now,
+                verbose_name="Время последнего сообщения",
+            ),
+        ),
+        migrations.RunPython(fill_last_message_at, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="chat",
+            index=models.Index(
+                fields=["buyer", "-last_message_at", "-id"],
+                name="chat_buyer_last_message_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="chat",
+            index=models.Index(
+                fields=["seller", "-last_message_at", "-id"],
+                name="chat_seller_last_message_idx",
+            ),
+        ),
+    ]
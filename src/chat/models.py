@@ -1,7 +1,8 @@
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
-from django.db import models
+from django.db import models, transaction
+from django.utils import timezone
 
 from core.abstract_models import TimeCreateUpdateModel
 
@@ -37,6 +38,29 @@ class Chat(models.Model):
         related_name="chat_as_buyer",
         limit_choices_to={"is_active": True},
     )
+    last_message = models.ForeignKey(
+        "Message",
+        verbose_name="Последнее сообщение",
+        on_delete=models.SET_NULL,
+        related_name="+",
+        null=True,
+        blank=True,
+    )
+    last_message_at = models.DateTimeField(
+        "Время последнего сообщения", default=timezone.now
+    )
+    buyer_last_read = models.PositiveIntegerField(
+        "ID последнего прочитанного покупателем сообщения", default=0
+    )
+    seller_last_read = models.PositiveIntegerField(
+        "ID последнего прочитанного продавцом сообщения", default=0
+    )
+    buyer_unread = models.PositiveIntegerField(
+        "Количество непрочитанных покупателем сообщений", default=0
+    )
+    seller_unread = models.PositiveIntegerField(
+        "Количество непрочитанных продавцом сообщений", default=0
+    )
 
     class Meta:
         """Настройки модели чата."""
@@ -52,6 +76,16 @@ class Chat(models.Model):
         unique_together = [  # noqa: RUF012
             ["seller", "buyer", "content_type", "object_id"]
         ]
+        indexes = [  # noqa: RUF012
+            models.Index(
+                fields=["buyer", "-last_message_at", "-id"],
+                name="chat_buyer_last_message_idx",
+            ),
+            models.Index(
+                fields=["seller", "-last_message_at", "-id"],
+                name="chat_seller_last_message_idx",
+            ),
+        ]
 
     def __str__(self) -> str:
         """Получить строковое представление чата.
@@ -62,6 +96,67 @@ class Chat(models.Model):
         """
         return f"{self.room_group_name}"
 
+    @staticmethod
+    def add_messages(messages: list["Message"]) -> None:
+        """Обновить последнее сообщение и счетчики непрочитанных сообщений.
+
+        Для каждого чата выполняется один UPDATE, счетчик непрочитанных
+        увеличивается у получателя каждого сообщения. Пачки сообщений из разных
+        процессов могут сохраняться не по порядку, поэтому последнее сообщение
+        заменяется, только если ID нового больше текущего.
+
+        Args:
+            messages (list[Message]): сохраненные сообщения
+
+        """
+        chats: dict[int, tuple[Chat, list[Message]]] = {}
+        for message in sorted(messages, key=lambda message: message.id):
+            chats.setdefault(message.chat_id, (message.chat, []))[1].append(message)
+        for chat_id, (chat, chat_messages) in chats.items():
+            from_buyer = sum(m.sender_id == chat.buyer_id for m in chat_messages)
+            last = chat_messages[-1]
+            is_newer = models.Q(last_message_id__isnull=True) | models.Q(
+                last_message_id__lt=last.id
+            )
+            Chat.objects.filter(pk=chat_id).update(
+                last_message_id=models.Case(
+                    models.When(is_newer, then=models.Value(last.id)),
+                    default=models.F("last_message_id"),
+                    output_field=models.BigIntegerField(),
+                ),
+                last_message_at=models.Case(
+                    models.When(is_newer, then=models.Value(last.created_at)),
+                    default=models.F("last_message_at"),
+                ),
+                buyer_unread=models.F("buyer_unread") + len(chat_messages) - from_buyer,
+                seller_unread=models.F("seller_unread") + from_buyer,
+            )
+
+    def mark_as_read(self, user_id: int) -> int:
+        """Отметить чат прочитанным участником до последнего сообщения.
+
+        Строка чата блокируется до конца транзакции, поэтому новое сообщение
+        не может быть добавлено между чтением последнего сообщения и сбросом
+        счетчика непрочитанных.
+
+        Args:
+            user_id (int): ID участника чата
+
+        Returns:
+            int: ID последнего прочитанного сообщения
+
+        """
+        role = "buyer" if user_id == self.buyer_id else "seller"
+        with transaction.atomic():
+            chats = Chat.objects.filter(pk=self.pk)
+            last_read = (
+                chats.select_for_update()
+                .values_list("last_message_id", flat=True)
+                .first()
+            ) or 0
+            chats.update(**{f"{role}_unread": 0, f"{role}_last_read": last_read})
+        return last_read
+
 
 class Message(TimeCreateUpdateModel):
     """Cообщениe."""
@@ -75,6 +170,12 @@ class Message(TimeCreateUpdateModel):
     )
     message = models.TextField(null=False, blank=False)
     chat = models.ForeignKey(Chat, on_delete=models.PROTECT, related_name="messages")
+    created_at = models.DateTimeField(
+        "Время создания",
+        default=timezone.now,
+        null=True,
+        db_index=True,
+    )
 
     class Meta:
         """Настройки модели сообщения."""
@@ -82,6 +183,12 @@ class Message(TimeCreateUpdateModel):
         verbose_name = "Сообщение"
         verbose_name_plural = "Сообщения"
         ordering = ["created_at"]  # noqa: RUF012
+        indexes = [  # noqa: RUF012
+            models.Index(
+                fields=["chat", "created_at", "id"],
+                name="message_chat_created_at_idx",
+            ),
+        ]
 
     def __str__(self) -> str:
         """Получить строковое представление сообщения.
@@ -0,0 +1,147 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+CONNECTIONS_KEY = "presence:connections:{}"
+LAST_SEEN_KEY = "presence:last_seen:{}"
+TYPING_KEY = "presence:typing:{}:{}"
+
+
+async def connect(user_id: int) -> None:
+    """Учесть новое соединение пользователя.
+
+    Количество соединений хранится в кэше со сроком CHAT_PRESENCE_TTL,
+    который продлевается вызовом touch: если процесс завершился, не закрыв
+    соединения, пользователь перестает считаться в сети после этого срока.
+
+    Args:
+        user_id (int): ID пользователя
+
+    """
+    key = CONNECTIONS_KEY.format(user_id)
+    await cache.aadd(key, 0, settings.CHAT_PRESENCE_TTL)
+    await cache.aincr(key)
+    await cache.atouch(key, settings.CHAT_PRESENCE_TTL)
+
+
+async def touch(user_id: int) -> None:
+    """Продлить срок хранения соединений пользователя.
+
+    Args:
+        user_id (int): ID пользователя
+
+    """
+    await cache.atouch(CONNECTIONS_KEY.format(user_id), settings.CHAT_PRESENCE_TTL)
+
+
+async def disconnect(user_id: int) -> bool:
+    """Учесть закрытие соединения пользователя.
+
+    Args:
+        user_id (int): ID пользователя
+
+    Returns:
+        bool: у пользователя не осталось соединений
+
+    """
+    key = CONNECTIONS_KEY.format(user_id)
+    try:
+        connections = await cache.adecr(key)
+    except ValueError:
+        connections = 0
+    if connections > 0:
+        return False
+    await cache.adelete(key)
+    await cache.aset(
+        LAST_SEEN_KEY.format(user_id),
+        timezone.now().isoformat(),
+        settings.CHAT_LAST_SEEN_TTL,
+    )
+    return True
+
+
+async def allow_typing(room_group_name: str, user_id: int) -> bool:
+    """Проверить, нужно ли отправлять событие набора текста.
+
+    Событие отправляется не чаще раза в CHAT_TYPING_INTERVAL секунд на
+    пользователя в чате, остальные события за это время отбрасываются:
+    клиенты показывают индикатор набора в течение этого интервала.
+
+    Args:
+        room_group_name (str): название группы чата
+        user_id (int): ID пользователя
+
+    Returns:
+        bool: событие нужно отправить
+
+    """
+    return await cache.aadd(
+        TYPING_KEY.format(room_group_name, user_id), 1, settings.CHAT_TYPING_INTERVAL
+    )
+
+
+def get_presence(user_ids: list[int]) -> dict[int, dict]:
+    """Получить присутствие пользователей одним запросом к кэшу.
+
+    Args:
+        user_ids (list[int]): ID пользователей
+
+    Returns:
+        dict[int, dict]: признак нахождения в сети и время последнего
+            посещения по ID пользователя
+
+    """
+    return _build_presence(user_ids, cache.get_many(_get_presence_keys(user_ids)))
+
+
+async def aget_presence(user_ids: list[int]) -> dict[int, dict]:
+    """Асинхронно получить присутствие пользователей одним запросом к кэшу.
+
+    Args:
+        user_ids (list[int]): ID пользователей
+
+    Returns:
+        dict[int, dict]: признак нахождения в сети и время последнего
+            посещения по ID пользователя
+
+    """
+    values = await cache.aget_many(_get_presence_keys(user_ids))
+    return _build_presence(user_ids, values)
+
+
+def _get_presence_keys(user_ids: list[int]) -> list[str]:
+    """Получить ключи кэша с присутствием пользователей.
+
+    Args:
+        user_ids (list[int]): ID пользователей
+
+    Returns:
+        list[str]: ключи кэша
+
+    """
+    return [
+        key.format(user_id)
+        for user_id in user_ids
+        for key in (CONNECTIONS_KEY, LAST_SEEN_KEY)
+    ]
+
+
+def _build_presence(user_ids: list[int], values: dict) -> dict[int, dict]:
+    """Собрать присутствие пользователей из значений кэша.
+
+    Args:
+        user_ids (list[int]): ID пользователей
+        values (dict): значения кэша по ключам
+
+    Returns:
+        dict[int, dict]: признак нахождения в сети и время последнего
+            посещения по ID пользователя
+
+    """
+    return {
+        user_id: {
+            "online": values.get(CONNECTIONS_KEY.format(user_id), 0) > 0,
+            "last_seen": values.get(LAST_SEEN_KEY.format(user_id)),
+        }
+        for user_id in user_ids
+    }
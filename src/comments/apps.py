@@ -6,3 +6,7 @@ class CommentsConfig(AppConfig):
 
     default_auto_field = "django.db.models.BigAutoField"
     name = "comments"
+
+    def ready(self) -> None:
+        """Запуск приложения."""
+        import comments.signals  # noqa: F401, PLC0415
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from ads.models import Ad
+from services.models import Service
+
+
+class Command(BaseCommand):
+    """Пересчет рейтинга и количества комментариев услуг и объявлений."""
+
+    help = "Пересчитать рейтинг и количество комментариев услуг и объявлений."
+
+    def handle(self, *args, **options) -> None:  # noqa: ARG002
+        """Выполнить команду."""
+        for model in (Ad, Service):
+            with transaction.atomic():
+                updated = model.rebuild_ratings()
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"{model._meta.verbose_name_plural}: обновлено {updated}."
+                )
+            )
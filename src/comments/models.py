@@ -1,17 +1,17 @@
-import sys
-
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from django.core.validators import MaxValueValidator, MinValueValidator
-from django.db import models
+from django.db import models, transaction
 
 from comments.managers import CommentManager
 from core.abstract_models import AbstractImage, TimeCreateUpdateModel
+from core.cache import invalidate
 from core.choices import CommentStatus
+from core.search_index import update_search_index
 from core.enums import Limits
-from services.tasks import delete_images_dir_task, notify_about_moderation_task
+from services.tasks import delete_images_dir_task
 
 User = get_user_model()
 
@@ -58,6 +58,9 @@ class Comment(TimeCreateUpdateModel):
     cstm_mng = CommentManager()
     objects = models.Manager()
 
+    _published_rating: int | None = None
+    """Оценка, учтенная в рейтинге объекта."""
+
     class Meta:
         """Настройки модели комментариев."""
 
@@ -81,6 +84,28 @@ class Comment(TimeCreateUpdateModel):
                 image.delete()
             delete_images_dir_task.delay(f"comments/{self.id}")
 
+    @classmethod
+    def from_db(cls, db: str, field_names: list[str], values: list) -> "Comment":
+        """Создать экземпляр комментария из строки БД.
+
+        Запоминается оценка, учтенная в рейтинге объекта, чтобы при
+        сохранении и удалении комментария применить к рейтингу разницу.
+
+        :param db: псевдоним БД
+        :type db: str
+        :param field_names: имена загруженных полей
+        :type field_names: list[str]
+        :param values: значения загруженных полей
+        :type values: list
+        :returns: экземпляр комментария
+        :rtype: Comment
+        """
+        instance = super().from_db(db, field_names, values)
+        loaded = dict(zip(field_names, values, strict=True))
+        if loaded.get("status") == CommentStatus.PUBLISHED:
+            instance._published_rating = loaded.get("rating")
+        return instance
+
     def approve(self) -> None:
         """Утвердить комментарий.
 
@@ -100,14 +125,63 @@ class Comment(TimeCreateUpdateModel):
             self.delete_images()
             self.delete()
 
-    def notify_about_comment_creation(self) -> None:
-        """Создать уведомление о создании комментария.
+    def save(self, *args, **kwargs) -> None:
+        """Сохранить комментарий.
 
-        Создает задачу о необходимости модерации комментария.
+        Рейтинг объекта обновляется обработчиком post_save в той же
+        транзакции.
         """
-        url = self.get_admin_url()
-        if "test" not in sys.argv:
-            notify_about_moderation_task.delay(url)
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+
+    def sync_subject_rating(
+        self,
+        deleted: bool = False,  # noqa: FBT001, FBT002
+    ) -> None:
+        """Применить к рейтингу объекта изменение оценки комментария.
+
+        В рейтинге учитываются только опубликованные комментарии: при
+        публикации оценка добавляется, при снятии с публикации или удалении
+        исключается, при изменении оценки опубликованного комментария
+        применяется разница.
+
+        :param deleted: комментарий удален
+        :type deleted: bool
+        """
+        old = self._published_rating
+        new: int | None = (
+            self.rating
+            if self.status == CommentStatus.PUBLISHED and not deleted
+            else None
+        )
+        self._published_rating = new
+        if old is None and new is not None:
+            self.update_subject_rating(new, 1)
+        elif old is not None and new is None:
+            self.update_subject_rating(-old, -1)
+        elif old is not None and new is not None and old != new:
+            self.update_subject_rating(new - old, 0)
+
+    def update_subject_rating(self, rating: int, count: int) -> None:
+        """Изменить рейтинг объекта комментария.
+
+        Обновление выполняется одним UPDATE без чтения объекта, закэшированные
+        ответы с данными объекта сбрасываются, документ поиска объекта
+        обновляется.
+
+        :param rating: изменение суммы оценок
+        :type rating: int
+        :param count: изменение количества опубликованных комментариев
+        :type count: int
+        """
+        model = ContentType.objects.get_for_id(self.content_type_id).model_class()
+        model.objects.filter(pk=self.object_id).update(
+            rating_sum=models.F("rating_sum") + rating,
+            rating_count=models.F("rating_count") + count,
+            published_comments_count=models.F("published_comments_count") + count,
+        )
+        invalidate(model._meta.app_label)
+        update_search_index(model, [self.object_id])
 
     def get_admin_url(self) -> str:
         """Возвращает ссылку на экземпляр модели в админке.
@@ -1,26 +1,41 @@
 from typing import Any
 
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
 from comments.models import Comment
 
 
 @receiver(post_save, sender=Comment)
-def notify_about_comment_creation(
+def update_subject_rating_on_save(
     sender: Any,  # noqa: ANN401, ARG001
     instance: Comment,
-    created: bool,  # noqa: FBT001
     **kwargs  # noqa: ANN003, ARG001
 ) -> None:
-    """Уведомить о создании комментария.
+    """Обновить рейтинг объекта после сохранения комментария.
 
     :param sender: класс модели
     :type sender: Any
     :param instance: экземпляр класса
     :type instance: Comment
-    :param created: отметка о создании экземпляра класса
-    :type created: bool
     """
-    if created:
-        instance.notify_about_comment_creation()
+    instance.sync_subject_rating()
+
+
+@receiver(post_delete, sender=Comment)
+def update_subject_rating_on_delete(
+    sender: Any,  # noqa: ANN401, ARG001
+    instance: Comment,
+    **kwargs  # noqa: ANN003, ARG001
+) -> None:
+    """Обновить рейтинг объекта после удаления комментария.
+
+    Обработчик вызывается и при каскадном удалении комментариев,
+    например вместе с их автором.
+
+    :param sender: класс модели
+    :type sender: Any
+    :param instance: экземпляр класса
+    :type instance: Comment
+    """
+    instance.sync_subject_rating(deleted=True)
@@ -23,6 +23,10 @@ app.conf.beat_schedule = {
         "task": "users.tasks.delete_files_after_expiration_date",
         "schedule": crontab(day_of_month="15"),
     },
+    "delete-old-notifications": {
+        "task": "notifications.tasks.delete_old_notifications_task",
+        "schedule": crontab(minute="00", hour="02"),
+    },
 }
 
 app.conf.timezone = "UTC"
@@ -40,6 +40,7 @@ INSTALLED_APPS = [
     "oauth2_provider",
     "social_django",
     "corsheaders",
+    "core",
     "users",
     "notifications",
     "services",
@@ -54,6 +55,7 @@ MIDDLEWARE = [
     "django.contrib.sessions.middleware.SessionMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "core.middleware.CsrfHeaderMiddleware",
+    "core.middleware.ProfilingMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
@@ -262,6 +264,39 @@ CELERY_BROKER_TRANSPORT_OPTIONS = {"visibility_timeout": 3600}
 CELERY_BROKER_CONNECTION_RETRY_ON_STARTUP = True
 CELERY_RESULT_BACKEND = f"redis://{REDIS_HOST}:{REDIS_PORT}/0"
 
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": f"redis://{REDIS_HOST}:{REDIS_PORT}/1",
+        "KEY_PREFIX": "api",
+    },
+}
+RESPONSE_CACHE_TIMEOUT = int(getenv("RESPONSE_CACHE_TIMEOUT", default=60 * 60 * 24))
+
+PROFILING_ENABLED = getenv("PROFILING_ENABLED", default="False") == "True"
+PROFILING_SAMPLE_RATE = float(getenv("PROFILING_SAMPLE_RATE", default="1.0"))
+PROFILING_SLOW_REQUEST_MS = int(getenv("PROFILING_SLOW_REQUEST_MS", default="500"))
+PROFILING_MAX_QUERIES = int(getenv("PROFILING_MAX_QUERIES", default="20"))
+
+CHAT_WRITE_BEHIND = getenv("CHAT_WRITE_BEHIND", default="False") == "True"
+CHAT_WRITE_BEHIND_BATCH_SIZE = int(
+    getenv("CHAT_WRITE_BEHIND_BATCH_SIZE", default="100")
+)
+CHAT_WRITE_BEHIND_INTERVAL_MS = int(
+    getenv("CHAT_WRITE_BEHIND_INTERVAL_MS", default="50")
+)
+CHAT_PRESENCE_TTL = int(getenv("CHAT_PRESENCE_TTL", default="300"))
+CHAT_LAST_SEEN_TTL = int(getenv("CHAT_LAST_SEEN_TTL", default="2592000"))
+CHAT_TYPING_INTERVAL = int(getenv("CHAT_TYPING_INTERVAL", default="2"))
+
+NOTIFICATION_RETENTION_DAYS = int(getenv("NOTIFICATION_RETENTION_DAYS", default="90"))
+NOTIFICATION_RETENTION_BATCH_SIZE = int(
+    getenv("NOTIFICATION_RETENTION_BATCH_SIZE", default="1000")
+)
+NOTIFICATION_RETENTION_ARCHIVE = (
+    getenv("NOTIFICATION_RETENTION_ARCHIVE", default="False") == "True"
+)
+
 ERROR_LOG_FILENAME = Path(BASE_DIR, getenv("ERROR_LOG_FILENAME", "errors.log"))
 LOGGING = {
     "version": 1,
@@ -313,6 +348,11 @@ LOGGING = {
             "handlers": ["file_logger", "telegram_logger"],
             "propagate": False,
         },
+        "core.middleware": {
+            "level": "INFO",
+            "handlers": ["console_logger"],
+            "propagate": False,
+        },
         "chat.consumers": {
             "level": "ERROR",
             "handlers": ["telegram_async_logger"],
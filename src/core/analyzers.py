@@ -0,0 +1,71 @@
+from django_elasticsearch_dsl import fields
+from elasticsearch_dsl import analyzer, char_filter, token_filter
+
+yo_filter = char_filter("yo_filter", type="mapping", mappings=["ё => е", "Ё => Е"])
+"""Замена буквы "ё" на "е"."""
+
+russian_analyzer = analyzer(
+    "russian_morphology",
+    tokenizer="standard",
+    char_filter=[yo_filter],
+    filter=[
+        "lowercase",
+        token_filter("russian_stop", type="stop", stopwords="_russian_"),
+        token_filter("russian_stemmer", type="stemmer", language="russian"),
+    ],
+)
+"""Анализатор русского текста со стеммингом."""
+
+autocomplete_analyzer = analyzer(
+    "autocomplete",
+    tokenizer="standard",
+    char_filter=[yo_filter],
+    filter=[
+        "lowercase",
+        token_filter("autocomplete_filter", type="edge_ngram", min_gram=2, max_gram=20),
+    ],
+)
+"""Анализатор для индексирования начал слов (поиск по префиксу)."""
+
+autocomplete_search_analyzer = analyzer(
+    "autocomplete_search",
+    tokenizer="standard",
+    char_filter=[yo_filter],
+    filter=["lowercase"],
+)
+"""Анализатор поискового запроса по началам слов."""
+
+trigram_analyzer = analyzer(
+    "trigram",
+    tokenizer="standard",
+    char_filter=[yo_filter],
+    filter=[
+        "lowercase",
+        token_filter("trigram_filter", type="ngram", min_gram=3, max_gram=3),
+    ],
+)
+"""Анализатор для индексирования и поиска подстрок по триграммам."""
+
+
+def search_text_field() -> fields.TextField:
+    """Получить текстовое поле документа для полнотекстового поиска.
+
+    Основное поле анализируется с учетом морфологии русского языка,
+    подполе "autocomplete" хранит начала слов, подполе "ngram" - триграммы
+    для поиска подстрок. Поиск по префиксу и подстроке выполняется
+    по обратному индексу, без запросов wildcard.
+
+    Returns:
+        fields.TextField: текстовое поле с подполями
+
+    """
+    return fields.TextField(
+        analyzer=russian_analyzer,
+        fields={
+            "autocomplete": fields.TextField(
+                analyzer=autocomplete_analyzer,
+                search_analyzer=autocomplete_search_analyzer,
+            ),
+            "ngram": fields.TextField(analyzer=trigram_analyzer),
+        },
+    )
@@ -0,0 +1,8 @@
+from django.apps import AppConfig
+
+
+class CoreConfig(AppConfig):
+    """Настройки приложения 'core'."""
+
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "core"
@@ -2,14 +2,19 @@ import sys
 
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.fields import GenericRelation
+from django.contrib.contenttypes.models import ContentType
 from django.contrib.sites.shortcuts import get_current_site
 from django.db import models, transaction
+from django.db.models.functions import Coalesce
 from django.http.request import HttpRequest
 
+from categories.models import PATH_SEPARATOR
 from comments.models import Comment
 from core.abstract_models import TimeCreateUpdateModel
-from core.choices import AdvertisementStatus
+from core.cache import invalidate
+from core.choices import AdvertisementStatus, CommentStatus
 from core.enums import Limits
+from core.search_index import update_search_index
 from services.tasks import delete_images_dir_task, notify_about_moderation_task
 from users.models import Favorites
 
@@ -40,6 +45,27 @@ class AbstractAdvertisement(TimeCreateUpdateModel):
         blank=True,
     )
     comments = GenericRelation(Comment)
+    rating_sum = models.PositiveIntegerField(
+        "Сумма оценок",
+        default=0,
+        editable=False,
+    )
+    rating_count = models.PositiveIntegerField(
+        "Количество оценок",
+        default=0,
+        editable=False,
+    )
+    published_comments_count = models.PositiveIntegerField(
+        "Количество опубликованных комментариев",
+        default=0,
+        editable=False,
+    )
+    category_path = models.CharField(
+        "Путь категории",
+        max_length=Limits.MAX_LENGTH_CATEGORY_PATH,
+        default="",
+        editable=False,
+    )
 
     class Meta:
         """Настройки модели."""
@@ -55,6 +81,73 @@ class AbstractAdvertisement(TimeCreateUpdateModel):
         """
         return self.title
 
+    @property
+    def rating(self) -> float | None:
+        """Средний рейтинг по опубликованным комментариям.
+
+        Returns:
+            float | None: средний рейтинг, если есть оценки
+
+        """
+        if not self.rating_count:
+            return None
+        return round(self.rating_sum / self.rating_count, 1)
+
+    @property
+    def category_ids(self) -> list[int]:
+        """ID категорий объекта вместе с их предками.
+
+        Returns:
+            list[int]: идентификаторы категорий из пути категории объекта
+
+        """
+        return [int(pk) for pk in self.category_path.split(PATH_SEPARATOR) if pk]
+
+    @classmethod
+    def rebuild_ratings(cls) -> int:
+        """Пересчитать рейтинг и количество комментариев по данным комментариев.
+
+        Returns:
+            int: количество обновленных записей
+
+        """
+        published = (
+            Comment.objects.filter(
+                content_type=ContentType.objects.get_for_model(cls),
+                object_id=models.OuterRef("pk"),
+                status=CommentStatus.PUBLISHED,
+            )
+            .order_by()
+            .values("object_id")
+        )
+        count = models.Subquery(
+            published.annotate(count=models.Count("id")).values("count")
+        )
+        updated = cls.objects.update(
+            rating_sum=Coalesce(
+                models.Subquery(
+                    published.annotate(sum=models.Sum("rating")).values("sum")
+                ),
+                0,
+            ),
+            rating_count=Coalesce(count, 0),
+            published_comments_count=Coalesce(count, 0),
+        )
+        invalidate(cls._meta.app_label)
+        return updated
+
+    def update_category_path(self) -> None:
+        """Обновить путь самой глубокой из категорий объекта.
+
+        Путь используется для фильтрации по категории без соединения с таблицей
+        связей категорий: объект относится к категории, если его путь
+        начинается с пути категории.
+        """
+        paths = self.category.values_list("path", flat=True)
+        self.category_path = max(paths, key=len, default="")
+        type(self).objects.filter(pk=self.pk).update(category_path=self.category_path)
+        update_search_index(type(self), [self.pk])
+
     def hide(self) -> None:
         """Изменить статус на 'Скрыто'."""
         if self.status == AdvertisementStatus.PUBLISHED:
@@ -0,0 +1,135 @@
+import time
+from collections.abc import Callable
+from functools import wraps
+from hashlib import md5
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+CATEGORIES = "categories"
+ADS = "ads"
+SERVICES = "services"
+USERS = "users"
+
+VERSION_KEY = "version:{}"
+RESPONSE_KEY = "response:{}:{}:{}:{}"
+
+
+def get_favorites_namespace(user_id: int) -> str:
+    """Получить пространство имен кэша избранного пользователя.
+
+    Args:
+        user_id (int): ID пользователя
+
+    Returns:
+        str: пространство имен
+
+    """
+    return f"favorites:{user_id}"
+
+
+def get_versions(*namespaces: str) -> list[int]:
+    """Получить текущие версии пространств имен кэша.
+
+    Отсутствующая в кэше версия инициализируется текущим временем, поэтому
+    после вытеснения ключа версии старые записи не становятся снова валидными.
+
+    Args:
+        *namespaces (str): пространства имен
+
+    Returns:
+        list[int]: версии в порядке пространств имен
+
+    """
+    keys = [VERSION_KEY.format(namespace) for namespace in namespaces]
+    versions = cache.get_many(keys)
+    missing = [key for key in keys if key not in versions]
+    if missing:
+        for key in missing:
+            cache.add(key, time.time_ns(), timeout=None)
+        versions.update(cache.get_many(missing))
+    return [versions[key] for key in keys]
+
+
+def bump_versions(*namespaces: str) -> None:
+    """Увеличить версии пространств имен кэша.
+
+    Args:
+        *namespaces (str): пространства имен
+
+    """
+    for namespace in namespaces:
+        key = VERSION_KEY.format(namespace)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, time.time_ns(), timeout=None)
+
+
+def invalidate(*namespaces: str) -> None:
+    """Сделать недействительными закэшированные данные пространств имен.
+
+    Версии увеличиваются сразу и повторно после фиксации транзакции: иначе
+    запрос, прочитавший данные до фиксации, мог бы сохранить в кэш устаревший
+    ответ под новой версией.
+
+    Args:
+        *namespaces (str): пространства имен
+
+    """
+    bump_versions(*namespaces)
+    transaction.on_commit(lambda: bump_versions(*namespaces))
+
+
+def cache_response(
+    *namespaces: str, vary_on_user: bool = True
+) -> Callable[[Callable], Callable]:
+    """Кэшировать успешные ответы метода представления.
+
+    Ключ кэша включает версии пространств имен, от данных которых зависит
+    ответ, поэтому ответы хранятся долго, но перестают использоваться сразу
+    после изменения данных.
+
+    Args:
+        *namespaces (str): пространства имен, от которых зависит ответ
+        vary_on_user (bool): ответ зависит от пользователя (например, признак
+            нахождения в избранном)
+
+    Returns:
+        Callable[[Callable], Callable]: декоратор метода представления
+
+    """
+
+    def decorator(method: Callable) -> Callable:
+        @wraps(method)
+        def wrapper(
+            view: APIView, request: Request, *args: list, **kwargs: dict
+        ) -> Response:
+            user_namespaces: tuple[str, ...] = ()
+            user_id = 0
+            if vary_on_user and request.user.is_authenticated:
+                user_id = request.user.id
+                user_namespaces = (get_favorites_namespace(user_id),)
+            versions = get_versions(*namespaces, *user_namespaces)
+            key = RESPONSE_KEY.format(
+                method.__qualname__,
+                ".".join(map(str, versions)),
+                user_id,
+                md5(request.get_full_path().encode()).hexdigest(),  # noqa: S324
+            )
+            data = cache.get(key)
+            if data is not None:
+                return Response(data)
+            response = method(view, request, *args, **kwargs)
+            if response.status_code == status.HTTP_200_OK:
+                cache.set(key, response.data, settings.RESPONSE_CACHE_TIMEOUT)
+            return response
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,57 @@
+from django.apps import apps
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import Model
+
+ADVERTISEMENT_MODELS: dict[str, str] = {
+    "ad": "ads.Ad",
+    "service": "services.Service",
+}
+"""Модели услуг и объявлений по строковому типу объекта."""
+
+
+def get_model(obj_type: str) -> type[Model] | None:
+    """Получить модель по строковому типу объекта.
+
+    Args:
+        obj_type (str): тип объекта ("ad" или "service")
+
+    Returns:
+        type[Model] | None: модель, если тип известен
+
+    """
+    label = ADVERTISEMENT_MODELS.get(obj_type)
+    if label is None:
+        return None
+    return apps.get_model(label)
+
+
+def get_advertisement_models() -> list[type[Model]]:
+    """Получить модели услуг и объявлений.
+
+    Returns:
+        list[type[Model]]: модели услуг и объявлений
+
+    """
+    return [apps.get_model(label) for label in ADVERTISEMENT_MODELS.values()]
+
+
+def get_content_type(obj: str | type[Model] | Model) -> ContentType:
+    """Получить ContentType по типу объекта, модели или ее экземпляру.
+
+    Экземпляры ContentType кэшируются менеджером на время жизни процесса,
+    поэтому к БД обращается только первый вызов для каждой модели.
+
+    Args:
+        obj (str | type[Model] | Model): тип объекта, модель или экземпляр модели
+
+    Returns:
+        ContentType: тип объекта
+
+    Raises:
+        LookupError: неизвестный строковый тип объекта
+
+    """
+    model = get_model(obj) if isinstance(obj, str) else obj
+    if model is None:
+        raise LookupError(f"Unknown object type: {obj}")
+    return ContentType.objects.get_for_model(model)
@@ -27,6 +27,8 @@ class Limits(IntEnum):
     # Предельные значения для notifications
     MAX_LENGTH_NOTIFICATION_TEXT = 500
     """Предельная длина текста уведомления."""
+    NOTIFICATIONS_REPLAY_PAGE_SIZE = 100
+    """Количество уведомлений, повторно отправляемых за один раз."""
 
     # Предельные значения для ads
     MAX_LENGTH_ADVMNT_TITLE = 250
@@ -35,6 +37,8 @@ class Limits(IntEnum):
     """Предельная длина описания объявления."""
     MAX_LENGTH_CATEGORY_TITLE = 50
     """Предельная длина наименования категории объявления."""
+    MAX_LENGTH_CATEGORY_PATH = 255
+    """Предельная длина пути категории в дереве категорий."""
     MAX_LENGTH_ADVMNT_STATE = 15
     """Предельная длина типа состояния товара."""
 
@@ -63,3 +67,7 @@ class Limits(IntEnum):
     """Минимальное значение оценки в отзыве."""
     MAX_COMMENT_TEXT = 500
     """Предельная длина текста отзыва."""
+
+    # Предельные значения для chat
+    CHAT_HISTORY_PAGE_SIZE = 30
+    """Количество сообщений чата, отправляемых за один раз."""
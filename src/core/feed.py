@@ -0,0 +1,70 @@
+from django.db.models import CharField, Model, Q, QuerySet, Value
+
+from ads.models import Ad
+from services.models import Service
+
+FEED_MODELS: dict[str, type[Model]] = {
+    "ad": Ad,
+    "service": Service,
+}
+"""Модели, участвующие в общей ленте, по типу объекта."""
+
+
+def get_feed_queryset(filters: dict, condition: Q | None = None) -> QuerySet:
+    """Сформировать запрос к общей ленте услуг и объявлений.
+
+    Объединение (UNION ALL), сортировка и срез страницы выполняются на стороне БД.
+    Запрос возвращает только идентификаторы, тип объекта и время создания,
+    поэтому в память загружаются лишь строки запрошенной страницы.
+
+    Args:
+        filters (dict): параметры фильтрации, общие для услуг и объявлений
+        condition (Q | None): дополнительное условие, например позиция курсора;
+            может ссылаться на поле "type"
+
+    Returns:
+        QuerySet: запрос, возвращающий словари с ключами "id", "type", "created_at",
+            отсортированный по дате создания (сначала новые), ID и типу объекта
+
+    """
+    queries = [
+        model.objects.annotate(type=Value(type, output_field=CharField()))
+        .filter(condition or Q(), **filters)
+        .order_by()
+        .values("id", "type", "created_at")
+        for type, model in FEED_MODELS.items()
+    ]
+    return (
+        queries[0].union(*queries[1:], all=True).order_by("-created_at", "-id", "type")
+    )
+
+
+def get_feed_objects(rows: list[dict]) -> list[Model]:
+    """Получить объекты ленты по строкам страницы.
+
+    Для каждого типа объектов выполняется один запрос к БД, данные для списков
+    (рейтинг, количество комментариев, титульное фото) загружаются сразу.
+
+    Args:
+        rows (list[dict]): строки страницы, полученные из get_feed_queryset
+
+    Returns:
+        list[Model]: услуги и объявления в порядке строк страницы
+
+    """
+    ids: dict[str, list[int]] = {type: [] for type in FEED_MODELS}
+    for row in rows:
+        ids[row["type"]].append(row["id"])
+    objects = {
+        type: (
+            FEED_MODELS[type].cstm_mng.with_list_data().in_bulk(ids[type])
+            if ids[type]
+            else {}
+        )
+        for type in FEED_MODELS
+    }
+    return [
+        objects[row["type"]][row["id"]]
+        for row in rows
+        if row["id"] in objects[row["type"]]
+    ]
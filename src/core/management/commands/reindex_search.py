@@ -0,0 +1,287 @@
+from collections.abc import Iterable, Iterator
+from operator import attrgetter
+from time import perf_counter
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db.models import Model, QuerySet
+from django.utils import timezone
+from django_elasticsearch_dsl import Document
+from elasticsearch.helpers import parallel_bulk
+
+from ads.documents import AdDocument
+from services.documents import ServiceDocument
+
+DOCUMENTS: dict[str, type[Document]] = {
+    document.Index.name: document for document in (AdDocument, ServiceDocument)
+}
+"""Документы поиска по псевдониму индекса."""
+FINGERPRINT_FIELDS = (
+    "updated_at",
+    "status",
+    "rating_sum",
+    "rating_count",
+    "category_path",
+    "provider__email",
+)
+"""Поля объекта, изменение которых требует перезаписи документа.
+
+Кроме времени изменения учитываются поля, которые обновляются через
+QuerySet.update() без изменения updated_at, и поля связанных моделей.
+"""
+
+
+class Command(BaseCommand):
+    """Перестроение поисковых индексов без простоя поиска.
+
+    Документы записываются в новый индекс с версией в имени, после чего
+    псевдоним, по которому выполняются поиск и обновления, атомарно
+    переключается на него. Старые версии индекса удаляются. Объекты,
+    измененные во время перестроения, дозаписываются после переключения,
+    документы удаленных объектов удаляются.
+    """
+
+    help = "Перестроить индексы поиска и переключить на них псевдонимы."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Добавить аргументы команды."""
+        parser.add_argument(
+            "indices",
+            nargs="*",
+            choices=list(DOCUMENTS),
+            help="Индексы для перестроения (по умолчанию все).",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="Количество объектов в пачке чтения из БД и записи в индекс.",
+        )
+        parser.add_argument(
+            "--thread-count",
+            type=int,
+            default=4,
+            help="Количество потоков записи в индекс.",
+        )
+        parser.add_argument(
+            "--keep-old",
+            action="store_true",
+            help="Не удалять предыдущие версии индекса.",
+        )
+
+    def handle(self, *args, **options) -> None:  # noqa: ARG002
+        """Выполнить команду."""
+        for alias in options["indices"] or DOCUMENTS:
+            document = DOCUMENTS[alias]
+            queryset = document().get_queryset()
+            name = f"{alias}_{timezone.now():%Y%m%d%H%M%S}"
+            start = perf_counter()
+            # Обновление индекса во время записи отключается.
+            index = document._index.clone(name=name)
+            index.settings(refresh_interval="-1")
+            index.create()
+            fingerprints: dict[int, int] = {}
+            try:
+                count = self.index_documents(
+                    document, name, queryset, options, fingerprints
+                )
+                index.put_settings(settings={"index": {"refresh_interval": None}})
+                index.refresh()
+            except Exception as e:
+                index.delete(ignore_unavailable=True)
+                raise CommandError(f"{alias}: {e}") from e
+            elapsed = perf_counter() - start
+            old_indices = self.switch_alias(document, alias, name)
+            changed, deleted = self.get_changes(queryset, fingerprints, options)
+            updated = sum(
+                self.index_documents(
+                    document, alias, queryset.filter(pk__in=pks), options
+                )
+                for pks in self.chunks(changed, options["chunk_size"])
+            )
+            self.delete_documents(document, alias, deleted, options)
+            if old_indices and not options["keep_old"]:
+                document._get_connection().indices.delete(index=",".join(old_indices))
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"{alias} -> {name}: {count} документов за {elapsed:.1f} с "
+                    f"({count / elapsed:.0f} док/с), изменено во время "
+                    f"перестроения {updated}, удалено {len(deleted)}."
+                )
+            )
+
+    def index_documents(
+        self,
+        document: type[Document],
+        index: str,
+        queryset: QuerySet,
+        options: dict,
+        fingerprints: dict[int, int] | None = None,
+    ) -> int:
+        """Записать объекты в индекс пачками в несколько потоков.
+
+        Args:
+            document (type[Document]): документ поиска
+            index (str): имя индекса или псевдонима
+            queryset (QuerySet): объекты для записи
+            options (dict): аргументы команды
+            fingerprints (dict[int, int] | None): словарь для отпечатков
+                записанных объектов по ID
+
+        Returns:
+            int: количество записанных документов
+
+        """
+        doc = document()
+
+        def actions() -> Iterator[dict]:
+            for obj in queryset.iterator(chunk_size=options["chunk_size"]):
+                if fingerprints is not None:
+                    fingerprints[obj.pk] = self.get_fingerprint(obj)
+                yield {
+                    "_index": index,
+                    "_id": doc.generate_id(obj),
+                    "_source": doc.prepare(obj),
+                }
+
+        return self.bulk(document, actions(), options)
+
+    def delete_documents(
+        self,
+        document: type[Document],
+        index: str,
+        pks: Iterable[int],
+        options: dict,
+    ) -> int:
+        """Удалить документы объектов, удаленных во время перестроения.
+
+        Args:
+            document (type[Document]): документ поиска
+            index (str): имя индекса или псевдонима
+            pks (Iterable[int]): ID удаленных объектов
+            options (dict): аргументы команды
+
+        Returns:
+            int: количество удаленных документов
+
+        """
+        actions = ({"_op_type": "delete", "_index": index, "_id": pk} for pk in pks)
+        # Документ мог быть уже удален обработчиком сигнала.
+        return self.bulk(document, actions, options, raise_on_error=False)
+
+    def bulk(
+        self,
+        document: type[Document],
+        actions: Iterable[dict],
+        options: dict,
+        raise_on_error: bool = True,  # noqa: FBT001, FBT002
+    ) -> int:
+        """Выполнить операции с индексом пачками в несколько потоков.
+
+        Args:
+            document (type[Document]): документ поиска
+            actions (Iterable[dict]): операции
+            options (dict): аргументы команды
+            raise_on_error (bool): прервать выполнение при ошибке операции
+
+        Returns:
+            int: количество успешных операций
+
+        """
+        return sum(
+            ok
+            for ok, _ in parallel_bulk(
+                document._get_connection(),
+                actions,
+                thread_count=options["thread_count"],
+                chunk_size=options["chunk_size"],
+                raise_on_error=raise_on_error,
+            )
+        )
+
+    def get_changes(
+        self,
+        queryset: QuerySet,
+        fingerprints: dict[int, int],
+        options: dict,
+    ) -> tuple[list[int], set[int]]:
+        """Найти объекты, измененные и удаленные во время перестроения.
+
+        Отпечатки записанных объектов сравниваются с текущими значениями
+        полей в БД. Время изменения не обновляется при QuerySet.update(),
+        поэтому выборки по нему недостаточно.
+
+        Args:
+            queryset (QuerySet): объекты индекса
+            fingerprints (dict[int, int]): отпечатки записанных объектов
+            options (dict): аргументы команды
+
+        Returns:
+            tuple[list[int], set[int]]: ID новых и измененных объектов
+                и ID удаленных объектов
+
+        """
+        changed = []
+        deleted = set(fingerprints)
+        rows = queryset.values_list("pk", *FINGERPRINT_FIELDS)
+        for pk, *values in rows.iterator(chunk_size=options["chunk_size"]):
+            deleted.discard(pk)
+            if fingerprints.get(pk) != hash(tuple(values)):
+                changed.append(pk)
+        return changed, deleted
+
+    @staticmethod
+    def get_fingerprint(obj: Model) -> int:
+        """Получить отпечаток полей объекта, влияющих на документ.
+
+        Args:
+            obj (Model): объект
+
+        Returns:
+            int: отпечаток
+
+        """
+        getters = (attrgetter(field.replace("__", ".")) for field in FINGERPRINT_FIELDS)
+        return hash(tuple(getter(obj) for getter in getters))
+
+    @staticmethod
+    def chunks(pks: list[int], size: int) -> Iterator[list[int]]:
+        """Разбить список ID на пачки.
+
+        Args:
+            pks (list[int]): ID объектов
+            size (int): размер пачки
+
+        Returns:
+            Iterator[list[int]]: пачки ID
+
+        """
+        for start in range(0, len(pks), size):
+            yield pks[start : start + size]
+
+    def switch_alias(self, document: type[Document], alias: str, name: str) -> list:
+        """Атомарно переключить псевдоним на новый индекс.
+
+        Индекс, созданный ранее под именем псевдонима, удаляется в той же
+        операции.
+
+        Args:
+            document (type[Document]): документ поиска
+            alias (str): псевдоним
+            name (str): имя нового индекса
+
+        Returns:
+            list: индексы, на которые указывал псевдоним
+
+        """
+        client = document._get_connection()
+        actions = [{"add": {"index": name, "alias": alias}}]
+        old_indices = []
+        if client.indices.exists_alias(name=alias):
+            old_indices = list(client.indices.get_alias(name=alias))
+            actions.extend(
+                {"remove": {"index": index, "alias": alias}} for index in old_indices
+            )
+        elif client.indices.exists(index=alias):
+            actions.append({"remove_index": {"index": alias}})
+        client.indices.update_aliases(actions=actions)
+        return old_indices
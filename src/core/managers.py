@@ -12,3 +12,27 @@ class TypeCategoryManager(models.Manager):
 
         """
         return super().get_queryset().prefetch_related("subcategories")
+
+
+class AdvertisementManager(models.Manager):
+    """Базовый менеджер для моделей услуг и объявлений."""
+
+    def with_list_data(self) -> models.QuerySet:
+        """Получить запрос с данными для вывода списков.
+
+        Категории и титульное фото загружаются одним запросом на страницу.
+        Рейтинг и количество комментариев хранятся в полях модели.
+
+        Returns:
+            QuerySet: запрос к БД
+
+        """
+        image_model = self.model._meta.get_field("images").related_model
+        return self.get_queryset().prefetch_related(
+            "category",
+            models.Prefetch(
+                "images",
+                queryset=image_model.objects.filter(title_photo=True),
+                to_attr="title_photos",
+            ),
+        )
@@ -1,14 +1,25 @@
+import json
+import logging
+import random
+from collections.abc import Callable
+from contextvars import ContextVar
+from time import perf_counter
+
 from channels.db import database_sync_to_async
 from channels.exceptions import DenyConnection
 from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.http import parse_cookie
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connection
+from django.http import HttpRequest, HttpResponse, parse_cookie
 from django.utils.deprecation import MiddlewareMixin
+from rest_framework import serializers
 from rest_framework_simplejwt.tokens import UntypedToken
 
 from users.models import CustomUser
 
 User = get_user_model()
+logger = logging.getLogger(__name__)
 
 
 class CsrfHeaderMiddleware(MiddlewareMixin):
@@ -18,6 +29,172 @@ class CsrfHeaderMiddleware(MiddlewareMixin):
         return response
 
 
+class RequestProfile:
+    """Данные профилирования одного запроса."""
+
+    def __init__(self) -> None:
+        """Создать пустой профиль запроса."""
+        self.queries = 0
+        self.db_time = 0.0
+        self.serializer_time = 0.0
+        self.serializing = False
+
+    def record_query(
+        self,
+        execute: Callable,
+        sql: str,
+        params: tuple,
+        many: bool,  # noqa: FBT001
+        context: dict,
+    ) -> object:
+        """Выполнить SQL запрос, учитывая его количество и время.
+
+        Args:
+            execute (Callable): функция выполнения запроса
+            sql (str): SQL запрос
+            params (tuple): параметры запроса
+            many (bool): запрос выполняется для набора параметров
+            context (dict): контекст выполнения
+
+        Returns:
+            object: результат выполнения запроса
+
+        """
+        start = perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.db_time += perf_counter() - start
+
+
+current_profile: ContextVar[RequestProfile | None] = ContextVar(
+    "current_profile", default=None
+)
+
+
+class ProfiledSerializerData(property):
+    """Свойство "data" сериализатора с замером времени в профиле запроса.
+
+    Учитывается только внешний сериализатор, время вложенных входит в него.
+    """
+
+    def __init__(self, data: property) -> None:
+        """Создать свойство с замером времени.
+
+        Args:
+            data (property): исходное свойство "data" сериализатора
+
+        Raises:
+            TypeError: у свойства нет функции чтения
+
+        """
+        fget = data.fget
+        if fget is None:
+            raise TypeError("Serializer data property has no getter")
+
+        def getter(serializer: serializers.BaseSerializer) -> object:
+            profile = current_profile.get()
+            if profile is None or profile.serializing:
+                return fget(serializer)
+            profile.serializing = True
+            start = perf_counter()
+            try:
+                return fget(serializer)
+            finally:
+                profile.serializer_time += perf_counter() - start
+                profile.serializing = False
+
+        super().__init__(getter, doc=data.__doc__)
+
+
+def profile_serializers() -> None:
+    """Подключить замер времени сериализаторов.
+
+    Свойство "data" заменяется в базовых классах сериализаторов DRF один раз
+    на процесс. Вне профилируемого запроса замер не выполняется.
+    """
+    for serializer_class in (serializers.Serializer, serializers.ListSerializer):
+        data = serializer_class.data
+        if not isinstance(data, ProfiledSerializerData):
+            serializer_class.data = ProfiledSerializerData(data)
+
+
+class ProfilingMiddleware:
+    """Профилирование запросов.
+
+    Для выборки запросов считает количество и общее время SQL запросов, время
+    работы сериализаторов и общее время обработки. Результат добавляется
+    в заголовок "Server-Timing" и записывается в лог, запросы сверх порогов
+    PROFILING_SLOW_REQUEST_MS и PROFILING_MAX_QUERIES записываются
+    с уровнем WARNING.
+
+    Включается настройкой PROFILING_ENABLED, доля профилируемых запросов
+    задается настройкой PROFILING_SAMPLE_RATE.
+    """
+
+    def __init__(self, get_response: Callable) -> None:
+        """Подключить middleware, если профилирование включено.
+
+        Args:
+            get_response (Callable): следующий обработчик запроса
+
+        Raises:
+            MiddlewareNotUsed: профилирование выключено
+
+        """
+        if not settings.PROFILING_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        profile_serializers()
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        """Обработать запрос.
+
+        Args:
+            request (HttpRequest): http запрос
+
+        Returns:
+            HttpResponse: http ответ
+
+        """
+        if random.random() >= settings.PROFILING_SAMPLE_RATE:  # noqa: S311
+            return self.get_response(request)
+        profile = RequestProfile()
+        token = current_profile.set(profile)
+        start = perf_counter()
+        try:
+            with connection.execute_wrapper(profile.record_query):
+                response = self.get_response(request)
+        finally:
+            current_profile.reset(token)
+        total = perf_counter() - start
+        response["Server-Timing"] = (
+            f'db;dur={profile.db_time * 1000:.1f};desc="{profile.queries} queries", '
+            f"serializer;dur={profile.serializer_time * 1000:.1f}, "
+            f"total;dur={total * 1000:.1f}"
+        )
+        slow = total * 1000 > settings.PROFILING_SLOW_REQUEST_MS
+        too_many_queries = profile.queries > settings.PROFILING_MAX_QUERIES
+        logger.log(
+            logging.WARNING if slow or too_many_queries else logging.INFO,
+            json.dumps(
+                {
+                    "method": request.method,
+                    "path": request.path,
+                    "status": response.status_code,
+                    "queries": profile.queries,
+                    "db_ms": round(profile.db_time * 1000, 1),
+                    "serializer_ms": round(profile.serializer_time * 1000, 1),
+                    "total_ms": round(total * 1000, 1),
+                    "slow": slow,
+                    "too_many_queries": too_many_queries,
+                }
+            ),
+        )
+        return response
+
+
 @database_sync_to_async
 def get_user_from_db(user_id: int) -> CustomUser | None:
     """Получение пользователя из БД по id.
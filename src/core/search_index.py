@@ -0,0 +1,29 @@
+from collections.abc import Iterable
+from functools import partial
+
+from django.apps import apps
+from django.db import transaction
+from django.db.models import Model
+
+from services.tasks import update_search_documents_task
+
+
+def update_search_index(model: type[Model], pks: Iterable[int]) -> None:
+    """Обновить документы поиска объектов, измененных через QuerySet.update().
+
+    QuerySet.update() не отправляет сигналы, по которым документы поиска
+    обновляются автоматически. Задача обновления ставится в очередь после
+    фиксации транзакции, если поиск подключен.
+
+    Args:
+        model (type[Model]): модель объектов
+        pks (Iterable[int]): ID объектов
+
+    """
+    if not apps.is_installed("django_elasticsearch_dsl"):
+        return
+    pks = list(pks)
+    if pks:
+        transaction.on_commit(
+            partial(update_search_documents_task.delay, model._meta.label, pks)
+        )
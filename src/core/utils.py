@@ -3,7 +3,9 @@ from pathlib import Path
 
 import telegram
 from asgiref.sync import async_to_sync
+from django.apps import apps
 from django.conf import settings
+from django_elasticsearch_dsl.registries import registry
 
 
 @async_to_sync
@@ -119,3 +121,17 @@ def delete_images_dir(path: str) -> None:
     """
     if Path(path).exists():
         shutil.rmtree(Path(settings.MEDIA_ROOT) / path)
+
+
+def update_search_documents(label: str, pks: list[int]) -> None:
+    """Обновление документов поиска.
+
+    Args:
+        label (str): модель в формате "app_label.ModelName"
+        pks (list[int]): ID объектов
+
+    """
+    model = apps.get_model(label)
+    for document in registry.get_documents(models=[model]):
+        doc = document()
+        doc.update(doc.get_queryset().filter(pk__in=pks))
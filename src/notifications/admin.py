@@ -1,6 +1,6 @@
 from django.contrib import admin
 
-from notifications.models import Notification
+from notifications.models import ArchivedNotification, Notification
 
 
 @admin.register(Notification)
@@ -15,3 +15,17 @@ class NotificationAdmin(admin.ModelAdmin):
     ]
     search_fields = ["text", "receiver_email"]  # noqa: RUF012
     ordering = ["created_at"]  # noqa: RUF012
+
+
+@admin.register(ArchivedNotification)
+class ArchivedNotificationAdmin(admin.ModelAdmin):
+    """Отображение модели архивных уведомлений в админке."""
+
+    list_display = [  # noqa: RUF012
+        "text",
+        "receiver",
+        "created_at",
+        "archived_at",
+    ]
+    search_fields = ["text"]  # noqa: RUF012
+    ordering = ["archived_at"]  # noqa: RUF012
@@ -1,21 +1,93 @@
 import json
 from typing import Any
+from urllib.parse import parse_qs
 
+from channels.db import database_sync_to_async
 from channels.generic.websocket import AsyncJsonWebsocketConsumer
 
+from api.v1.serializers import NotificationSerializer
+from core.enums import Limits
+from notifications.dispatcher import GROUP_NAME
+from notifications.models import Notification
+
 
 class NotificationConsumer(AsyncJsonWebsocketConsumer):
     """Обработчик для подключений к уведомлениям."""
 
     async def connect(self) -> None:
-        """Установить соединение."""
+        """Установить соединение.
+
+        Если в строке запроса передан курсор since (ID последнего полученного
+        уведомления), отправляются уведомления, созданные после него.
+        Повтор выполняется после подписки на группу, поэтому уведомления
+        не теряются, но могут прийти дважды.
+        """
         if self.scope.get("user", None) is None:
             await self.close()
             return
         self.user = self.scope["user"]
         await self.accept()
-        self.group_name = f"user_{self.user.id}_notifications"
+        self.group_name = GROUP_NAME.format(self.user.id)
         await self.channel_layer.group_add(self.group_name, self.channel_name)
+        since = parse_qs(self.scope.get("query_string", b"").decode()).get("since")
+        if since:
+            await self.replay(since[0])
+
+    async def receive_json(self, content: Any, **kwargs: dict) -> None:  # noqa: ANN401
+        """Получить сообщение.
+
+        Событие {"type": "replay", "since": <id>} запрашивает следующую
+        страницу пропущенных уведомлений.
+
+        Args:
+            content (Any): сообщение
+            **kwargs (dict): дополнительные именованные аргументы
+
+        """
+        if isinstance(content, dict) and content.get("type") == "replay":
+            await self.replay(content.get("since"))
+
+    async def replay(self, since: Any) -> None:  # noqa: ANN401
+        """Отправить уведомления, созданные после указанного.
+
+        После уведомлений отправляется событие {"type": "replay", "has_more":
+        bool}: если has_more, следующая страница запрашивается с ID последнего
+        полученного уведомления.
+
+        Args:
+            since (Any): ID последнего полученного уведомления
+
+        """
+        try:
+            since = int(since)
+        except (TypeError, ValueError):
+            return
+        messages, has_more = await self.get_notifications_since(since)
+        for message in messages:
+            await self.send(text_data=json.dumps(message))
+        await self.send_json({"type": "replay", "has_more": has_more})
+
+    @database_sync_to_async
+    def get_notifications_since(self, since: int) -> tuple[list, bool]:
+        """Получить уведомления пользователя, созданные после указанного.
+
+        Args:
+            since (int): ID уведомления
+
+        Returns:
+            tuple[list, bool]: уведомления и признак наличия следующих
+
+        """
+        page_size = Limits.NOTIFICATIONS_REPLAY_PAGE_SIZE
+        notifications = list(
+            Notification.objects.filter(
+                receiver_id=self.user.id, id__gt=since
+            ).order_by("id")[: page_size + 1]
+        )
+        return (
+            NotificationSerializer(notifications[:page_size], many=True).data,
+            len(notifications) > page_size,
+        )
 
     async def disconnect(self, close_code: Any) -> None:  # noqa: ANN401
         """Отключить соединение.
@@ -27,12 +99,19 @@ class NotificationConsumer(AsyncJsonWebsocketConsumer):
         await self.channel_layer.group_discard(self.group_name, self.channel_name)
         await self.close(close_code)
 
-    async def send_notification(self, event: Any) -> None:  # noqa: ANN401
-        """Отправить сообщение.
+    async def send_notifications(self, event: Any) -> None:  # noqa: ANN401
+        """Отправить уведомления, объединенные диспетчером.
+
+        После уведомлений отправляется количество непрочитанных уведомлений.
 
         Args:
             event (Any): событие
 
         """
-        message = event["message"]
-        await self.send(text_data=json.dumps(message))
+        for message in event["messages"]:
+            await self.send(text_data=json.dumps(message))
+        await self.send(
+            text_data=json.dumps(
+                {"type": "unread_count", "count": event["unread_count"]}
+            )
+        )
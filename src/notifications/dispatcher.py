@@ -0,0 +1,146 @@
+import asyncio
+import logging
+import weakref
+from collections.abc import Iterable
+from threading import local
+
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.db import transaction
+
+from api.v1.serializers import NotificationSerializer
+from notifications.models import Notification
+
+logger = logging.getLogger(__name__)
+
+GROUP_NAME = "user_{}_notifications"
+"""Группа каналов уведомлений пользователя."""
+MAX_CONCURRENT_SENDS = 100
+"""Количество одновременных отправок в слой каналов."""
+
+_pending = local()
+
+
+def dispatch(notifications: Iterable[Notification]) -> None:
+    """Отправить созданные уведомления получателям после фиксации транзакции.
+
+    Уведомления группируются по получателям. Отправки из всех вызовов в одном
+    блоке atomic объединяются и выполняются одним проходом после фиксации
+    транзакции: в каждую группу получателя отправляется одно событие со всеми
+    его уведомлениями и количеством непрочитанных уведомлений. При откате
+    транзакции или точки сохранения ее уведомления не отправляются.
+
+    Args:
+        notifications (Iterable[Notification]): сохраненные уведомления
+
+    """
+    notifications = [
+        notification
+        for notification in notifications
+        if notification.receiver_id is not None
+    ]
+    if not notifications:
+        return
+    data = NotificationSerializer(notifications, many=True).data
+    messages: dict[int, list] = {}
+    for notification, message in zip(notifications, data, strict=True):
+        messages.setdefault(notification.receiver_id, []).append(message)
+    _enqueue(messages)
+
+
+def dispatch_unread_count(user_ids: Iterable[int]) -> None:
+    """Отправить получателям количество непрочитанных уведомлений.
+
+    Отправка выполняется после фиксации транзакции вместе с уведомлениями.
+
+    Args:
+        user_ids (Iterable[int]): ID получателей
+
+    """
+    _enqueue({user_id: [] for user_id in user_ids})
+
+
+class Outbox:
+    """Уведомления блока atomic, ожидающие отправки.
+
+    Экземпляр регистрируется в transaction.on_commit при добавлении первой
+    пачки уведомлений в блоке atomic, поэтому при откате точки сохранения
+    Django удаляет его вместе с остальными обработчиками блока. Поток хранит
+    на буферы слабые ссылки по стеку точек сохранения: удаленный при откате
+    буфер уничтожается, и следующая пачка создает новый.
+    """
+
+    def __init__(self, key: tuple) -> None:
+        """Создать пустой буфер.
+
+        Args:
+            key (tuple): стек точек сохранения блока atomic
+
+        """
+        self.key = key
+        self.messages: dict[int, list] = {}
+
+    def add(self, messages: dict[int, list]) -> None:
+        """Добавить уведомления в буфер.
+
+        Args:
+            messages (dict[int, list]): уведомления по ID получателей
+
+        """
+        for user_id, items in messages.items():
+            self.messages.setdefault(user_id, []).extend(items)
+
+    def __call__(self) -> None:
+        """Отправить уведомления после фиксации транзакции."""
+        outboxes = getattr(_pending, "outboxes", {})
+        if outboxes.get(self.key) is self:
+            del outboxes[self.key]
+        try:
+            counts = Notification.get_unread_counts(list(self.messages))
+            async_to_sync(_send)(self.messages, counts)
+        except Exception as e:
+            logger.exception(e)
+
+
+def _enqueue(messages: dict[int, list]) -> None:
+    """Добавить уведомления в буфер текущего блока atomic.
+
+    Args:
+        messages (dict[int, list]): уведомления по ID получателей
+
+    """
+    key = tuple(transaction.get_connection().savepoint_ids)
+    if not hasattr(_pending, "outboxes"):
+        _pending.outboxes = weakref.WeakValueDictionary()
+    outbox = _pending.outboxes.get(key)
+    if outbox is None:
+        outbox = Outbox(key)
+        _pending.outboxes[key] = outbox
+        transaction.on_commit(outbox)
+    outbox.add(messages)
+
+
+async def _send(outbox: dict[int, list], counts: dict[int, int]) -> None:
+    """Отправить уведомления в группы получателей.
+
+    Args:
+        outbox (dict[int, list]): уведомления по ID получателей
+        counts (dict[int, int]): количество непрочитанных уведомлений
+
+    """
+    channel_layer = get_channel_layer()
+    user_ids = list(outbox)
+    for start in range(0, len(user_ids), MAX_CONCURRENT_SENDS):
+        await asyncio.gather(
+            *(
+                channel_layer.group_send(
+                    GROUP_NAME.format(user_id),
+                    {
+                        "type": "send_notifications",
+                        "messages": outbox[user_id],
+                        "unread_count": counts[user_id],
+                    },
+                )
+                for user_id in user_ids[start : start + MAX_CONCURRENT_SENDS]
+            )
+        )
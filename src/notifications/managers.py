@@ -0,0 +1,26 @@
+from django.db import models
+
+
+class NotificationManager(models.Manager):
+    """Менеджер модели уведомлений."""
+
+    def bulk_create(self, objs: list, *args: list, **kwargs: dict) -> list:
+        """Создать уведомления одним запросом и отправить их получателям.
+
+        Сигнал post_save при этом не вызывается, поэтому все уведомления
+        передаются диспетчеру одним вызовом.
+
+        Args:
+            objs (list): уведомления
+            *args (list): позиционные аргументы QuerySet.bulk_create
+            **kwargs (dict): именованные аргументы QuerySet.bulk_create
+
+        Returns:
+            list: созданные уведомления
+
+        """
+        from notifications.dispatcher import dispatch  # noqa: PLC0415
+
+        objs = super().bulk_create(objs, *args, **kwargs)
+        dispatch(objs)
+        return objs
@@ -0,0 +1,82 @@
+# Generated by Django 5.0.4 on 2026-10-18 15:15
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("notifications", "0002_notification_unread_idx"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ArchivedNotification",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "text",
+                    models.TextField(max_length=500, verbose_name="Текст уведомления"),
+                ),
+                (
+                    "link",
+                    models.URLField(
+                        blank=True, null=True, verbose_name="Ссылка на ресурс"
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(null=True, verbose_name="Время создания"),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(null=True, verbose_name="Время изменения"),
+                ),
+                (
+                    "read_at",
+                    models.DateTimeField(null=True, verbose_name="Время прочтения"),
+                ),
+                (
+                    "archived_at",
+                    models.DateTimeField(
+                        auto_now_add=True, verbose_name="Время архивации"
+                    ),
+                ),
+                (
+                    "receiver",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="Получатель уведомления",
+                    ),
+                ),
+                (
+                    "sender",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="Отправитель уведомления",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Архивное уведомление",
+                "verbose_name_plural": "Архивные уведомления",
+            },
+        ),
+    ]
@@ -4,6 +4,7 @@ from django.utils import timezone
 
 from core.abstract_models import TimeCreateUpdateModel
 from core.enums import Limits
+from notifications.managers import NotificationManager
 
 User = get_user_model()
 
@@ -41,12 +42,25 @@ class Notification(TimeCreateUpdateModel):
         blank=True,
     )
 
+    objects = NotificationManager()
+
     class Meta:
         """Настройки модели уведомлений."""
 
         verbose_name = "Уведомление"
         verbose_name_plural = "Уведомления"
         ordering = ["receiver", "-created_at"]  # noqa: RUF012
+        indexes = [  # noqa: RUF012
+            models.Index(
+                fields=["receiver", "created_at"],
+                name="notification_unread_idx",
+                condition=models.Q(read_at__isnull=True),
+            ),
+            models.Index(
+                fields=["receiver", "id"],
+                name="notification_receiver_id_idx",
+            ),
+        ]
 
     def __str__(self) -> str:
         """Получить строковое представление уведомления.
@@ -61,13 +75,58 @@ class Notification(TimeCreateUpdateModel):
         """Пометить прочитанным."""
         if not self.read:
             self.read_at = timezone.now()
-            self.save()
+            self.save(update_fields=["read_at", "updated_at"])
 
     def mark_as_unread(self) -> None:
         """Пометить не прочитанным."""
         if self.read:
             self.read_at = None
-            self.save()
+            self.save(update_fields=["read_at", "updated_at"])
+
+    @staticmethod
+    def mark_all_as_read(user_id: int, up_to: int | None = None) -> int:
+        """Пометить прочитанными непрочитанные уведомления пользователя.
+
+        Выполняется одним запросом UPDATE.
+
+        Args:
+            user_id (int): ID получателя
+            up_to (int | None): ID последнего помечаемого уведомления,
+                если не передан - помечаются все уведомления
+
+        Returns:
+            int: количество помеченных уведомлений
+
+        """
+        notifications = Notification.objects.filter(
+            receiver_id=user_id, read_at__isnull=True
+        )
+        if up_to is not None:
+            notifications = notifications.filter(id__lte=up_to)
+        now = timezone.now()
+        return notifications.update(read_at=now, updated_at=now)
+
+    @staticmethod
+    def get_unread_counts(user_ids: list[int]) -> dict[int, int]:
+        """Получить количество непрочитанных уведомлений пользователей.
+
+        Для всех пользователей выполняется один запрос к БД.
+
+        Args:
+            user_ids (list[int]): ID получателей
+
+        Returns:
+            dict[int, int]: количество непрочитанных уведомлений по ID получателя
+
+        """
+        counts = (
+            Notification.objects.filter(receiver_id__in=user_ids, read_at__isnull=True)
+            .order_by()
+            .values("receiver_id")
+            .annotate(count=models.Count("id"))
+            .values_list("receiver_id", "count")
+        )
+        return {user_id: 0 for user_id in user_ids} | dict(counts)
 
     @property
     def read(self) -> bool:
@@ -78,3 +137,55 @@ class Notification(TimeCreateUpdateModel):
 
         """
         return bool(self.read_at)
+
+
+class ArchivedNotification(models.Model):
+    """Архивное уведомление.
+
+    Прочитанные уведомления старше срока хранения переносятся сюда задачей
+    notifications.tasks.delete_old_notifications_task, чтобы таблица
+    уведомлений содержала только актуальные записи.
+    """
+
+    text = models.TextField(
+        "Текст уведомления",
+        max_length=Limits.MAX_LENGTH_NOTIFICATION_TEXT.value,
+    )
+    link = models.URLField(  # noqa: DJ001
+        "Ссылка на ресурс",
+        blank=True,
+        null=True,
+    )
+    sender = models.ForeignKey(
+        User,
+        verbose_name="Отправитель уведомления",
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name="+",
+    )
+    receiver = models.ForeignKey(
+        User,
+        verbose_name="Получатель уведомления",
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name="+",
+    )
+    created_at = models.DateTimeField("Время создания", null=True)
+    updated_at = models.DateTimeField("Время изменения", null=True)
+    read_at = models.DateTimeField("Время прочтения", null=True)
+    archived_at = models.DateTimeField("Время архивации", auto_now_add=True)
+
+    class Meta:
+        """Настройки модели архивных уведомлений."""
+
+        verbose_name = "Архивное уведомление"
+        verbose_name_plural = "Архивные уведомления"
+
+    def __str__(self) -> str:
+        """Получить строковое представление уведомления.
+
+        Returns:
+            str: строковое представление уведомления
+
+        """
+        return self.text[:30]
@@ -1,11 +1,9 @@
 from typing import Any
 
-from asgiref.sync import async_to_sync
-from channels.layers import get_channel_layer
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 
-from api.v1.serializers import NotificationSerializer
+from notifications.dispatcher import dispatch
 from notifications.models import Notification
 
 
@@ -16,7 +14,7 @@ def send_notification(
     created: bool,  # noqa: FBT001
     **kwargs  # noqa: ANN003, ARG001
 ) -> None:
-    """Отправить уведомление.
+    """Отправить уведомление после фиксации транзакции.
 
     Args:
         sender (Any): класс модели
@@ -26,9 +24,4 @@ def send_notification(
 
     """
     if created:
-        channel_layer = get_channel_layer()
-        group = instance.receiver.get_group_id()
-        serializer = NotificationSerializer(instance)
-        async_to_sync(channel_layer.group_send)(
-            group, {"type": "send_notification", "message": serializer.data}
-        )
+        dispatch([instance])
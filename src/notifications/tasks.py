@@ -0,0 +1,13 @@
+from celery import shared_task
+
+from notifications.utils import delete_old_notifications
+
+
+@shared_task
+def delete_old_notifications_task() -> None:
+    """Создать задачу по удалению прочитанных уведомлений старше срока хранения.
+
+    При включенной настройке NOTIFICATION_RETENTION_ARCHIVE уведомления
+    переносятся в архив.
+    """
+    delete_old_notifications()
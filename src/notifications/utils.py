@@ -0,0 +1,55 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from notifications.models import ArchivedNotification, Notification
+
+ARCHIVED_FIELDS = (
+    "text",
+    "link",
+    "sender_id",
+    "receiver_id",
+    "created_at",
+    "updated_at",
+    "read_at",
+)
+
+
+def delete_old_notifications() -> int:
+    """Удалить прочитанные уведомления старше срока хранения.
+
+    Уведомления удаляются пачками по NOTIFICATION_RETENTION_BATCH_SIZE записей,
+    каждая пачка - в отдельной транзакции, поэтому блокировки удерживаются
+    недолго. При включенной настройке NOTIFICATION_RETENTION_ARCHIVE
+    уведомления перед удалением переносятся в архив.
+
+    Returns:
+        int: количество удаленных уведомлений
+
+    """
+    cutoff = timezone.now() - timedelta(days=settings.NOTIFICATION_RETENTION_DAYS)
+    old_notifications = Notification.objects.filter(
+        read_at__isnull=False, created_at__lt=cutoff
+    ).order_by("created_at")
+    deleted = 0
+    while True:
+        with transaction.atomic():
+            batch = list(
+                old_notifications.select_for_update(skip_locked=True).values(
+                    "id", *ARCHIVED_FIELDS
+                )[: settings.NOTIFICATION_RETENTION_BATCH_SIZE]
+            )
+            if not batch:
+                return deleted
+            if settings.NOTIFICATION_RETENTION_ARCHIVE:
+                ArchivedNotification.objects.bulk_create(
+                    ArchivedNotification(
+                        **{field: row[field] for field in ARCHIVED_FIELDS}
+                    )
+                    for row in batch
+                )
+            deleted += Notification.objects.filter(
+                id__in=[row["id"] for row in batch]
+            ).delete()[0]
@@ -6,3 +6,7 @@ class ServicesConfig(AppConfig):
 
     default_auto_field = "django.db.models.BigAutoField"
     name = "services"
+
+    def ready(self) -> None:
+        """Запуск приложения."""
+        import services.signals  # noqa: F401, PLC0415
@@ -3,6 +3,7 @@ from django.db.models import Model, QuerySet
 from django_elasticsearch_dsl import Document, fields
 from django_elasticsearch_dsl.registries import registry
 
+from core.analyzers import search_text_field
 from core.choices import ServicePlace
 from services.models import Service
 
@@ -13,13 +14,17 @@ User = get_user_model()
 class ServiceDocument(Document):
     """Документ ElasticSearch для услуг."""
 
+    title = search_text_field()
+    description = search_text_field()
     provider = fields.ObjectField(
         properties={
             "email": fields.TextField(),
             "id": fields.IntegerField(),
         }
     )
-    place_of_provision = fields.TextField()
+    place_of_provision = fields.KeywordField()
+    category = fields.IntegerField(attr="category_ids", multi=True)
+    rating = fields.FloatField(attr="rating")
 
     def prepare_place_of_provision(self, instance: "ServiceDocument") -> str:
         """Преобразовать vесто оказания услуги в строку.
@@ -48,10 +53,10 @@ class ServiceDocument(Document):
         model = Service
         fields = [  # noqa: RUF012
             "id",
-            "title",
-            "description",
             "address",
             "salon_name",
+            "status",
+            "created_at",
         ]
 
         related_models = [User]  # noqa: RUF012
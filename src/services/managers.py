@@ -1,7 +1,9 @@
 from django.db import models
 
+from core.managers import AdvertisementManager
 
-class ServiceManager(models.Manager):
+
+class ServiceManager(AdvertisementManager):
     """Пользовательский менеджер для модели Услуг."""
 
     def get_queryset(self) -> models.QuerySet:
@@ -9,5 +11,5 @@ class ServiceManager(models.Manager):
             super()
             .get_queryset()
             .select_related("provider")
-            .prefetch_related("images", "comments")
+            .prefetch_related("images", "comments", "price_list_entries")
         )
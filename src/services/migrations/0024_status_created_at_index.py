@@ -0,0 +1,23 @@
+# Generated by Django 5.0.4 on 2026-10-18 14:09
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("categories", "0001_initial"),
+        ("services", "0023_remove_serviceimage_main_photo"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="service",
+            index=models.Index(
+                fields=["status", "-created_at", "-id"],
+                name="service_status_created_at_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,73 @@
+# Generated by Django 5.0.4 on 2026-10-18 14:17
+
+from django.db import migrations, models
+from django.db.models.functions import Coalesce
+
+
+def fill_rating_aggregates(apps, schema_editor):
+    ContentType = apps.get_model("contenttypes", "ContentType")
+    Comment = apps.get_model("comments", "Comment")
+    Service = apps.get_model("services", "Service")
+    content_type = ContentType.objects.filter(
+        app_label="services", model="service"
+    ).first()
+    if content_type is None:
+        return
+    published = (
+        Comment.objects.filter(
+            content_type=content_type,
+            object_id=models.OuterRef("pk"),
+            status=1,
+        )
+        .order_by()
+        .values("object_id")
+    )
+    count = models.Subquery(
+        published.annotate(count=models.Count("id")).values("count")
+    )
+    Service.objects.update(
+        rating_sum=Coalesce(
+            models.Subquery(published.annotate(sum=models.Sum("rating")).values("sum")),
+            0,
+        ),
+        rating_count=Coalesce(count, 0),
+        published_comments_count=Coalesce(count, 0),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("services", "0024_status_created_at_index"),
+        ("comments", "0009_alter_comment_status"),
+        ("contenttypes", "0002_remove_content_type_name"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="service",
+            name="published_comments_count",
+            field=models.PositiveIntegerField(
+                default=0,
+                editable=False,
+                verbose_name="Количество опубликованных комментариев",
+            ),
+        ),
+        migrations.AddField(
+            model_name="service",
+            name="rating_count",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="Количество оценок"
+            ),
+        ),
+        migrations.AddField(
+            model_name="service",
+            name="rating_sum",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="Сумма оценок"
+            ),
+        ),
+        migrations.RunPython(
+            fill_rating_aggregates, reverse_code=migrations.RunPython.noop
+        ),
+    ]
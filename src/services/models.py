@@ -45,6 +45,17 @@ class Service(AbstractAdvertisement):
         verbose_name = "Услуга"
         verbose_name_plural = "Услуги"
         ordering = ["-created_at"]  # noqa: RUF012
+        indexes = [  # noqa: RUF012
+            models.Index(
+                fields=["status", "-created_at", "-id"],
+                name="service_status_created_at_idx",
+            ),
+            models.Index(
+                fields=["category_path"],
+                name="service_category_path_idx",
+                opclasses=["varchar_pattern_ops"],
+            ),
+        ]
         default_related_name = "services"
 
 
@@ -0,0 +1,48 @@
+from django.db.models import Model
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from core.cache import SERVICES, invalidate
+from services.models import Service, ServiceImage, SubService
+
+
+@receiver(post_save, sender=Service)
+@receiver(post_delete, sender=Service)
+@receiver(post_save, sender=ServiceImage)
+@receiver(post_delete, sender=ServiceImage)
+@receiver(post_save, sender=SubService)
+@receiver(post_delete, sender=SubService)
+@receiver(m2m_changed, sender=Service.category.through)
+def invalidate_services_cache(
+    sender: Model, instance: Model, **kwargs: dict  # noqa: ARG001
+) -> None:
+    """Сбросить закэшированные ответы, зависящие от услуг."""
+    invalidate(SERVICES)
+
+
+@receiver(m2m_changed, sender=Service.category.through)
+def update_service_category_path(
+    sender: Model,  # noqa: ARG001
+    instance: Model,
+    action: str,
+    reverse: bool,  # noqa: FBT001
+    pk_set: set[int] | None,
+    **kwargs: dict,  # noqa: ARG001
+) -> None:
+    """Обновить путь категории после изменения категорий.
+
+    При очистке связей со стороны категории pk_set не передается, поэтому
+    ID затронутых объектов запоминаются до очистки.
+    """
+    if reverse and action == "pre_clear":
+        instance._cleared_service_ids = list(
+            instance.services.values_list("pk", flat=True)
+        )
+        return
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if reverse and action == "post_clear":
+        pk_set = set(instance.__dict__.pop("_cleared_service_ids", ()))
+    objects = Service.objects.filter(pk__in=pk_set or ()) if reverse else [instance]
+    for obj in objects:
+        obj.update_category_path()
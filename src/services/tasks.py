@@ -4,6 +4,7 @@ from core.utils import (
     delete_image_files,
     delete_images_dir,
     notify_about_moderation,
+    update_search_documents,
 )
 
 
@@ -38,3 +39,15 @@ def notify_about_moderation_task(url: str) -> None:
 
     """
     notify_about_moderation(url=url)
+
+
+@shared_task
+def update_search_documents_task(label: str, pks: list[int]) -> None:
+    """Отложенная задача по обновлению документов поиска.
+
+    Args:
+        label (str): модель в формате "app_label.ModelName"
+        pks (list[int]): ID объектов
+
+    """
+    update_search_documents(label=label, pks=pks)
@@ -0,0 +1,138 @@
+from itertools import islice
+
+from django.test import override_settings
+
+from ads.models import Ad
+from chat.models import Chat, Message
+from comments.models import Comment
+from core.choices import AdvertisementStatus, CommentStatus
+from core.content_types import get_content_type
+from services.models import Service
+from tests import factories
+from users.models import CustomUser, Favorites
+
+BATCH_SIZE = 5000
+COMMENT_TEXT = "Отличный исполнитель, все сделано в срок и качественно."
+MESSAGE_TEXT = "Здравствуйте! Объявление еще актуально?"
+
+
+def bulk_create(model, objects):
+    iterator = iter(objects)
+    while batch := list(islice(iterator, BATCH_SIZE)):
+        model.objects.bulk_create(batch)
+
+
+@override_settings(PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"])
+def seed(volumes):
+    """Заполнить БД данными для нагрузочных тестов.
+
+    Экземпляры строятся фабриками из tests/factories.py без сохранения
+    и записываются в БД пачками. Сигналы моделей при этом не вызываются,
+    поэтому агрегаты рейтинга и пути категорий заполняются отдельно.
+
+    Args:
+        volumes (dict): количество пользователей, объявлений, услуг,
+            комментариев, избранного, чатов и сообщений в чате
+
+    Returns:
+        dict: объекты, по которым выполняются запросы
+
+    """
+    bulk_create(
+        CustomUser,
+        (factories.CustomUserFactory.build() for _ in range(volumes["users"])),
+    )
+    users = list(CustomUser.objects.only("id"))
+    root = factories.CategoryFactory()
+    category = factories.CategoryFactory(parent=root)
+
+    subjects = []
+    for factory, model, volume in (
+        (factories.AdFactory, Ad, volumes["ads"]),
+        (factories.ServiceFactory, Service, volumes["services"]),
+    ):
+        bulk_create(
+            model,
+            (
+                factory.build(
+                    provider=users[i % len(users)],
+                    status=AdvertisementStatus.PUBLISHED,
+                    category_path=category.path,
+                )
+                for i in range(volume)
+            ),
+        )
+        ids = list(model.objects.values_list("id", flat=True))
+        through = model.category.through
+        bulk_create(
+            through,
+            (
+                through(**{f"{model._meta.model_name}_id": pk, "category_id": cat})
+                for pk in ids
+                for cat in category.ancestor_ids
+            ),
+        )
+        content_type_id = get_content_type(model).id
+        subjects += [(content_type_id, pk) for pk in ids]
+
+    comments_per_subject = max(volumes["comments"] // len(subjects), 1)
+    bulk_create(
+        Comment,
+        (
+            factories.CommentFactory.build(
+                author=users[(i + k + 1) % len(users)],
+                content_type_id=content_type_id,
+                object_id=object_id,
+                status=CommentStatus.PUBLISHED,
+                feedback=COMMENT_TEXT,
+            )
+            for i, (content_type_id, object_id) in enumerate(subjects)
+            for k in range(comments_per_subject)
+        ),
+    )
+    Ad.rebuild_ratings()
+    Service.rebuild_ratings()
+
+    favorites_per_user = min(volumes["favorites"] // len(users), len(subjects))
+    bulk_create(
+        Favorites,
+        (
+            Favorites(
+                user=user,
+                content_type_id=subjects[(u + k) % len(subjects)][0],
+                object_id=subjects[(u + k) % len(subjects)][1],
+            )
+            for u, user in enumerate(users)
+            for k in range(favorites_per_user)
+        ),
+    )
+
+    user = CustomUser.objects.get(pk=users[0].pk)
+    own_ad = Ad.objects.filter(provider=user).first()
+    bulk_create(
+        Chat,
+        (
+            Chat(
+                room_group_name=f"benchmark_{buyer.pk}",
+                content_type=get_content_type(Ad),
+                object_id=own_ad.id,
+                seller=user,
+                buyer=buyer,
+            )
+            for buyer in users[1 : volumes["chats"] + 1]
+        ),
+    )
+    bulk_create(
+        Message,
+        (
+            Message(chat_id=chat_id, sender=user, message=MESSAGE_TEXT)
+            for chat_id in Chat.objects.values_list("id", flat=True)
+            for _ in range(volumes["messages_per_chat"])
+        ),
+    )
+    return {
+        "user": user,
+        "ad": Ad.objects.exclude(provider=user).first(),
+        "service": Service.objects.exclude(provider=user).first(),
+        "category": root,
+    }
@@ -0,0 +1,188 @@
+"""Нагрузочные тесты публичного API.
+
+Тесты пропускаются при обычном запуске. Для запуска:
+
+    BENCHMARK=1 python manage.py test tests.benchmarks --settings config.settings.test
+
+Переменные окружения:
+    BENCHMARK_SCALE - множитель объема данных (по умолчанию 1: 50 тыс. объявлений,
+        50 тыс. услуг, 500 тыс. комментариев, 1 млн записей избранного);
+    BENCHMARK_REPEAT - количество замеров времени ответа на эндпоинт;
+    BENCHMARK_TOLERANCE - допустимое превышение времени ответа и памяти
+        относительно базовых значений (0.25 - на 25%);
+    BENCHMARK_UPDATE - записать результаты в baselines.json.
+
+Количество запросов к БД сравнивается с базовым значением всегда, время ответа
+и пиковая память - только если базовые значения записаны для того же объема
+данных. Результаты замеров выводятся в лог tests.benchmarks.
+
+Поиск замеряется без ElasticSearch: ответ кластера подменяется страницей
+документов, подготовленных из БД, поэтому замер /search включает обработку
+запроса, сериализацию и запросы к БД, но не время работы кластера.
+"""
+
+import json
+import logging
+import tracemalloc
+from os import getenv
+from pathlib import Path
+from statistics import quantiles
+from time import perf_counter
+from unittest import skipUnless
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from elasticsearch_dsl import Search
+from elasticsearch_dsl.response import Response
+from rest_framework.test import APIClient, APITestCase
+
+from ads.documents import AdDocument
+from api.v1.paginators import SearchPaginator
+from services.documents import ServiceDocument
+from tests.benchmarks.seed import seed
+
+logger = logging.getLogger(__name__)
+
+BASELINES_FILE = Path(__file__).parent / "baselines.json"
+DEFAULT_VOLUMES = {
+    "users": 2000,
+    "ads": 50_000,
+    "services": 50_000,
+    "comments": 500_000,
+    "favorites": 1_000_000,
+    "chats": 100,
+    "messages_per_chat": 20,
+}
+MIN_USERS = 20
+SCALE = float(getenv("BENCHMARK_SCALE", "1"))
+REPEAT = int(getenv("BENCHMARK_REPEAT", "20"))
+TOLERANCE = float(getenv("BENCHMARK_TOLERANCE", "0.25"))
+
+
+@skipUnless(getenv("BENCHMARK"), "Нагрузочные тесты запускаются с BENCHMARK=1")
+class APIBenchmark(APITestCase):
+    """Замеры количества запросов, времени ответа и памяти эндпоинтов API."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        volumes = {
+            name: max(round(volume * SCALE), 1)
+            for name, volume in DEFAULT_VOLUMES.items()
+        }
+        volumes["users"] = max(volumes["users"], MIN_USERS)
+        cls.data = seed(volumes)
+        cls.client_auth = APIClient()
+        cls.client_auth.force_authenticate(cls.data["user"])
+        cls.client_anon = APIClient()
+        cls.search_hits = cls.get_search_hits()
+
+    @classmethod
+    def get_search_hits(cls):
+        """Подготовить из БД страницу документов для ответа поиска."""
+        hits = []
+        for document in (AdDocument, ServiceDocument):
+            doc = document()
+            queryset = doc.get_queryset().order_by("-id")
+            for obj in queryset[: SearchPaginator.page_size + 1]:
+                hits.append(
+                    {
+                        "_index": document.Index.name,
+                        "_id": str(obj.pk),
+                        "_score": 1.0,
+                        "_source": doc.prepare(obj),
+                        "sort": [1.0, document.Index.name, obj.pk],
+                    }
+                )
+        return hits
+
+    def execute_search(self, search):
+        """Получить ответ поиска без обращения к ElasticSearch."""
+        data = {
+            "hits": {
+                "total": {"value": len(self.search_hits), "relation": "eq"},
+                "hits": self.search_hits,
+            },
+            "aggregations": {name: {"buckets": []} for name in search.aggs},
+        }
+        return Response(search, data)
+
+    def get_endpoints(self):
+        ad, service = self.data["ad"], self.data["service"]
+        endpoints = {
+            "advertisements": (self.client_auth, reverse("advertisements")),
+            "advertisements_by_category": (
+                self.client_anon,
+                reverse("advertisements") + f"?category_id={self.data['category'].id}",
+            ),
+            "ad": (self.client_auth, reverse("ads-detail", kwargs={"pk": ad.id})),
+            "service": (
+                self.client_auth,
+                reverse("services-detail", kwargs={"pk": service.id}),
+            ),
+            "comments": (
+                self.client_anon,
+                reverse("comments-list", kwargs={"type": "ad", "obj_id": ad.id}),
+            ),
+            "favorites": (self.client_auth, reverse("favorite-list")),
+            "chats": (self.client_auth, reverse("chats-list")),
+            "search": (self.client_auth, "/api/v1/search?search=service"),
+        }
+        return endpoints
+
+    def measure(self, client, url):
+        cache.clear()
+        tracemalloc.start()
+        with CaptureQueriesContext(connection) as context:
+            response = client.get(url)
+        queries = len(context.captured_queries)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        self.assertEqual(response.status_code, 200, url)
+        timings = []
+        for _ in range(max(REPEAT, 2)):
+            cache.clear()
+            start = perf_counter()
+            client.get(url)
+            timings.append((perf_counter() - start) * 1000)
+        percentiles = quantiles(timings, n=100, method="inclusive")
+        return {
+            "queries": queries,
+            "p50_ms": round(percentiles[49], 2),
+            "p99_ms": round(percentiles[98], 2),
+            "peak_kb": round(peak / 1024),
+        }
+
+    def test_endpoints_do_not_regress(self):
+        baselines = json.loads(BASELINES_FILE.read_text())
+        compare_timings = baselines["scale"] == SCALE
+        results = {}
+        with patch.object(Search, "execute", autospec=True) as execute:
+            execute.side_effect = self.execute_search
+            for name, (client, url) in self.get_endpoints().items():
+                results[name] = self.measure(client, url)
+                logger.info("%s: %s", name, results[name])
+                baseline = baselines["endpoints"].get(name)
+                if baseline is None:
+                    continue
+                with self.subTest(endpoint=name):
+                    self.assertLessEqual(results[name]["queries"], baseline["queries"])
+                    if compare_timings:
+                        for metric in ("p99_ms", "peak_kb"):
+                            self.assertLessEqual(
+                                results[name][metric],
+                                baseline[metric] * (1 + TOLERANCE),
+                                metric,
+                            )
+        if getenv("BENCHMARK_UPDATE"):
+            BASELINES_FILE.write_text(
+                json.dumps(
+                    {"scale": SCALE, "endpoints": results},
+                    ensure_ascii=False,
+                    indent=4,
+                )
+                + "\n"
+            )
@@ -3,12 +3,15 @@ import tempfile
 
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.test import override_settings
 from rest_framework.test import APIClient, APITestCase
 
 from ads.models import AdImage
+from chat.models import Chat, Message
 from core.choices import AdState, AdvertisementStatus, CommentStatus, Role
+from core.content_types import get_content_type
 from services.models import ServiceImage
 from tests import factories
 from users.models import Favorites
@@ -52,6 +55,10 @@ class BaseTestCase(APITestCase):
             "btEAAAAASUVORK5CYII="
         )
 
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
     @classmethod
     def tearDownClass(cls):
         super().tearDownClass()
@@ -370,3 +377,37 @@ class TestAdvertisementsFixtures(TestUserFixtures):
             provider=cls.user_3, status=AdvertisementStatus.DRAFT.value
         )
         cls.ad_3.category.set([cls.category_1])
+
+
+class TestChatFixtures(TestUserFixtures):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.ad = factories.AdFactory(
+            provider=cls.user_2, status=AdvertisementStatus.PUBLISHED.value
+        )
+        cls.service = factories.ServiceFactory(
+            provider=cls.user_3, status=AdvertisementStatus.PUBLISHED.value
+        )
+        cls.chat_1 = Chat.objects.create(
+            room_group_name=f"chat_ad_{cls.ad.id}_{cls.user_1.id}",
+            content_type=get_content_type(cls.ad),
+            object_id=cls.ad.id,
+            seller=cls.user_2,
+            buyer=cls.user_1,
+        )
+        cls.chat_2 = Chat.objects.create(
+            room_group_name=f"chat_service_{cls.service.id}_{cls.user_1.id}",
+            content_type=get_content_type(cls.service),
+            object_id=cls.service.id,
+            seller=cls.user_3,
+            buyer=cls.user_1,
+        )
+        messages = [
+            Message.objects.create(chat=cls.chat_1, sender=cls.user_1, message="1"),
+            Message.objects.create(chat=cls.chat_1, sender=cls.user_2, message="2"),
+            Message.objects.create(chat=cls.chat_1, sender=cls.user_2, message="3"),
+            Message.objects.create(chat=cls.chat_2, sender=cls.user_1, message="4"),
+        ]
+        Chat.add_messages(messages)
+        cls.last_message = messages[2]
@@ -1,6 +1,22 @@
+import asyncio
+
+from asgiref.sync import async_to_sync, sync_to_async
+from channels.layers import get_channel_layer
+from channels.routing import URLRouter
 from channels.testing import WebsocketCommunicator
+from django.db import IntegrityError, connection, transaction
+from django.test import TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 
+from chat import presence
+from chat.models import Chat, Message
+from chat.routing import chat_urlpatterns
+from core.choices import AdvertisementStatus
+from core.content_types import get_content_type
+from core.enums import Limits
 from notifications.consumers import NotificationConsumer
+from notifications.models import Notification
+from tests import factories
 from tests.fixtures import TestUserFixtures
 
 
@@ -27,3 +43,272 @@ class NotificationConsumerTest(TestUserFixtures):
         connected, _ = await communicator.connect()
         self.assertTrue(connected)
         await communicator.disconnect()
+
+    async def test_replay_since(self):
+        notifications = await sync_to_async(factories.NotificationFactory.create_batch)(
+            3, receiver=self.user_1
+        )
+        communicator = WebsocketCommunicator(
+            NotificationConsumer.as_asgi(),
+            f"ws/notifications/?since={notifications[0].id}",
+        )
+        communicator.scope["user"] = self.user_1
+        connected, _ = await communicator.connect()
+        self.assertTrue(connected)
+        replayed = [await communicator.receive_json_from() for _ in range(2)]
+        self.assertEqual(
+            [message["id"] for message in replayed],
+            [notification.id for notification in notifications[1:]],
+        )
+        self.assertEqual(
+            await communicator.receive_json_from(),
+            {"type": "replay", "has_more": False},
+        )
+        await communicator.send_json_to(
+            {"type": "replay", "since": notifications[-1].id}
+        )
+        self.assertEqual(
+            await communicator.receive_json_from(),
+            {"type": "replay", "has_more": False},
+        )
+        await communicator.disconnect()
+
+    async def receive(self, channel_layer, channel):
+        async with asyncio.timeout(0.1):
+            return await channel_layer.receive(channel)
+
+
+class NotificationDispatchTest(TransactionTestCase):
+    def setUp(self):
+        self.user_1 = factories.CustomUserFactory()
+        self.user_2 = factories.CustomUserFactory()
+        self.channel_layer = get_channel_layer()
+        self.channel = async_to_sync(self.channel_layer.new_channel)()
+        async_to_sync(self.channel_layer.group_add)(
+            self.user_1.get_group_id(), self.channel
+        )
+
+    def receive(self):
+        async def receive():
+            async with asyncio.timeout(0.1):
+                return await self.channel_layer.receive(self.channel)
+
+        return async_to_sync(receive)()
+
+    def test_notifications_are_sent_once_per_receiver_after_commit(self):
+        with transaction.atomic():
+            factories.NotificationFactory(receiver=self.user_1, text="first")
+            Notification.objects.bulk_create(
+                [
+                    Notification(receiver=self.user_1, text="second"),
+                    Notification(receiver=self.user_2, text="other"),
+                ]
+            )
+            with self.assertRaises(asyncio.TimeoutError):
+                self.receive()
+
+        event = self.receive()
+        self.assertEqual(event["type"], "send_notifications")
+        self.assertEqual(
+            [message["text"] for message in event["messages"]], ["first", "second"]
+        )
+        self.assertEqual(
+            event["unread_count"],
+            Notification.objects.filter(
+                receiver=self.user_1, read_at__isnull=True
+            ).count(),
+        )
+        with self.assertRaises(asyncio.TimeoutError):
+            self.receive()
+
+    def test_notifications_are_sent_after_rolled_back_transaction(self):
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            factories.NotificationFactory(receiver=self.user_1, text="rolled back")
+            raise IntegrityError
+        with transaction.atomic():
+            factories.NotificationFactory(receiver=self.user_1, text="committed")
+
+        event = self.receive()
+        self.assertEqual(
+            [message["text"] for message in event["messages"]], ["committed"]
+        )
+        with self.assertRaises(asyncio.TimeoutError):
+            self.receive()
+
+    def test_notifications_of_rolled_back_savepoint_are_not_sent(self):
+        with transaction.atomic():
+            factories.NotificationFactory(receiver=self.user_1, text="outer")
+            with self.assertRaises(IntegrityError), transaction.atomic():
+                factories.NotificationFactory(receiver=self.user_1, text="inner")
+                raise IntegrityError
+            with transaction.atomic():
+                factories.NotificationFactory(receiver=self.user_1, text="nested")
+
+        texts = [message["text"] for message in self.receive()["messages"]]
+        texts += [message["text"] for message in self.receive()["messages"]]
+        self.assertEqual(texts, ["outer", "nested"])
+        with self.assertRaises(asyncio.TimeoutError):
+            self.receive()
+
+
+class ChatConsumerTest(TestUserFixtures):
+    def setUp(self):
+        super().setUp()
+        ad = factories.AdFactory(
+            provider=self.user_2, status=AdvertisementStatus.PUBLISHED
+        )
+        self.url = f"ws/chat/ad/{ad.id}/{self.user_1.id}/"
+        self.chat = Chat.objects.create(
+            room_group_name=f"chat_ad_{ad.id}_{self.user_1.id}",
+            content_type=get_content_type(ad),
+            object_id=ad.id,
+            seller=self.user_2,
+            buyer=self.user_1,
+        )
+        self.messages = Message.objects.bulk_create(
+            Message(chat=self.chat, sender=self.user_1, message=f"message_{i}")
+            for i in range(Limits.CHAT_HISTORY_PAGE_SIZE + 5)
+        )
+
+    async def connect(self, user=None):
+        communicator = WebsocketCommunicator(URLRouter(chat_urlpatterns), self.url)
+        communicator.scope["user"] = user or self.user_1
+        connected, _ = await communicator.connect()
+        self.assertTrue(connected)
+        messages = await communicator.receive_json_from()
+        presence = await communicator.receive_json_from()
+        self.assertEqual(presence["type"], "presence")
+        return communicator, messages
+
+    async def test_connect_sends_last_messages(self):
+        communicator, messages = await self.connect()
+        self.assertEqual(
+            [message["id"] for message in messages],
+            [message.id for message in self.messages[-Limits.CHAT_HISTORY_PAGE_SIZE :]],
+        )
+        await communicator.disconnect()
+
+    def test_connect_queries(self):
+        async def connect():
+            communicator, _ = await self.connect()
+            await communicator.disconnect()
+
+        with CaptureQueriesContext(connection) as context:
+            async_to_sync(connect)()
+        self.assertEqual(len(context.captured_queries), 2)
+
+    async def test_seller_connect_without_chat(self):
+        ad = await sync_to_async(factories.AdFactory)(
+            provider=self.user_2, status=AdvertisementStatus.PUBLISHED
+        )
+        communicator = WebsocketCommunicator(
+            URLRouter(chat_urlpatterns), f"ws/chat/ad/{ad.id}/{self.user_1.id}/"
+        )
+        communicator.scope["user"] = self.user_2
+        connected, _ = await communicator.connect()
+        self.assertFalse(connected)
+
+    async def test_history(self):
+        communicator, messages = await self.connect()
+        await communicator.send_json_to(
+            {"type": "history", "before": messages[0]["id"]}
+        )
+        page = await communicator.receive_json_from()
+        self.assertEqual(page["type"], "history")
+        self.assertFalse(page["has_more"])
+        self.assertEqual(
+            [message["id"] for message in page["messages"]],
+            [message.id for message in self.messages[:5]],
+        )
+        await communicator.send_json_to({"type": "history", "before": "wrong"})
+        page = await communicator.receive_json_from()
+        self.assertEqual(page["messages"], [])
+        await communicator.disconnect()
+
+    @override_settings(CHAT_WRITE_BEHIND=True, CHAT_WRITE_BEHIND_BATCH_SIZE=2)
+    async def test_write_behind(self):
+        communicator, _ = await self.connect()
+        count = sync_to_async(Message.objects.count)
+        initial = await count()
+
+        await communicator.send_json_to({"message": "first"})
+        first = await communicator.receive_json_from()
+        self.assertGreater(first["id"], self.messages[-1].id)
+        self.assertEqual(await count(), initial)
+
+        await communicator.send_json_to({"message": "second"})
+        second = await communicator.receive_json_from()
+        self.assertGreater(second["id"], first["id"])
+        self.assertEqual(await count(), initial + 2)
+
+        await communicator.send_json_to({"message": "third"})
+        third = await communicator.receive_json_from()
+        await communicator.disconnect()
+        message = await Message.objects.aget(pk=third["id"])
+        self.assertEqual(message.message, "third")
+        self.assertEqual(
+            message.created_at.isoformat().replace("+00:00", "Z"),
+            third["created_at"],
+        )
+
+    async def test_mark_as_read(self):
+        communicator, _ = await self.connect()
+        seller, _ = await self.connect(self.user_2)
+        await communicator.receive_json_from()
+
+        await communicator.send_json_to({"message": "new"})
+        message = await communicator.receive_json_from()
+        await seller.receive_json_from()
+        chat = await Chat.objects.aget(pk=self.chat.pk)
+        self.assertEqual(chat.seller_unread, 1)
+        self.assertEqual(chat.last_message_id, message["id"])
+
+        await seller.send_json_to({"type": "read"})
+        read = {"type": "read", "user_id": self.user_2.id, "message": message["id"]}
+        self.assertEqual(await communicator.receive_json_from(), read)
+        self.assertEqual(await seller.receive_json_from(), read)
+        chat = await Chat.objects.aget(pk=self.chat.pk)
+        self.assertEqual(chat.seller_unread, 0)
+        self.assertEqual(chat.seller_last_read, message["id"])
+        await communicator.disconnect()
+        await seller.disconnect()
+
+    async def test_presence(self):
+        communicator, _ = await self.connect()
+        seller, _ = await self.connect(self.user_2)
+        self.assertEqual(
+            await communicator.receive_json_from(),
+            {
+                "type": "presence",
+                "user_id": self.user_2.id,
+                "online": True,
+                "last_seen": None,
+            },
+        )
+        self.assertEqual(
+            await sync_to_async(presence.get_presence)([self.user_1.id]),
+            {self.user_1.id: {"online": True, "last_seen": None}},
+        )
+
+        await seller.disconnect()
+        offline = await communicator.receive_json_from()
+        self.assertEqual(offline["user_id"], self.user_2.id)
+        self.assertFalse(offline["online"])
+        self.assertIsNotNone(offline["last_seen"])
+        await communicator.disconnect()
+
+    async def test_typing_is_coalesced(self):
+        communicator, _ = await self.connect()
+        seller, _ = await self.connect(self.user_2)
+        await communicator.receive_json_from()
+
+        for _ in range(3):
+            await communicator.send_json_to({"type": "typing"})
+        self.assertEqual(
+            await seller.receive_json_from(),
+            {"type": "typing", "user_id": self.user_1.id},
+        )
+        self.assertTrue(await seller.receive_nothing())
+        self.assertTrue(await communicator.receive_nothing())
+        await communicator.disconnect()
+        await seller.disconnect()
@@ -0,0 +1,28 @@
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from tests.fixtures import TestAdvertisementsFixtures
+
+
+class TestProfilingMiddleware(TestAdvertisementsFixtures):
+    def test_profiling_is_disabled_by_default(self):
+        response = self.anon_client.get(reverse("advertisements"))
+        self.assertNotIn("Server-Timing", response.headers)
+
+    @override_settings(PROFILING_ENABLED=True, PROFILING_MAX_QUERIES=1)
+    def test_profiled_request_has_server_timing_header(self):
+        client = APIClient()
+        with self.assertLogs("core.middleware", level="WARNING") as logs:
+            response = client.get(reverse("advertisements"))
+        self.assertRegex(
+            response.headers["Server-Timing"],
+            r'^db;dur=[\d.]+;desc="[1-9]\d* queries", '
+            r"serializer;dur=[\d.]+, total;dur=[\d.]+$",
+        )
+        self.assertIn('"too_many_queries": true', logs.output[0])
+
+    @override_settings(PROFILING_ENABLED=True, PROFILING_SAMPLE_RATE=0)
+    def test_request_out_of_sample_is_not_profiled(self):
+        response = APIClient().get(reverse("advertisements"))
+        self.assertNotIn("Server-Timing", response.headers)
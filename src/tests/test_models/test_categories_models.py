@@ -0,0 +1,93 @@
+from unittest.mock import patch
+
+from ads.models import Ad
+from categories.models import Category
+from services.models import Service
+from tests.factories import AdFactory, CategoryFactory, ServiceFactory
+from tests.fixtures import BaseTestCase
+
+
+class CategoryModelsTest(BaseTestCase):
+    """Класс для тестирования моделей приложения categories."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.root = CategoryFactory()
+        cls.child = CategoryFactory(parent=cls.root)
+        cls.grandchild = CategoryFactory(parent=cls.child)
+        cls.other_root = CategoryFactory()
+
+    def test_category_path_contains_ancestors(self):
+        self.assertEqual(
+            Category.objects.get(pk=self.grandchild.pk).path,
+            f"{self.root.pk}/{self.child.pk}/{self.grandchild.pk}/",
+        )
+        self.assertEqual(
+            self.grandchild.ancestor_ids,
+            [self.root.pk, self.child.pk, self.grandchild.pk],
+        )
+
+    def test_get_ancestors_and_descendants(self):
+        with self.assertNumQueries(1):
+            ancestors = list(self.grandchild.get_ancestors())
+        self.assertEqual(ancestors, [self.root, self.child, self.grandchild])
+        with self.assertNumQueries(1):
+            descendants = list(self.root.get_descendants())
+        self.assertEqual(descendants, [self.child, self.grandchild])
+
+    def test_moving_category_updates_subtree_paths(self):
+        child = CategoryFactory(parent=self.root)
+        grandchild = CategoryFactory(parent=child)
+        child.parent = self.other_root
+        child.save()
+        self.assertEqual(
+            Category.objects.get(pk=grandchild.pk).path,
+            f"{self.other_root.pk}/{child.pk}/{grandchild.pk}/",
+        )
+        self.assertNotIn(grandchild, self.root.get_descendants())
+
+    def test_moving_category_updates_advertisement_category_path(self):
+        child = CategoryFactory(parent=self.root)
+        grandchild = CategoryFactory(parent=child)
+        ad = AdFactory()
+        ad.category.add(*grandchild.ancestor_ids)
+        self.assertEqual(Ad.objects.get(pk=ad.pk).category_path, grandchild.path)
+        child.parent = self.other_root
+        child.save()
+        self.assertEqual(
+            Ad.objects.get(pk=ad.pk).category_path,
+            Category.objects.get(pk=grandchild.pk).path,
+        )
+
+    def test_deleting_category_updates_advertisement_category_path(self):
+        child = CategoryFactory(parent=self.root)
+        grandchild = CategoryFactory(parent=child)
+        ad = AdFactory()
+        ad.category.add(*grandchild.ancestor_ids)
+        grandchild.delete()
+        self.assertEqual(Ad.objects.get(pk=ad.pk).category_path, child.path)
+
+    def test_clearing_category_updates_advertisement_category_path(self):
+        child = CategoryFactory(parent=self.root)
+        ad = AdFactory()
+        service = ServiceFactory()
+        ad.category.add(self.root, child)
+        service.category.add(self.root, child)
+        child.ads.clear()
+        child.services.clear()
+        self.assertEqual(Ad.objects.get(pk=ad.pk).category_path, self.root.path)
+        self.assertEqual(
+            Service.objects.get(pk=service.pk).category_path, self.root.path
+        )
+
+    @patch("core.search_index.apps.is_installed", return_value=True)
+    @patch("core.search_index.update_search_documents_task")
+    def test_moving_category_updates_search_documents(self, task, _):
+        child = CategoryFactory(parent=self.root)
+        ad = AdFactory()
+        ad.category.add(child)
+        with self.captureOnCommitCallbacks(execute=True):
+            child.parent = self.other_root
+            child.save()
+        task.delay.assert_called_once_with("ads.Ad", [ad.pk])
@@ -0,0 +1,20 @@
+from chat.models import Chat, Message
+from tests.fixtures import TestChatFixtures
+
+
+class ChatModelTest(TestChatFixtures):
+    """Класс для тестирования модели чата."""
+
+    def test_add_messages_out_of_order(self):
+        unread = Chat.objects.get(pk=self.chat_1.pk).seller_unread
+        first, second = (
+            Message.objects.create(chat=self.chat_1, sender=self.user_1, message=text)
+            for text in ("first", "second")
+        )
+        Chat.add_messages([second])
+        Chat.add_messages([first])
+
+        chat = Chat.objects.get(pk=self.chat_1.pk)
+        self.assertEqual(chat.last_message_id, second.id)
+        self.assertEqual(chat.last_message_at, second.created_at)
+        self.assertEqual(chat.seller_unread, unread + 2)
@@ -1,6 +1,12 @@
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
 from django.db import IntegrityError
 
-from comments.models import CommentImage
+from comments.models import Comment, CommentImage
+from core.choices import CommentStatus
+from services.models import Service
 from tests import factories
 from tests.fixtures import BaseTestCase
 
@@ -43,3 +49,95 @@ class CommentModelsTest(BaseTestCase):
     def test_author_can_create_only_one_comment(self):
         with self.assertRaises(IntegrityError):
             factories.CommentFactory(subject=self.service_1, author=self.author_1)
+
+    def test_comment_approval_updates_subject_rating(self):
+        service = factories.ServiceFactory()
+        comment = factories.CommentFactory(subject=service, rating=4)
+        service.refresh_from_db()
+        self.assertIsNone(service.rating)
+        comment.approve()
+        service.refresh_from_db()
+        self.assertEqual(service.rating, 4)
+        self.assertEqual(service.published_comments_count, 1)
+
+    def test_comment_rejection_does_not_change_subject_rating(self):
+        service = factories.ServiceFactory()
+        comment = factories.CommentFactory(subject=service)
+        comment.reject()
+        service.refresh_from_db()
+        self.assertEqual(service.rating_count, 0)
+        self.assertEqual(service.published_comments_count, 0)
+
+    def test_published_comment_deletion_updates_subject_rating(self):
+        service = factories.ServiceFactory()
+        factories.CommentFactory(
+            subject=service, rating=2, status=CommentStatus.PUBLISHED
+        )
+        comment = factories.CommentFactory(
+            subject=service, rating=5, status=CommentStatus.PUBLISHED
+        )
+        service.refresh_from_db()
+        self.assertEqual(service.rating, 3.5)
+        comment.delete()
+        service.refresh_from_db()
+        self.assertEqual(service.rating, 2)
+        self.assertEqual(service.published_comments_count, 1)
+
+    def test_author_deletion_updates_subject_rating(self):
+        service = factories.ServiceFactory()
+        factories.CommentFactory(
+            subject=service, rating=2, status=CommentStatus.PUBLISHED
+        )
+        comment = factories.CommentFactory(
+            subject=service, rating=5, status=CommentStatus.PUBLISHED
+        )
+        comment.author.delete()
+        service.refresh_from_db()
+        self.assertEqual(service.rating, 2)
+        self.assertEqual(service.rating_count, 1)
+        self.assertEqual(service.published_comments_count, 1)
+
+    def test_published_comment_rating_change_updates_subject_rating(self):
+        service = factories.ServiceFactory()
+        factories.CommentFactory(
+            subject=service, rating=2, status=CommentStatus.PUBLISHED
+        )
+        comment = Comment.objects.get(
+            pk=factories.CommentFactory(
+                subject=service, rating=4, status=CommentStatus.PUBLISHED
+            ).pk
+        )
+        comment.rating = 5
+        comment.save()
+        service.refresh_from_db()
+        self.assertEqual(service.rating, 3.5)
+        self.assertEqual(service.rating_count, 2)
+        comment.status = CommentStatus.MODERATION
+        comment.save()
+        service.refresh_from_db()
+        self.assertEqual(service.rating, 2)
+        self.assertEqual(service.published_comments_count, 1)
+
+    @patch("core.search_index.apps.is_installed", return_value=True)
+    @patch("core.search_index.update_search_documents_task")
+    def test_comment_approval_updates_search_document(self, task, _):
+        service = factories.ServiceFactory()
+        comment = factories.CommentFactory(subject=service)
+        with self.captureOnCommitCallbacks(execute=True):
+            comment.approve()
+        task.delay.assert_called_once_with("services.Service", [service.pk])
+
+    def test_rebuild_ratings_command(self):
+        service = factories.ServiceFactory()
+        factories.CommentFactory(
+            subject=service, rating=3, status=CommentStatus.PUBLISHED
+        )
+        factories.CommentFactory(subject=service, rating=1)
+        Service.objects.filter(pk=service.pk).update(
+            rating_sum=0, rating_count=0, published_comments_count=0
+        )
+        call_command("rebuild_ratings", stdout=StringIO())
+        service.refresh_from_db()
+        self.assertEqual(service.rating_sum, 3)
+        self.assertEqual(service.rating_count, 1)
+        self.assertEqual(service.published_comments_count, 1)
@@ -0,0 +1,45 @@
+from datetime import timedelta
+
+from django.test import override_settings
+from django.utils import timezone
+
+from notifications.models import ArchivedNotification, Notification
+from notifications.utils import delete_old_notifications
+from tests.factories import NotificationFactory
+from tests.fixtures import TestUserFixtures
+
+
+@override_settings(NOTIFICATION_RETENTION_DAYS=30, NOTIFICATION_RETENTION_BATCH_SIZE=2)
+class NotificationsRetentionTest(TestUserFixtures):
+    """Класс для тестирования удаления старых уведомлений."""
+
+    def setUp(self):
+        super().setUp()
+        Notification.objects.all().delete()
+        old = timezone.now() - timedelta(days=31)
+        self.old_read = NotificationFactory.create_batch(
+            5, receiver=self.user_1, read_at=old
+        )
+        self.old_unread = NotificationFactory(receiver=self.user_1)
+        self.new_read = NotificationFactory(
+            receiver=self.user_1, read_at=timezone.now()
+        )
+        Notification.objects.filter(
+            id__in=[n.id for n in [*self.old_read, self.old_unread]]
+        ).update(created_at=old)
+
+    def test_delete_old_notifications(self):
+        self.assertEqual(delete_old_notifications(), len(self.old_read))
+        self.assertCountEqual(
+            Notification.objects.values_list("id", flat=True),
+            [self.old_unread.id, self.new_read.id],
+        )
+        self.assertFalse(ArchivedNotification.objects.exists())
+
+    @override_settings(NOTIFICATION_RETENTION_ARCHIVE=True)
+    def test_archive_old_notifications(self):
+        self.assertEqual(delete_old_notifications(), len(self.old_read))
+        self.assertCountEqual(
+            ArchivedNotification.objects.values_list("text", flat=True),
+            [notification.text for notification in self.old_read],
+        )
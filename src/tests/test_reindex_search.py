@@ -0,0 +1,85 @@
+from io import StringIO
+from unittest.mock import MagicMock, patch
+
+from django.core.management import call_command
+from elasticsearch_dsl.connections import connections
+
+from services.models import Service
+from tests import factories
+from tests.fixtures import BaseTestCase
+
+
+class ReindexSearchCommandTest(BaseTestCase):
+    """Класс для тестирования команды перестроения индексов поиска."""
+
+    def setUp(self):
+        super().setUp()
+        self.client = MagicMock()
+        self.client.indices.exists_alias.return_value = True
+        self.client.indices.get_alias.return_value = {"services_old": {}}
+        connections.add_connection("default", self.client)
+        self.addCleanup(connections.remove_connection, "default")
+        self.batches = []
+
+    def reindex(self, during_rebuild=None):
+        def parallel_bulk(client, actions, **kwargs):
+            batch = list(actions)
+            self.batches.append(batch)
+            if len(self.batches) == 1 and during_rebuild is not None:
+                during_rebuild()
+            for _ in batch:
+                yield True, {}
+
+        stdout = StringIO()
+        with patch(
+            "core.management.commands.reindex_search.parallel_bulk", parallel_bulk
+        ):
+            call_command("reindex_search", "services", chunk_size=2, stdout=stdout)
+        return stdout.getvalue()
+
+    def test_reindex_switches_alias(self):
+        services = factories.ServiceFactory.create_batch(3)
+        output = self.reindex()
+
+        name = self.client.indices.create.call_args.kwargs["index"]
+        self.assertTrue(name.startswith("services_"))
+        indexed = self.batches[0]
+        self.assertEqual([action["_index"] for action in indexed], [name] * 3)
+        self.assertEqual(
+            {action["_id"] for action in indexed},
+            {service.id for service in services},
+        )
+        self.client.indices.update_aliases.assert_called_once_with(
+            actions=[
+                {"add": {"index": name, "alias": "services"}},
+                {"remove": {"index": "services_old", "alias": "services"}},
+            ]
+        )
+        self.client.indices.delete.assert_called_once_with(index="services_old")
+        self.assertEqual(self.batches[1:], [[]])
+        self.assertIn("3 документов", output)
+        self.assertIn("изменено во время перестроения 0, удалено 0", output)
+
+    def test_changes_during_rebuild_are_applied_after_switch(self):
+        updated, deleted, _ = factories.ServiceFactory.create_batch(3)
+        deleted_pk = deleted.pk
+
+        def during_rebuild():
+            # QuerySet.update() не меняет updated_at.
+            Service.objects.filter(pk=updated.pk).update(rating_sum=5, rating_count=1)
+            deleted.delete()
+            factories.ServiceFactory()
+
+        output = self.reindex(during_rebuild)
+
+        created = Service.objects.latest("id")
+        caught_up = {action["_id"]: action for action in self.batches[1]}
+        self.assertEqual(set(caught_up), {updated.pk, created.pk})
+        self.assertEqual(caught_up[updated.pk]["_index"], "services")
+        self.assertEqual(caught_up[updated.pk]["_source"]["rating"], 5)
+        self.assertEqual(
+            self.batches[2],
+            [{"_op_type": "delete", "_index": "services", "_id": deleted_pk}],
+        )
+        self.assertIn("3 документов", output)
+        self.assertIn("изменено во время перестроения 2, удалено 1", output)
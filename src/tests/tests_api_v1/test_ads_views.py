@@ -3,10 +3,13 @@ from http import HTTPStatus
 from django.contrib.contenttypes.models import ContentType
 
 #  from django.db.models import Avg
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from ads.models import Ad, AdImage
 from core.choices import AdvertisementStatus
+from core.content_types import get_content_type
 from tests.fixtures import TestAdsFixtures
 from users.models import Favorites
 
@@ -199,6 +202,48 @@ class TestAdView(TestAdsFixtures):
         )
         self.assertEqual(response.status_code, HTTPStatus.NO_CONTENT)
 
+    def test_ad_actions_do_not_query_content_types(self):
+        get_content_type("ad")
+        requests = [
+            (
+                self.client_4.post,
+                reverse("ads-add_to_favorites", kwargs={"pk": self.ad_2.id}),
+                {},
+            ),
+            (
+                self.client_4.delete,
+                reverse("ads-delete_from_favorites", kwargs={"pk": self.ad_2.id}),
+                {},
+            ),
+            (
+                self.client_4.post,
+                reverse("ads-add_comment", kwargs={"pk": self.ad_2.id}),
+                {"data": self.comment_data, "format": "json"},
+            ),
+            (
+                self.client_4.get,
+                reverse("comments-list", kwargs={"type": "ad", "obj_id": self.ad_2.id}),
+                {},
+            ),
+        ]
+        for method, url, kwargs in requests:
+            with self.subTest(url=url):
+                with CaptureQueriesContext(connection) as context:
+                    response = method(url, **kwargs)
+                self.assertLess(response.status_code, HTTPStatus.BAD_REQUEST)
+                self.assertTrue(context.captured_queries)
+                self.assertFalse(
+                    [
+                        query
+                        for query in context.captured_queries
+                        if "django_content_type" in query["sql"]
+                    ]
+                )
+
+    def test_unknown_object_type_has_no_content_type(self):
+        with self.assertRaises(LookupError):
+            get_content_type("unknown")
+
     def test_anon_client_cant_delete_an_ad_from_favorite(self):
         response = self.anon_client.delete(
             reverse("ads-delete_from_favorites", kwargs={"pk": self.ad_2.id})
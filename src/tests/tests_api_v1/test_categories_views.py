@@ -3,6 +3,7 @@ from http import HTTPStatus
 from django.urls import reverse
 
 from categories.models import Category
+from tests.factories import CategoryFactory
 from tests.fixtures import TestAdsFixtures
 
 
@@ -52,3 +53,21 @@ class TestCategoriesView(TestAdsFixtures):
                     reverse("common_categories-list") + f"?{k}={v[0]}"
                 )
                 self.assertEqual(len(response.data), len(v[1]))
+
+    def test_categories_tree_is_loaded_with_constant_queries(self):
+        child = CategoryFactory(parent=self.category_1)
+        grandchild = CategoryFactory(parent=child)
+        with self.assertNumQueries(2):
+            response = self.anon_client.get(reverse("common_categories-list"))
+        category = next(
+            item for item in response.json() if item["id"] == self.category_1.id
+        )
+        self.assertEqual(category["subcategories"][0]["id"], child.id)
+        self.assertEqual(
+            category["subcategories"][0]["subcategories"][0]["id"], grandchild.id
+        )
+        with self.assertNumQueries(2):
+            response = self.anon_client.get(
+                reverse("common_categories-detail", kwargs={"pk": child.id})
+            )
+        self.assertEqual(response.json()["subcategories"][0]["id"], grandchild.id)
@@ -0,0 +1,86 @@
+from http import HTTPStatus
+
+from asgiref.sync import async_to_sync
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from chat import presence
+from chat.models import Chat
+from core.choices import AdvertisementStatus
+from core.content_types import get_content_type
+from tests import factories
+from tests.fixtures import TestChatFixtures
+
+
+class TestChatView(TestChatFixtures):
+    def test_get_chats_with_unread_count(self):
+        response = self.client_1.get(reverse("chats-list"))
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        chats = {chat["id"]: chat for chat in response.json()["results"]}
+        self.assertEqual(chats[self.chat_1.id]["unread_count"], 2)
+        self.assertEqual(chats[self.chat_2.id]["unread_count"], 0)
+        self.assertEqual(
+            chats[self.chat_1.id]["last_message"]["id"], self.last_message.id
+        )
+        self.assertEqual(
+            chats[self.chat_1.id]["last_message"]["sender_username"],
+            self.user_2.username,
+        )
+
+    def test_seller_unread_count(self):
+        response = self.client_2.get(reverse("chats-list"))
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(response.json()["results"][0]["unread_count"], 1)
+
+    def test_mark_as_read(self):
+        self.assertEqual(self.chat_1.mark_as_read(self.user_1.id), self.last_message.id)
+        response = self.client_1.get(reverse("chats-list"))
+        chats = {chat["id"]: chat for chat in response.json()["results"]}
+        self.assertEqual(chats[self.chat_1.id]["unread_count"], 0)
+        response = self.client_2.get(reverse("chats-list"))
+        self.assertEqual(response.json()["results"][0]["unread_count"], 1)
+
+    def test_chats_ordered_by_last_message(self):
+        response = self.client_1.get(reverse("chats-list") + "?cursor=&limit=1")
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(response.json()["results"][0]["id"], self.chat_2.id)
+        response = self.client_1.get(response.json()["next"])
+        self.assertEqual(response.json()["results"][0]["id"], self.chat_1.id)
+
+    def test_get_chats_queries_do_not_depend_on_chats_count(self):
+        with CaptureQueriesContext(connection) as context:
+            self.client_1.get(reverse("chats-list"))
+        queries = len(context.captured_queries)
+        for _ in range(3):
+            ad = factories.AdFactory(
+                provider=self.user_2, status=AdvertisementStatus.PUBLISHED
+            )
+            Chat.objects.create(
+                room_group_name=f"chat_ad_{ad.id}_{self.user_1.id}",
+                content_type=get_content_type(ad),
+                object_id=ad.id,
+                seller=self.user_2,
+                buyer=self.user_1,
+            )
+        with CaptureQueriesContext(connection) as context:
+            response = self.client_1.get(reverse("chats-list"))
+        self.assertEqual(len(response.json()["results"]), 5)
+        self.assertEqual(len(context.captured_queries), queries)
+
+    def test_get_chats_with_presence(self):
+        async_to_sync(presence.connect)(self.user_2.id)
+        response = self.client_1.get(reverse("chats-list"))
+        chats = {chat["id"]: chat for chat in response.json()["results"]}
+        self.assertEqual(
+            chats[self.chat_1.id]["presence"], {"online": True, "last_seen": None}
+        )
+        async_to_sync(presence.disconnect)(self.user_2.id)
+        response = self.client_1.get(reverse("chats-list"))
+        chats = {chat["id"]: chat for chat in response.json()["results"]}
+        self.assertFalse(chats[self.chat_1.id]["presence"]["online"])
+        self.assertIsNotNone(chats[self.chat_1.id]["presence"]["last_seen"])
+
+    def test_anon_client_can_not_get_chats(self):
+        response = self.anon_client.get(reverse("chats-list"))
+        self.assertEqual(response.status_code, HTTPStatus.UNAUTHORIZED)
@@ -1,12 +1,18 @@
+from datetime import timedelta
 from itertools import chain
 from http import HTTPStatus
 
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from django.utils import timezone
 
 from ads.models import Ad
-from core.choices import AdvertisementStatus
+from core.choices import AdvertisementStatus, CommentStatus
 from services.models import Service
+from tests import factories
 from tests.fixtures import TestAdvertisementsFixtures
+from users.models import Favorites
 
 
 class TestAdvertisementsView(TestAdvertisementsFixtures):
@@ -71,6 +77,113 @@ class TestAdvertisementsView(TestAdvertisementsFixtures):
             ),
         )
 
+    def test_advertisements_list_is_sorted_by_creation_date(self):
+        response = self.anon_client.get(reverse("advertisements"))
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        created = [entry["created_at"] for entry in response.json()["results"]]
+        self.assertEqual(created, sorted(created, reverse=True))
+
+    def test_advertisements_list_pagination(self):
+        published = (
+            Service.objects.filter(status=AdvertisementStatus.PUBLISHED).count()
+            + Ad.objects.filter(status=AdvertisementStatus.PUBLISHED).count()
+        )
+        response = self.anon_client.get(reverse("advertisements") + "?limit=1")
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(response.json()["count"], published)
+        self.assertEqual(len(response.json()["results"]), 1)
+
+    def test_advertisements_list_cursor_pagination(self):
+        published = (
+            Service.objects.filter(status=AdvertisementStatus.PUBLISHED).count()
+            + Ad.objects.filter(status=AdvertisementStatus.PUBLISHED).count()
+        )
+        url = reverse("advertisements") + "?limit=1&cursor="
+        results = []
+        while url:
+            response = self.anon_client.get(url)
+            self.assertEqual(response.status_code, HTTPStatus.OK)
+            self.assertNotIn("count", response.json())
+            results += response.json()["results"]
+            url = response.json()["next"]
+        self.assertEqual(len(results), published)
+        self.assertEqual(
+            [entry["created_at"] for entry in results],
+            sorted([entry["created_at"] for entry in results], reverse=True),
+        )
+        previous = self.anon_client.get(response.json()["previous"])
+        self.assertEqual(previous.json()["results"], results[-2:-1])
+
+    def test_cursor_pagination_with_ties_across_types(self):
+        created_at = timezone.now() + timedelta(days=1)
+        for factory in (factories.AdFactory, factories.ServiceFactory):
+            obj = factory(id=10_000, status=AdvertisementStatus.PUBLISHED)
+            type(obj).objects.filter(pk=obj.pk).update(created_at=created_at)
+        url = reverse("advertisements") + "?limit=1&cursor="
+        entries = []
+        for _ in range(2):
+            response = self.anon_client.get(url)
+            entries += [
+                (entry["type"], entry["id"]) for entry in response.json()["results"]
+            ]
+            url = response.json()["next"]
+        self.assertEqual(entries, [("ad", 10_000), ("service", 10_000)])
+
+    def test_advertisements_list_with_invalid_cursor(self):
+        response = self.anon_client.get(reverse("advertisements") + "?cursor=abc")
+        self.assertEqual(response.status_code, HTTPStatus.NOT_FOUND)
+
+    def test_advertisements_list_query_count_does_not_depend_on_page_size(self):
+        for factory in [factories.AdFactory, factories.ServiceFactory] * 3:
+            obj = factory(status=AdvertisementStatus.PUBLISHED.value)
+            obj.category.set([self.category_1])
+            factories.CommentFactory(subject=obj, status=CommentStatus.PUBLISHED)
+            Favorites.objects.create(user=self.user_1, subject=obj)
+        with CaptureQueriesContext(connection) as small_page:
+            self.client_1.get(reverse("advertisements") + "?limit=2")
+        with CaptureQueriesContext(connection) as large_page:
+            response = self.client_1.get(reverse("advertisements") + "?limit=50")
+        self.assertEqual(len(small_page), len(large_page))
+        favorited = [entry["is_favorited"] for entry in response.json()["results"]]
+        self.assertEqual(favorited.count(True), 6)
+        self.assertEqual(response.json()["results"][0]["comments_quantity"], 1)
+
+    def test_advertisements_list_is_cached_until_data_changes(self):
+        url = reverse("advertisements")
+        count = len(self.anon_client.get(url).json()["results"])
+        with self.assertNumQueries(0):
+            self.anon_client.get(url)
+        ad = factories.AdFactory(status=AdvertisementStatus.PUBLISHED.value)
+        response = self.anon_client.get(url)
+        self.assertEqual(len(response.json()["results"]), count + 1)
+        self.assertEqual(response.json()["results"][0]["id"], ad.id)
+
+    def test_advertisements_list_cache_depends_on_user_favorites(self):
+        url = reverse("advertisements")
+        response = self.client_1.get(url)
+        self.assertFalse(response.json()["results"][0]["is_favorited"])
+        Favorites.objects.create(user=self.user_1, subject=self.ad_1)
+        response = self.client_1.get(url)
+        self.assertTrue(response.json()["results"][0]["is_favorited"])
+        response = self.client_4.get(url)
+        self.assertFalse(response.json()["results"][0]["is_favorited"])
+
+    def test_advertisements_list_filtered_by_parent_category_without_join(self):
+        child = factories.CategoryFactory(parent=self.category_1)
+        ad = factories.AdFactory(status=AdvertisementStatus.PUBLISHED.value)
+        ad.category.add(*child.ancestor_ids)
+        with CaptureQueriesContext(connection) as context:
+            response = self.anon_client.get(
+                reverse("advertisements") + f"?category_id={self.category_1.id}"
+            )
+        ids = [(entry["type"], entry["id"]) for entry in response.json()["results"]]
+        self.assertIn(("ad", ad.id), ids)
+        self.assertEqual(len(ids), len(set(ids)))
+        for query in context.captured_queries:
+            if "UNION" in query["sql"]:
+                self.assertNotIn("ads_ad_category", query["sql"])
+                self.assertNotIn("services_service_category", query["sql"])
+
     def test_get_advertisements_with_unexisting_category_id_parametr(self):
         response = self.client_1.get(reverse("advertisements") + "?category_id=1000000")
         self.assertEqual(response.status_code, HTTPStatus.NOT_FOUND)
@@ -1,5 +1,7 @@
 from http import HTTPStatus
 
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from notifications.models import Notification
@@ -15,6 +17,15 @@ class TestNotificationView(TestNotificationsFixtures):
             len(Notification.objects.filter(receiver=self.user_1)),
         )
 
+    def test_get_notifications_by_cursor(self):
+        response = self.client_1.get(reverse("notifications-list") + "?cursor=&limit=1")
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(len(response.json()["results"]), 1)
+        self.assertIsNone(response.json()["previous"])
+        response = self.client_1.get(response.json()["next"])
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(len(response.json()["results"]), 1)
+
     def test_anon_client_can_not_get_notifications(self):
         response = self.anon_client.get(reverse("notifications-list"))
         self.assertEqual(response.status_code, HTTPStatus.UNAUTHORIZED)
@@ -37,3 +48,35 @@ class TestNotificationView(TestNotificationsFixtures):
             reverse("notifications-mark_as_read", kwargs={"pk": self.notif_2.id})
         )
         self.assertEqual(response.status_code, HTTPStatus.NOT_FOUND)
+
+    def test_unread_count(self):
+        unread = Notification.objects.filter(
+            receiver=self.user_1, read_at__isnull=True
+        ).count()
+        response = self.client_1.get(reverse("notifications-unread_count"))
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(response.json(), {"count": unread})
+
+    def test_mark_all_as_read(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client_1.post(reverse("notifications-mark_all_as_read"))
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(response.json(), {"count": 0})
+        self.assertEqual(
+            [query["sql"].split()[0] for query in context.captured_queries],
+            ["UPDATE"],
+        )
+        self.assertFalse(
+            Notification.objects.filter(
+                receiver=self.user_1, read_at__isnull=True
+            ).exists()
+        )
+
+    def test_mark_as_read_up_to(self):
+        response = self.client_1.post(
+            reverse("notifications-mark_all_as_read"), {"up_to": self.notif_1.id}
+        )
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(response.json(), {"count": 1})
+        self.assertTrue(Notification.objects.get(id=self.notif_1.id).read)
+        self.assertFalse(Notification.objects.get(id=self.notif_2.id).read)
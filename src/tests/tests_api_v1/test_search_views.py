@@ -0,0 +1,177 @@
+from decimal import Decimal
+from http import HTTPStatus
+from unittest.mock import patch
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from elasticsearch_dsl import Search
+from elasticsearch_dsl.response import Response
+
+from ads.documents import AdDocument
+from ads.models import Ad
+from core.choices import AdvertisementStatus
+from core.content_types import get_content_type
+from services.documents import ServiceDocument
+from services.models import Service
+from tests.fixtures import TestUserFixtures
+from users.models import Favorites
+
+SEARCH_URL = "/api/v1/search"
+AGGREGATIONS = {
+    "category": [{"key": 1, "doc_count": 3}, {"key": 2, "doc_count": 1}],
+    "price": [{"key": 0.0, "doc_count": 2}],
+    "condition": [{"key": "Новый", "doc_count": 2}],
+}
+
+
+def make_hit(index, id, score):
+    source = {
+        "id": id,
+        "title": f"{index}_{id}",
+        "description": "description",
+        "address": "address",
+        "provider": {"id": 1, "email": "user@mail.ru"},
+    }
+    return {
+        "_index": index,
+        "_id": str(id),
+        "_score": score,
+        "_source": source,
+        "sort": [score, index, id],
+    }
+
+
+class TestSearchView(TestUserFixtures):
+    def search(self, url, hits, total, client=None):
+        def execute(search):
+            data = {"hits": {"total": {"value": total, "relation": "eq"}, "hits": hits}}
+            if search.aggs:
+                data["aggregations"] = {
+                    name: {"buckets": AGGREGATIONS.get(name, [])}
+                    for name in search.aggs
+                }
+            return Response(search, data)
+
+        with patch.object(Search, "execute", autospec=True) as mock:
+            mock.side_effect = execute
+            response = (client or self.anon_client).get(url)
+        self.assertEqual(mock.call_count, 1)
+        return response, mock.call_args.args[0].to_dict()
+
+    def test_search_merges_indices_by_score(self):
+        hits = [
+            make_hit("services", 1, 3.0),
+            make_hit("ads", 1, 2.0),
+            make_hit("ads", 2, 1.0),
+        ]
+        response, body = self.search(f"{SEARCH_URL}?search=text&limit=2", hits, 3)
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        data = response.json()
+        self.assertEqual(data["count"], 3)
+        self.assertEqual(
+            [(item["type"], item["id"]) for item in data["results"]],
+            [("service", 1), ("ad", 1)],
+        )
+        self.assertEqual(body["size"], 3)
+        self.assertEqual(
+            body["sort"],
+            [
+                "_score",
+                "_index",
+                {"id": {"order": "desc"}},
+            ],
+        )
+
+        _, body = self.search(data["next"], hits[2:], 3)
+        self.assertEqual(body["search_after"], [2.0, "ads", 1])
+
+    def test_last_page_has_no_next(self):
+        response, body = self.search(SEARCH_URL, [make_hit("ads", 1, 1.0)], 1)
+        self.assertIsNone(response.json()["next"])
+        self.assertNotIn("search_after", body)
+
+    def test_favorites_are_loaded_in_one_query(self):
+        Favorites.objects.bulk_create(
+            [
+                Favorites(
+                    user=self.user_1, content_type=get_content_type(Ad), object_id=2
+                ),
+                Favorites(
+                    user=self.user_1,
+                    content_type=get_content_type(Service),
+                    object_id=1,
+                ),
+            ]
+        )
+        hits = [
+            make_hit("services", 1, 3.0),
+            make_hit("ads", 1, 2.0),
+            make_hit("ads", 2, 1.0),
+        ]
+        with CaptureQueriesContext(connection) as context:
+            response, _ = self.search(SEARCH_URL, hits, 3, self.client_1)
+        self.assertEqual(
+            [item["is_favorited"] for item in response.json()["results"]],
+            [True, False, True],
+        )
+        favorites_queries = [
+            query
+            for query in context.captured_queries
+            if Favorites._meta.db_table in query["sql"]
+        ]
+        self.assertEqual(len(favorites_queries), 1)
+
+    def test_query_uses_analyzed_subfields(self):
+        _, body = self.search(f"{SEARCH_URL}?search=стриж", [], 0)
+        query = str(body["query"])
+        self.assertNotIn("wildcard", query)
+        self.assertIn("title.autocomplete^2", query)
+        self.assertIn("description.ngram", query)
+
+    def test_documents_have_russian_analyzers(self):
+        for document in (AdDocument, ServiceDocument):
+            with self.subTest(document=document.__name__):
+                index = document._index.to_dict()
+                self.assertIn("russian_morphology", str(index["settings"]))
+                title = index["mappings"]["properties"]["title"]
+                self.assertEqual(title["analyzer"], "russian_morphology")
+                self.assertEqual(set(title["fields"]), {"autocomplete", "ngram"})
+
+    def test_published_filters_and_facets(self):
+        response, body = self.search(
+            f"{SEARCH_URL}?category_id=1&price_min=10&condition=Новый", [], 0
+        )
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(
+            body["query"]["bool"]["filter"],
+            [
+                {"term": {"status": AdvertisementStatus.PUBLISHED}},
+                {"term": {"category": 1}},
+                {"range": {"price": {"gte": Decimal(10)}}},
+                {"term": {"condition": "Новый"}},
+            ],
+        )
+        self.assertEqual(
+            response.json()["facets"],
+            {
+                "category": [{"id": 1, "count": 3}, {"id": 2, "count": 1}],
+                "price": [{"from": 0.0, "count": 2}],
+                "condition": [{"value": "Новый", "count": 2}],
+                "place_of_provision": [],
+            },
+        )
+
+    def test_next_page_has_no_facets(self):
+        hits = [make_hit("ads", 2, 1.0), make_hit("ads", 1, 1.0)]
+        response, _ = self.search(f"{SEARCH_URL}?limit=1", hits, 2)
+        response, body = self.search(response.json()["next"], hits[1:], 2)
+        self.assertNotIn("facets", response.json())
+        self.assertNotIn("aggs", body)
+
+    def test_invalid_filter(self):
+        response = self.anon_client.get(f"{SEARCH_URL}?condition=wrong")
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+
+    def test_invalid_cursor(self):
+        response = self.anon_client.get(f"{SEARCH_URL}?cursor=wrong")
+        self.assertEqual(response.status_code, HTTPStatus.NOT_FOUND)
@@ -9,6 +9,7 @@ from django.db import models
 from phonenumber_field.modelfields import PhoneNumberField
 
 from core.choices import Role
+from core.content_types import get_content_type
 from core.db_utils import get_path_to_save_image, validate_image
 from core.enums import Limits
 from services.tasks import delete_images_dir_task
@@ -155,6 +156,73 @@ class Favorites(models.Model):
         """
         return f"Избранное {self.user}"
 
+    @staticmethod
+    def get_favorited_keys(
+        user: CustomUser, objects: list[models.Model]
+    ) -> set[tuple[int, int]]:
+        """Получить объекты, находящиеся в избранном пользователя.
+
+        Для всей страницы объектов выполняется один запрос к БД.
+
+        Args:
+            user (CustomUser): пользователь
+            objects (list[Model]): услуги и объявления
+
+        Returns:
+            set[tuple[int, int]]: пары (идентификатор типа объекта, ID объекта)
+
+        """
+        if not objects:
+            return set()
+        return Favorites.get_favorited_ids(user, Favorites._group_by_model(objects))
+
+    @staticmethod
+    def get_favorited_ids(
+        user: CustomUser, ids: dict[type[models.Model], list[int]]
+    ) -> set[tuple[int, int]]:
+        """Получить объекты по ID, находящиеся в избранном пользователя.
+
+        Используется, когда экземпляры моделей не загружаются из БД,
+        например для результатов поиска. Выполняется один запрос к БД.
+
+        Args:
+            user (CustomUser): пользователь
+            ids (dict[type[Model], list[int]]): ID объектов по модели
+
+        Returns:
+            set[tuple[int, int]]: пары (идентификатор типа объекта, ID объекта)
+
+        """
+        if not ids or not user.is_authenticated:
+            return set()
+        condition = models.Q()
+        for model, object_ids in ids.items():
+            condition |= models.Q(
+                content_type=get_content_type(model),
+                object_id__in=object_ids,
+            )
+        return set(
+            Favorites.objects.filter(condition, user=user).values_list(
+                "content_type_id", "object_id"
+            )
+        )
+
+    @staticmethod
+    def _group_by_model(objects: list[models.Model]) -> dict[type, list[int]]:
+        """Сгруппировать идентификаторы объектов по модели.
+
+        Args:
+            objects (list[Model]): экземпляры моделей
+
+        Returns:
+            dict[type, list[int]]: идентификаторы объектов по модели
+
+        """
+        grouped: dict[type, list[int]] = {}
+        for obj in objects:
+            grouped.setdefault(obj.__class__, []).append(obj.id)
+        return grouped
+
     @staticmethod
     def clear_favorites(instance: models.Model) -> None:
         """Удалить объкт из избранного.
@@ -164,7 +232,7 @@ class Favorites(models.Model):
 
         """
         Favorites.objects.filter(
-            content_type=ContentType.objects.get_for_model(instance).id,
+            content_type=get_content_type(instance),
             object_id=instance.id,
         ).delete()
 
@@ -3,13 +3,14 @@ from uuid import uuid4
 from django.contrib.auth import get_user_model
 from django.contrib.sites.shortcuts import get_current_site
 from django.db.models import Model
-from django.db.models.signals import post_save, pre_save
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 from django_rest_passwordreset.signals import reset_password_token_created
 
+from core.cache import USERS, get_favorites_namespace, invalidate
 from core.choices import Notifications
 from notifications.models import Notification
-from users.models import CustomUser, VerificationToken
+from users.models import CustomUser, Favorites, VerificationToken
 from users.tasks import (
     send_password_changed_email_task,
     send_password_reset_token_task,
@@ -95,3 +96,27 @@ def on_password_change(
                 username=previous_data.username,
                 mail_to=previous_data.email,
             )
+
+
+@receiver(post_save, sender=User)
+def invalidate_users_cache(
+    sender: Model,  # noqa: ARG001
+    instance: CustomUser,  # noqa: ARG001
+    update_fields: frozenset | None,
+    **kwargs: dict,  # noqa: ARG001
+) -> None:
+    """Сбросить закэшированные ответы, содержащие данные пользователей.
+
+    Обновление только времени последнего входа на ответы не влияет.
+    """
+    if update_fields is None or set(update_fields) != {"last_login"}:
+        invalidate(USERS)
+
+
+@receiver(post_save, sender=Favorites)
+@receiver(post_delete, sender=Favorites)
+def invalidate_favorites_cache(
+    sender: Model, instance: Favorites, **kwargs: dict  # noqa: ARG001
+) -> None:
+    """Сбросить закэшированные ответы, зависящие от избранного пользователя."""
+    invalidate(get_favorites_namespace(instance.user_id))